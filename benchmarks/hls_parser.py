@@ -0,0 +1,126 @@
+"""
+Checks and times `streamget.hls.parse_master_playlist` against the parsers it replaced.
+
+Usage:
+    python benchmarks/hls_parser.py [--number 5000] [--variants 8]
+
+The legacy functions below are the line/regex parsers previously inlined in
+`BaseLiveStream.get_play_url_list` and `TwitchLiveStream.get_play_url_list`, minus the
+network request. The script first checks that the new parser returns the same URLs in
+the same order for a Twitch style master playlist, then times each of them.
+"""
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Run from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from streamget.hls import parse_master_playlist
+
+BASE_URL = "https://video-weaver.example.hls.ttvnw.net/v1/playlist/master.m3u8"
+
+
+def make_playlist(variants: int) -> str:
+    lines = ["#EXTM3U", '#EXT-X-TWITCH-INFO:NODE="video-edge",MANIFEST-NODE-TYPE="weaver_cluster"']
+    for i in range(variants):
+        height = 1080 - i * 120
+        group = "chunked" if i == 0 else f"{height}p30"
+        lines.append(f'#EXT-X-MEDIA:TYPE=VIDEO,GROUP-ID="{group}",NAME="{height}p",AUTOSELECT=YES,DEFAULT=YES')
+        lines.append(f'#EXT-X-STREAM-INF:BANDWIDTH={8000000 - i * 700000},RESOLUTION={height * 16 // 9}x{height},'
+                     f'CODECS="avc1.64002A,mp4a.40.2",VIDEO="{group}",FRAME-RATE=30.000')
+        lines.append(f"https://video-weaver.example.hls.ttvnw.net/v1/playlist/{group}-{i}.m3u8?token=abc")
+    lines.append('#EXT-X-MEDIA:TYPE=VIDEO,GROUP-ID="audio_only",NAME="audio_only",AUTOSELECT=NO,DEFAULT=NO')
+    lines.append('#EXT-X-STREAM-INF:BANDWIDTH=160000,CODECS="mp4a.40.2",VIDEO="audio_only"')
+    lines.append("https://video-weaver.example.hls.ttvnw.net/v1/playlist/audio-only.m3u8?token=abc")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_base(resp: str) -> list[str]:
+    play_url_list = []
+    for i in resp.split('\n'):
+        if i.startswith('https://'):
+            play_url_list.append(i.strip())
+    if not play_url_list:
+        for i in resp.split('\n'):
+            if i.strip().endswith('m3u8'):
+                play_url_list.append(i.strip())
+    bandwidth_pattern = re.compile(r'BANDWIDTH=(\d+)')
+    bandwidth_list = bandwidth_pattern.findall(resp)
+    url_to_bandwidth = {url: int(bandwidth) for bandwidth, url in zip(bandwidth_list, play_url_list)}
+    return sorted(play_url_list, key=lambda url: url_to_bandwidth[url], reverse=True)
+
+
+def legacy_twitch(resp: str) -> list[dict]:
+    play_url_list = []
+    current_stream_info = {}
+    current_group_id = None
+    current_name = None
+    for line in resp.split('\n'):
+        line = line.strip()
+        if line.startswith('#EXT-X-MEDIA:'):
+            group_id_match = re.search(r'GROUP-ID="([^"]+)"', line)
+            name_match = re.search(r'NAME="([^"]+)"', line)
+            if group_id_match:
+                current_group_id = group_id_match.group(1)
+            if name_match:
+                current_name = name_match.group(1)
+        elif line.startswith('#EXT-X-STREAM-INF:'):
+            bandwidth_match = re.search(r'BANDWIDTH=(\d+)', line)
+            resolution_match = re.search(r'RESOLUTION=(\d+x\d+)', line)
+            current_stream_info['bandwidth'] = int(bandwidth_match.group(1)) if bandwidth_match else 0
+            current_stream_info['resolution'] = resolution_match.group(1) if resolution_match else None
+        elif line.startswith('https://') and current_stream_info:
+            play_url_list.append({
+                'url': line,
+                'bandwidth': current_stream_info.get('bandwidth', 0),
+                'resolution': current_stream_info.get('resolution'),
+                'group_id': current_group_id or 'unknown',
+                'name': current_name or 'unknown',
+                'is_audio_only': current_group_id == 'audio_only'
+            })
+            current_stream_info = {}
+            current_group_id = None
+            current_name = None
+    play_url_list.sort(key=lambda x: x['bandwidth'], reverse=True)
+    return play_url_list
+
+
+def check(playlist: str) -> None:
+    parsed = parse_master_playlist(playlist, BASE_URL)
+    urls = [v.uri for v in parsed.sorted_variants()]
+    assert urls == legacy_base(playlist), "base parser mismatch"
+    assert urls == [s['url'] for s in legacy_twitch(playlist)], "twitch parser mismatch"
+    resolutions = [s['resolution'] for s in legacy_twitch(playlist)]
+    assert [v.resolution for v in parsed.sorted_variants()] == resolutions
+
+    relative = playlist.replace("https://video-weaver.example.hls.ttvnw.net/v1/playlist/", "")
+    assert [v.uri for v in parse_master_playlist(relative, BASE_URL).sorted_variants()] == urls
+    print("output identical to the legacy parsers")
+
+
+def bench(name: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<28} {seconds * 1e6:10.1f} us/op")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HLS master playlist parsing.")
+    parser.add_argument("--number", type=int, default=5000, help="iterations per parser")
+    parser.add_argument("--variants", type=int, default=8, help="video variants in the playlist")
+    args = parser.parse_args()
+
+    playlist = make_playlist(args.variants)
+    check(playlist)
+    new = bench("parse_master_playlist", lambda: parse_master_playlist(playlist, BASE_URL).sorted_variants(),
+                args.number)
+    base = bench("legacy base parser", lambda: legacy_base(playlist), args.number)
+    twitch = bench("legacy twitch parser", lambda: legacy_twitch(playlist), args.number)
+    print(f"vs base: {base / new:.2f}x, vs twitch: {twitch / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
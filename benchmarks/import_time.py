@@ -0,0 +1,56 @@
+"""
+Measures the cold-start cost of `import streamget` in fresh interpreters.
+
+Usage:
+    python benchmarks/import_time.py [--runs 20] [--max-ms 50]
+
+Exits with status 1 when the median exceeds `--max-ms`, so it can guard against
+regressions that make platform modules load eagerly again.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CASES = {
+    "import streamget": "import streamget",
+    "one platform": "import streamget; streamget.DouyinLiveStream",
+    "all platforms": "import streamget; [getattr(streamget, name) for name in streamget.__all__]",
+}
+
+TIMER = "import time; t = time.perf_counter(); {code}; print((time.perf_counter() - t) * 1000)"
+
+
+def measure(code: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark `import streamget` cold start.")
+    parser.add_argument("--runs", type=int, default=20, help="fresh interpreters per case")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if `import streamget` median exceeds this")
+    args = parser.parse_args()
+
+    medians = {}
+    for name, code in CASES.items():
+        timings = measure(code, args.runs)
+        medians[name] = statistics.median(timings)
+        print(f"{name:<18} median {medians[name]:8.2f} ms   min {min(timings):8.2f} ms")
+
+    if args.max_ms is not None and medians["import streamget"] > args.max_ms:
+        print(f"import streamget took {medians['import streamget']:.2f} ms, limit is {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Checks and times Look weapi request encryption.
+
+Usage:
+    python benchmarks/look_weapi.py [--number 5000]
+
+The legacy function below is the previous `LookLiveStream._get_looklive_secret_data`,
+which drew a fresh secret key and RSA-encrypted it on every call. The script decrypts the
+output of the pooled implementation to check that it carries the same payload and a valid
+encSecKey, then times both.
+"""
+import argparse
+import base64
+import binascii
+import json
+import secrets
+import sys
+import timeit
+from pathlib import Path
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+
+# Run from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from streamget.platforms.look import live_stream
+from streamget.platforms.look.live_stream import LookLiveStream
+
+PAYLOAD = {"liveRoomNo": "12345678"}
+IV = b'0102030405060708'
+NONCE = b'0CoJUm6Qyw8W8jud'
+MODULUS = '00e0b509f6259df8642dbc35662901477df22677ec152b5ff68ace615bb7b725152b3ab17a876aea8a5aa76d2e417629ec' \
+          '4ee341f56135fccf695280104e0312ecbda92557c93870114af6c9d05c4f7f0c3685b7a46bee255932575cce10b424d813' \
+          'cfe4875d3e82047b97ddef52741d546b8e289dc6935b3ece0462db0a22b8e7'
+
+
+def legacy(text) -> tuple:
+    public_key = '010001'
+
+    def create_secret_key(size: int) -> bytes:
+        charset = '1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$%^&*()_+-=[]{}|;:,.<>?'
+        return ''.join(secrets.choice(charset) for _ in range(size)).encode('utf-8')
+
+    def aes_encrypt(_text: str | bytes, _sec_key: str | bytes) -> bytes:
+        if isinstance(_text, str):
+            _text = _text.encode('utf-8')
+        if isinstance(_sec_key, str):
+            _sec_key = _sec_key.encode('utf-8')
+        encryptor = AES.new(_sec_key[:16], AES.MODE_CBC, IV)
+        return base64.b64encode(encryptor.encrypt(pad(_text, AES.block_size)))
+
+    def rsa_encrypt(_text: bytes, pub_key: str, mod: str) -> str:
+        text_int = int(binascii.hexlify(_text[::-1]), 16)
+        return format(pow(text_int, int(pub_key, 16), int(mod, 16)), 'x').zfill(256)
+
+    sec_key = create_secret_key(16)
+    enc_text = aes_encrypt(aes_encrypt(json.dumps(text), NONCE), sec_key)
+    return enc_text.decode(), rsa_encrypt(sec_key, public_key, MODULUS)
+
+
+def aes_decrypt(data: bytes, key: bytes) -> bytes:
+    return unpad(AES.new(key, AES.MODE_CBC, IV).decrypt(base64.b64decode(data)), AES.block_size)
+
+
+def check() -> None:
+    keys = {enc_sec_key: sec_key for sec_key, enc_sec_key in live_stream._weapi_key_pool()}
+    for _ in range(50):
+        params, enc_sec_key = LookLiveStream._get_looklive_secret_data(PAYLOAD)
+        sec_key = keys[enc_sec_key]
+        assert enc_sec_key == legacy_rsa(sec_key), "encSecKey mismatch"
+        inner = aes_decrypt(params.encode(), sec_key)
+        assert json.loads(aes_decrypt(inner, NONCE)) == PAYLOAD, "params mismatch"
+    print("output decrypts to the same payload, encSecKey matches the legacy RSA")
+
+
+def legacy_rsa(sec_key: bytes) -> str:
+    return format(pow(int(binascii.hexlify(sec_key[::-1]), 16), 0x10001, int(MODULUS, 16)), 'x').zfill(256)
+
+
+def bench(name: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<28} {seconds * 1e6:10.1f} us/op")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Look weapi encryption.")
+    parser.add_argument("--number", type=int, default=5000, help="iterations per implementation")
+    args = parser.parse_args()
+
+    check()
+    new = bench("pooled key", lambda: LookLiveStream._get_looklive_secret_data(PAYLOAD), args.number)
+    old = bench("legacy", lambda: legacy(PAYLOAD), args.number)
+    print(f"speedup: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import importlib
 import os
 import sys
 from pathlib import Path
@@ -13,57 +14,64 @@ node_execute_dir = Path(execute_dir) / 'node'
 current_env_path = os.environ.get('PATH')
 os.environ['PATH'] = str(node_execute_dir) + os.pathsep + current_env_path
 
-from .data import StreamData
-from .platforms.acfun.live_stream import AcfunLiveStream
-from .platforms.baidu.live_stream import BaiduLiveStream
-from .platforms.bigo.live_stream import BigoLiveStream
-from .platforms.bilibili.live_stream import BilibiliLiveStream
-from .platforms.blued.live_stream import BluedLiveStream
-from .platforms.changliao.live_stream import ChangliaoLiveStream
-from .platforms.chzzk.live_stream import ChzzkLiveStream
-from .platforms.douyin.live_stream import DouyinLiveStream
-from .platforms.douyu.live_stream import DouyuLiveStream
-from .platforms.faceit.live_stream import FaceitLiveStream
-from .platforms.flextv.live_stream import FlexTVLiveStream
-from .platforms.haixiu.live_stream import HaixiuLiveStream
-from .platforms.huajiao.live_stream import HuajiaoLiveStream
-from .platforms.huamao.live_stream import HuamaoLiveStream
-from .platforms.huya.live_stream import HuyaLiveStream
-from .platforms.inke.live_stream import InkeLiveStream
-from .platforms.jd.live_stream import JDLiveStream
-from .platforms.kuaishou.live_stream import KwaiLiveStream
-from .platforms.kugou.live_stream import KugouLiveStream
-from .platforms.laixiu.live_stream import LaixiuLiveStream
-from .platforms.langlive.live_stream import LangLiveStream
-from .platforms.lehai.live_stream import LehaiLiveStream
-from .platforms.lianjie.live_stream import LianJieLiveStream
-from .platforms.liveme.live_stream import LiveMeLiveStream
-from .platforms.look.live_stream import LookLiveStream
-from .platforms.maoer.live_stream import MaoerLiveStream
-from .platforms.migu.live_stream import MiguLiveStream
-from .platforms.netease.live_stream import NeteaseLiveStream
-from .platforms.pandatv.live_stream import PandaLiveStream
-from .platforms.piaopiao.live_stream import PiaopaioLiveStream
-from .platforms.picarto.live_stream import PicartoLiveStream
-from .platforms.popkontv.live_stream import PopkonTVLiveStream
-from .platforms.qiandurebo.live_stream import QiandureboLiveStream
-from .platforms.rednote.live_stream import RedNoteLiveStream
-from .platforms.shopee.live_stream import ShopeeLiveStream
-from .platforms.showroom.live_stream import ShowRoomLiveStream
-from .platforms.sixroom.live_stream import SixRoomLiveStream
-from .platforms.soop.live_stream import SoopLiveStream
-from .platforms.taobao.live_stream import TaobaoLiveStream
-from .platforms.tiktok.live_stream import TikTokLiveStream
-from .platforms.twitcasting.live_stream import TwitCastingLiveStream
-from .platforms.twitch.live_stream import TwitchLiveStream
-from .platforms.vvxq.live_stream import VVXQLiveStream
-from .platforms.weibo.live_stream import WeiboLiveStream
-from .platforms.winktv.live_stream import WinkTVLiveStream
-from .platforms.yinbo.live_stream import YinboLiveStream
-from .platforms.yiqilive.live_stream import YiqiLiveStream
-from .platforms.youtube.live_stream import YoutubeLiveStream
-from .platforms.yy.live_stream import YYLiveStream
-from .platforms.zhihu.live_stream import ZhihuLiveStream
+# Public names and the modules that define them. Platform modules pull in httpx, execjs and
+# friends, so they are only imported on first attribute access.
+_LAZY_IMPORTS = {
+    "AcfunLiveStream": ".platforms.acfun.live_stream",
+    "BaiduLiveStream": ".platforms.baidu.live_stream",
+    "BigoLiveStream": ".platforms.bigo.live_stream",
+    "BilibiliLiveStream": ".platforms.bilibili.live_stream",
+    "BluedLiveStream": ".platforms.blued.live_stream",
+    "ChangliaoLiveStream": ".platforms.changliao.live_stream",
+    "ChzzkLiveStream": ".platforms.chzzk.live_stream",
+    "DouyinLiveStream": ".platforms.douyin.live_stream",
+    "DouyuLiveStream": ".platforms.douyu.live_stream",
+    "FaceitLiveStream": ".platforms.faceit.live_stream",
+    "FlexTVLiveStream": ".platforms.flextv.live_stream",
+    "HaixiuLiveStream": ".platforms.haixiu.live_stream",
+    "HuajiaoLiveStream": ".platforms.huajiao.live_stream",
+    "HuamaoLiveStream": ".platforms.huamao.live_stream",
+    "HuyaLiveStream": ".platforms.huya.live_stream",
+    "InkeLiveStream": ".platforms.inke.live_stream",
+    "JDLiveStream": ".platforms.jd.live_stream",
+    "KugouLiveStream": ".platforms.kugou.live_stream",
+    "KwaiLiveStream": ".platforms.kuaishou.live_stream",
+    "LaixiuLiveStream": ".platforms.laixiu.live_stream",
+    "LangLiveStream": ".platforms.langlive.live_stream",
+    "LehaiLiveStream": ".platforms.lehai.live_stream",
+    "LianJieLiveStream": ".platforms.lianjie.live_stream",
+    "LiveMeLiveStream": ".platforms.liveme.live_stream",
+    "LiveStatus": ".data",
+    "LookLiveStream": ".platforms.look.live_stream",
+    "MaoerLiveStream": ".platforms.maoer.live_stream",
+    "MiguLiveStream": ".platforms.migu.live_stream",
+    "NeteaseLiveStream": ".platforms.netease.live_stream",
+    "PandaLiveStream": ".platforms.pandatv.live_stream",
+    "PiaopaioLiveStream": ".platforms.piaopiao.live_stream",
+    "PicartoLiveStream": ".platforms.picarto.live_stream",
+    "PopkonTVLiveStream": ".platforms.popkontv.live_stream",
+    "QiandureboLiveStream": ".platforms.qiandurebo.live_stream",
+    "RedNoteLiveStream": ".platforms.rednote.live_stream",
+    "Session": ".requests.session",
+    "ShopeeLiveStream": ".platforms.shopee.live_stream",
+    "ShowRoomLiveStream": ".platforms.showroom.live_stream",
+    "SixRoomLiveStream": ".platforms.sixroom.live_stream",
+    "SoopLiveStream": ".platforms.soop.live_stream",
+    "StreamData": ".data",
+    "TaobaoLiveStream": ".platforms.taobao.live_stream",
+    "TikTokLiveStream": ".platforms.tiktok.live_stream",
+    "TwitCastingLiveStream": ".platforms.twitcasting.live_stream",
+    "TwitchLiveStream": ".platforms.twitch.live_stream",
+    "VVXQLiveStream": ".platforms.vvxq.live_stream",
+    "WeiboLiveStream": ".platforms.weibo.live_stream",
+    "WinkTVLiveStream": ".platforms.winktv.live_stream",
+    "YYLiveStream": ".platforms.yy.live_stream",
+    "YinboLiveStream": ".platforms.yinbo.live_stream",
+    "YiqiLiveStream": ".platforms.yiqilive.live_stream",
+    "YoutubeLiveStream": ".platforms.youtube.live_stream",
+    "ZhihuLiveStream": ".platforms.zhihu.live_stream",
+    "resolve": ".router",
+}
 
 __all__ = [
     "AcfunLiveStream",
@@ -90,6 +98,7 @@ __all__ = [
     "LehaiLiveStream",
     "LianJieLiveStream",
     "LiveMeLiveStream",
+    "LiveStatus",
     "LookLiveStream",
     "MaoerLiveStream",
     "MiguLiveStream",
@@ -100,6 +109,7 @@ __all__ = [
     "PopkonTVLiveStream",
     "QiandureboLiveStream",
     "RedNoteLiveStream",
+    "Session",
     "ShopeeLiveStream",
     "ShowRoomLiveStream",
     "SixRoomLiveStream",
@@ -120,12 +130,23 @@ __all__ = [
     "__description__",
     "__title__",
     "__version__",
+    "resolve",
 ]
 
-__locals = locals()
-for __name in __all__:
-    if not __name.startswith("__"):
-        __locals[__name].__module__ = "streamget"
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    value.__module__ = "streamget"
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 # from .scripts.node_setup import check_node
 # check_node()
@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+
+from .cache import StreamCache
+from .data import StreamData, wrap_stream
+from .platforms.base import BaseLiveStream
+from .requests.session import Session, get_session
+from .router import match, url_host
+
+
+async def fetch_stream(
+        url: str,
+        video_quality: str | int | None = None,
+        proxy_addr: str | None = None,
+        options: dict[str, dict] | None = None,
+        cache: StreamCache | None = None,
+        check_status: bool = False
+) -> StreamData:
+    """
+    Resolves a single room URL with the matching platform class.
+
+    Args:
+        url (str): The room URL.
+        video_quality (str | int | None): The desired video quality. Defaults to None.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        options (dict[str, dict] | None): Extra constructor arguments keyed by platform class name,
+            e.g. ``{"TaobaoLiveStream": {"cookies": "..."}}``. Defaults to None.
+        cache (StreamCache | None): Serve and store results here while their URLs are valid. Defaults to None.
+        check_status (bool): Ask the platform's cheap `fetch_live_status` first and resolve stream
+            URLs only if the room is live. Platforms without one are resolved directly. Defaults to False.
+
+    Returns:
+        StreamData: The resolved stream data.
+    """
+    if cache is not None:
+        stream = cache.get(url, video_quality)
+        if stream is not None:
+            return stream
+    live_class, method = match(url)
+    kwargs = (options or {}).get(live_class.__name__, {})
+    live = live_class(proxy_addr=proxy_addr, **kwargs)
+    status = None
+    if check_status and live_class.fetch_live_status is not BaseLiveStream.fetch_live_status:
+        status = await live.fetch_live_status(url.strip())
+    if status is not None and not status.is_live:
+        stream = wrap_stream({"platform": status.platform, "anchor_name": status.anchor_name, "is_live": False,
+                              "title": status.title, "live_url": status.live_url})
+    else:
+        json_data = await getattr(live, method)(url.strip())
+        stream = await live.fetch_stream_url(json_data, video_quality)
+    if cache is not None:
+        cache.put(url, stream, video_quality)
+    return stream
+
+
+async def fetch_many(
+        urls: Iterable[str],
+        video_quality: str | int | None = None,
+        concurrency: int = 50,
+        per_host: int = 4,
+        timeout: float | None = 30,
+        proxy_addr: str | None = None,
+        options: dict[str, dict] | None = None,
+        cache: StreamCache | None = None,
+        check_status: bool = False
+) -> AsyncIterator[StreamData]:
+    """
+    Resolves many room URLs concurrently and yields each result as soon as it completes.
+
+    Every URL is dispatched to its platform class and resolved under two limits: at most
+    `concurrency` rooms in flight overall, and at most `per_host` rooms per URL host, so one
+    slow or rate-limited platform cannot occupy all slots. All requests share the active
+    `Session`, or a session owned by this call when none is active.
+
+    Args:
+        urls (Iterable[str]): The room URLs to resolve.
+        video_quality (str | int | None): The desired video quality. Defaults to None.
+        concurrency (int): Maximum number of rooms resolved at once. Defaults to 50.
+        per_host (int): Maximum number of rooms resolved at once per URL host. Defaults to 4.
+        timeout (float | None): Seconds allowed per room before it is abandoned. Defaults to 30.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        options (dict[str, dict] | None): Extra constructor arguments keyed by platform class name.
+            Defaults to None.
+        cache (StreamCache | None): Serve and store results here while their URLs are valid. Defaults to None.
+        check_status (bool): Resolve stream URLs only for rooms whose cheap status check says live.
+            Defaults to False.
+
+    Yields:
+        StreamData: One result per URL, in completion order. Rooms that fail or time out are
+        yielded with `is_live=None` and the error message in `extra['error']`.
+
+    Example:
+        >>> import asyncio
+        >>> from streamget.batch import fetch_many
+        >>> async def main():
+        ...     async for stream_data in fetch_many(urls, concurrency=100):
+        ...         if stream_data.is_live:
+        ...             print(stream_data.live_url, stream_data.record_url)
+        >>> asyncio.run(main())
+    """
+    session = get_session()
+    owned_session = session is None
+    if owned_session:
+        session = Session(max_connections=concurrency)
+
+    global_limit = asyncio.Semaphore(concurrency)
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def worker(url: str) -> StreamData:
+        host = url_host(url)
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+        async with host_limit, global_limit:
+            try:
+                with session.activate():
+                    return await asyncio.wait_for(
+                        fetch_stream(url, video_quality, proxy_addr=proxy_addr, options=options, cache=cache,
+                                     check_status=check_status), timeout)
+            except Exception as e:
+                message = str(e) or type(e).__name__
+                return wrap_stream({"live_url": url, "extra": {"error": message}})
+
+    tasks = [asyncio.create_task(worker(url)) for url in urls]
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if owned_session:
+            await session.aclose()
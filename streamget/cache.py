@@ -0,0 +1,163 @@
+import collections
+import re
+import time
+import urllib.parse
+
+from .data import StreamData
+
+# Query parameters that carry the expiry time of signed stream URLs, and their base.
+# Huya and Tencent CDNs sign with a hex `wsTime`/`txTime`; Douyin, TikTok and Bilibili
+# use decimal `expire`, `expires` or `deadline`.
+EXPIRY_PARAMS = {'wsTime': 16, 'txTime': 16, 'expire': 10, 'expires': 10, 'deadline': 10}
+
+# YouTube puts the expiry in the manifest path, Twitch in the JSON access token
+_PATH_EXPIRY = re.compile(r'/expire/(\d{10})(?:/|$)')
+_TOKEN_EXPIRY = re.compile(r'"expires"\s*:\s*(\d{10})')
+
+
+def _plausible(value: int) -> bool:
+    # Unix times between 2001 and 2286; some CDNs use the same names for durations
+    return 1_000_000_000 < value < 10_000_000_000
+
+
+def url_expiry(url: str | None) -> float | None:
+    """
+    Reads the expiry time embedded in a signed stream URL.
+
+    Understands the `wsTime`, `txTime`, `expire`, `expires` and `deadline` query parameters,
+    YouTube's `/expire/<time>/` path segment and the `expires` field of Twitch access tokens.
+
+    Args:
+        url (str | None): The stream URL.
+
+    Returns:
+        float | None: The expiry as a Unix timestamp, or None if the URL carries none.
+    """
+    if not url:
+        return None
+    split = urllib.parse.urlsplit(url)
+    query = urllib.parse.parse_qs(split.query)
+    for name, base in EXPIRY_PARAMS.items():
+        value = query.get(name)
+        if not value:
+            continue
+        try:
+            expiry = int(value[0], base)
+        except ValueError:
+            continue
+        if _plausible(expiry):
+            return float(expiry)
+    token = query.get('token')
+    match = _TOKEN_EXPIRY.search(token[0]) if token else None
+    if match is None:
+        match = _PATH_EXPIRY.search(split.path)
+    if match is not None and _plausible(int(match.group(1))):
+        return float(match.group(1))
+    return None
+
+
+def stream_expiry(stream: StreamData) -> float | None:
+    """
+    Returns the earliest expiry among the URLs of a `StreamData`, or None if none carries one.
+    """
+    urls = [stream.m3u8_url, stream.flv_url, stream.record_url]
+    urls += (stream.extra or {}).get('backup_url_list') or []
+    expiries = [expiry for expiry in map(url_expiry, urls) if expiry is not None]
+    return min(expiries, default=None)
+
+
+class StreamCache:
+    """
+    An LRU cache of resolved `StreamData`, valid until shortly before the stream URLs expire.
+
+    Live results are kept until `margin` seconds before the earliest expiry found in their
+    URLs (see `url_expiry`), or for `ttl` seconds when the URLs carry no expiry. Offline
+    results are kept for `offline_ttl` seconds, which by default means not at all. Once
+    `max_size` rooms are cached, the least recently used one is dropped.
+
+    Pass it to `streamget.batch.fetch_stream` or `fetch_many` as `cache=`.
+
+    Args:
+        max_size (int): Maximum number of cached results. Defaults to 1024.
+        margin (float): Seconds before URL expiry at which a result is considered stale. Defaults to 30.
+        ttl (float): Lifetime of live results whose URLs carry no expiry. Defaults to 60.
+        offline_ttl (float): Lifetime of offline results. Defaults to 0.
+
+    Example:
+        >>> cache = StreamCache(max_size=500)
+        >>> async def main():
+        ...     stream_data = await fetch_stream("https://www.huya.com/xxxxxx", cache=cache)
+        ...     stream_data = await fetch_stream("https://www.huya.com/xxxxxx", cache=cache)  # no requests
+        >>> asyncio.run(main())
+    """
+    def __init__(self, max_size: int = 1024, margin: float = 30, ttl: float = 60, offline_ttl: float = 0):
+        self.max_size = max_size
+        self.margin = margin
+        self.ttl = ttl
+        self.offline_ttl = offline_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[tuple[str, str], tuple[float, StreamData]] = \
+            collections.OrderedDict()
+
+    @staticmethod
+    def _key(url: str, video_quality: str | int | None) -> tuple[str, str]:
+        return url.strip(), '' if video_quality is None else str(video_quality).upper()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def valid_until(self, stream: StreamData) -> float:
+        """
+        Returns the Unix time until which `stream` may be served from the cache.
+        """
+        now = time.time()
+        if not stream.is_live:
+            return now + self.offline_ttl
+        expiry = stream_expiry(stream)
+        if expiry is None:
+            return now + self.ttl
+        return expiry - self.margin
+
+    def get(self, url: str, video_quality: str | int | None = None) -> StreamData | None:
+        """
+        Returns the cached result for a room, or None if there is none or it has gone stale.
+        """
+        key = self._key(url, video_quality)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, url: str, stream: StreamData, video_quality: str | int | None = None) -> None:
+        """
+        Caches a result, unless it would already be stale.
+        """
+        key = self._key(url, video_quality)
+        valid_until = self.valid_until(stream)
+        if valid_until <= time.time():
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (valid_until, stream)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, url: str, video_quality: str | int | None = None) -> None:
+        """
+        Drops the cached results of a room: for one quality, or all of them when `video_quality` is None.
+        """
+        if video_quality is not None:
+            self._entries.pop(self._key(url, video_quality), None)
+            return
+        url = url.strip()
+        for key in [key for key in self._entries if key[0] == url]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
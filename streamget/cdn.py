@@ -0,0 +1,207 @@
+import asyncio
+import collections
+import dataclasses
+import time
+import urllib.parse
+from dataclasses import dataclass
+
+from .data import StreamData
+from .requests.session import Session, open_client
+
+
+@dataclass
+class CdnScore:
+    """
+    The running score of one CDN.
+
+    Attributes:
+        key (str): The CDN identity, by default the URL host and path.
+        url (str | None): The URL measured last.
+        ttfb (float | None): Smoothed time to first byte in seconds.
+        throughput (float | None): Smoothed early throughput in bytes per second, if measured.
+        samples (int): Successful measurements.
+        failures (int): Consecutive failed measurements.
+        score (float): Expected seconds to receive `sample_bytes`; lower is better.
+    """
+    key: str
+    url: str | None = None
+    ttfb: float | None = None
+    throughput: float | None = None
+    samples: int = 0
+    failures: int = 0
+    score: float = float('inf')
+
+    @property
+    def healthy(self) -> bool:
+        return self.samples > 0 and self.failures == 0
+
+
+class CdnScorer:
+    """
+    Ranks CDN candidates by measured time to first byte and early throughput.
+
+    Each candidate is requested concurrently. The scorer records when the first byte arrives,
+    then reads up to `sample_bytes` within `sample_time` to estimate throughput. Measurements
+    feed an exponentially weighted moving average per CDN, kept across calls. Signed URLs
+    change their query on every poll, so CDNs are keyed by host and path unless keys are
+    given; candidates that still share a key within one call are scored separately. A failed
+    measurement marks the CDN unhealthy until it succeeds again, and unhealthy CDNs rank last.
+
+    Args:
+        alpha (float): Weight of the newest measurement in the moving averages. Defaults to 0.3.
+        sample_bytes (int): Bytes read per measurement for the throughput estimate. Defaults to 256 KiB.
+        sample_time (float): Longest time spent reading after the first byte. Defaults to 1.
+        timeout (float): Time allowed for the first byte. Defaults to 3.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        headers (dict | None): Custom headers for the requests. Defaults to None.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
+
+    Example:
+        >>> scorer = CdnScorer()
+        >>> async def poll(stream_obj):
+        ...     stream_obj = await scorer.apply(stream_obj)
+        ...     print(stream_obj.record_url, stream_obj.extra['cdn_ranking'])
+    """
+    def __init__(
+            self,
+            alpha: float = 0.3,
+            sample_bytes: int = 256 * 1024,
+            sample_time: float = 1,
+            timeout: float = 3,
+            proxy_addr: str | None = None,
+            headers: dict | None = None,
+            session: Session | None = None
+    ):
+        self.alpha = alpha
+        self.sample_bytes = sample_bytes
+        self.sample_time = sample_time
+        self.timeout = timeout
+        self.proxy_addr = proxy_addr
+        self.headers = headers or {}
+        self.session = session
+        self.scores: dict[str, CdnScore] = {}
+
+    @staticmethod
+    def cdn_key(url: str) -> str:
+        split = urllib.parse.urlsplit(url)
+        return f'{split.hostname}{split.path}' if split.hostname else url
+
+    async def _measure(self, client, url: str) -> tuple[float, float | None] | None:
+        start = time.monotonic()
+        try:
+            async with client.stream('GET', url, headers=self.headers, follow_redirects=True,
+                                     timeout=self.timeout) as response:
+                if response.status_code >= 400:
+                    return None
+                chunks = response.aiter_bytes()
+                first = await asyncio.wait_for(chunks.__anext__(), self.timeout)
+                first_byte = time.monotonic()
+                received = len(first)
+                ended = False
+                deadline = first_byte + self.sample_time
+                while received < self.sample_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        received += len(await asyncio.wait_for(chunks.__anext__(), remaining))
+                    except StopAsyncIteration:
+                        ended = True
+                        break
+                    except asyncio.TimeoutError:
+                        break
+        except Exception:
+            return None
+        elapsed = time.monotonic() - first_byte
+        # Short bodies such as playlists say nothing about throughput
+        throughput = received / elapsed if not ended and elapsed > 0 else None
+        return first_byte - start, throughput
+
+    def _smooth(self, old: float | None, new: float | None) -> float | None:
+        if new is None:
+            return old
+        if old is None:
+            return new
+        return self.alpha * new + (1 - self.alpha) * old
+
+    def _update(self, key: str, url: str, measurement: tuple[float, float | None] | None) -> CdnScore:
+        score = self.scores.setdefault(key, CdnScore(key))
+        score.url = url
+        if measurement is None:
+            score.failures += 1
+            return score
+        ttfb, throughput = measurement
+        score.ttfb = self._smooth(score.ttfb, ttfb)
+        score.throughput = self._smooth(score.throughput, throughput)
+        score.samples += 1
+        score.failures = 0
+        score.score = score.ttfb + (self.sample_bytes / score.throughput if score.throughput else 0)
+        return score
+
+    async def rank(self, urls: list[str], keys: list[str] | None = None) -> list[CdnScore]:
+        """
+        Measures the candidates concurrently and ranks them, best first.
+
+        Args:
+            urls (list[str]): The candidate URLs, one per CDN.
+            keys (list[str] | None): CDN identities for the URLs, e.g. Huya's `sCdnType`. Defaults to the hosts.
+
+        Returns:
+            list[CdnScore]: Copies of the updated scores of the candidates, healthy ones first,
+            each group ordered by score.
+        """
+        keys = keys or [self.cdn_key(url) for url in urls]
+        # One score per candidate, even when several share a CDN key
+        counts = collections.Counter()
+        unique_keys = []
+        for key in keys:
+            unique_keys.append(f'{key}#{counts[key]}' if counts[key] else key)
+            counts[key] += 1
+        keys = unique_keys
+        async with open_client(self.proxy_addr, timeout=self.timeout, session=self.session) as client:
+            measurements = await asyncio.gather(*(self._measure(client, url) for url in urls))
+        ranked = [self._update(key, url, m) for key, url, m in zip(keys, urls, measurements)]
+        ranked.sort(key=lambda s: (not s.healthy, s.score))
+        return [dataclasses.replace(score) for score in ranked]
+
+    async def best(self, urls: list[str], keys: list[str] | None = None) -> str | None:
+        """
+        Returns the URL of the best healthy candidate, or None if every candidate failed.
+        """
+        ranked = await self.rank(urls, keys)
+        return ranked[0].url if ranked and ranked[0].healthy else None
+
+    async def apply(self, stream: StreamData) -> StreamData:
+        """
+        Reorders the CDNs of a live `StreamData`, best first.
+
+        The record URL and `extra['backup_url_list']` are ranked together. The best one becomes
+        `record_url` (and `flv_url` when the record URL was the FLV URL) and the others the
+        backup list in ranked order. The ranking is stored in `extra['cdn_ranking']` as dicts
+        with the fields of `CdnScore` plus `healthy`. Streams with a single candidate keep their
+        URLs, and so do streams whose candidates all fail.
+
+        Args:
+            stream (StreamData): The resolved stream.
+
+        Returns:
+            StreamData: A copy of `stream` with its CDNs reordered.
+        """
+        extra = dict(stream.extra or {})
+        urls = list(dict.fromkeys(u for u in [stream.record_url, *(extra.get('backup_url_list') or [])] if u))
+        if not stream.is_live or len(urls) < 2:
+            return stream
+        ranked = await self.rank(urls)
+        extra['cdn_ranking'] = [dataclasses.asdict(score) | {'healthy': score.healthy} for score in ranked]
+        if not ranked[0].healthy:
+            return dataclasses.replace(stream, extra=extra)
+        ordered = list(dict.fromkeys(score.url for score in ranked))
+        if sorted(ordered) != sorted(urls):
+            # Never drop or repeat a candidate
+            return dataclasses.replace(stream, extra=extra)
+        best = ordered[0]
+        extra['backup_url_list'] = ordered[1:]
+        changes = {'record_url': best, 'extra': extra}
+        if stream.flv_url == stream.record_url:
+            changes['flv_url'] = best
+        return dataclasses.replace(stream, **changes)
@@ -70,6 +70,30 @@ class StreamData:
         return json.dumps(self.__dict__, ensure_ascii=False, indent=4)
 
 
+@dataclass
+class LiveStatus:
+    """
+    Whether a room is live, as returned by `fetch_live_status` without resolving stream URLs.
+
+    Attributes:
+        platform (str): The streaming platform.
+        live_url (str): The URL of the live room.
+        is_live (bool): Indicates whether the stream is currently live.
+        anchor_name (str): The name of the streamer, when the status endpoint provides it.
+        title (str): The title of the stream, when the status endpoint provides it.
+
+    Example:
+        >>> status = await BilibiliLiveStream().fetch_live_status("https://live.bilibili.com/xxxxxx")
+        >>> if status.is_live:
+        ...     stream_data = await fetch_stream(status.live_url)
+    """
+    platform: str = None
+    live_url: str = None
+    is_live: bool = None
+    anchor_name: str = None
+    title: str = None
+
+
 def wrap_stream(data: dict) -> StreamData:
     """
     Wraps a dictionary into a StreamData object with default values for missing fields.
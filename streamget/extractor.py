@@ -0,0 +1,344 @@
+import abc
+import bisect
+import json
+import re
+from json.decoder import scanstring
+
+_decoder = json.JSONDecoder()
+
+_VALUE_START = re.compile(r'[{\[]')
+# A whole double-quoted string (escapes included) or a single bracket
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]', re.DOTALL)
+_JS_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|\bundefined\b', re.DOTALL)
+
+
+def json_end(text: str, start: int, js: bool = False) -> tuple[int, list[int]]:
+    """
+    Finds the end of the JSON object or array that opens at `start` with one linear scan.
+
+    A compiled regex jumps from bracket to bracket and consumes each string literal
+    (escaped quotes included) as a single token, so the scan is bracket- and
+    string-aware without copying any part of the text.
+
+    Args:
+        text (str): The text containing the value.
+        start (int): Index of the opening `{` or `[`.
+        js (bool): If True, also records the positions of bare `undefined` tokens. Defaults to False.
+
+    Returns:
+        tuple: The index just past the closing bracket, and the positions of `undefined` tokens.
+
+    Raises:
+        ValueError: If the value is not terminated.
+    """
+    if text[start] not in '{[':
+        raise ValueError(f'No JSON value at index {start}')
+    finditer = (_JS_TOKEN if js else _TOKEN).finditer
+    undefined = []
+    depth = 0
+    for match in finditer(text, start):
+        char = text[match.start()]
+        if char == '"':
+            continue
+        if char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return match.end(), undefined
+        else:
+            undefined.append(match.start())
+    raise ValueError(f'Unterminated JSON value at index {start}')
+
+
+def _value_start(text: str, marker: str, start: int) -> int:
+    pos = text.find(marker, start)
+    if pos < 0:
+        return -1
+    match = _VALUE_START.search(text, pos)
+    return match.start() if match else -1
+
+
+def find_json(text: str, marker: str, start: int = 0, js: bool = False) -> str | None:
+    """
+    Returns the source of the JSON object or array at the first `{` or `[` at or after `marker`.
+
+    Args:
+        text (str): The page source.
+        marker (str): Text that precedes the value, e.g. 'window.__INITIAL_STATE__='. If the
+            marker itself starts with a bracket, e.g. '{"liveStream"', the value starts there.
+        start (int): Index to start searching from. Defaults to 0.
+        js (bool): If True, bare `undefined` tokens are replaced with `null`. Defaults to False.
+
+    Returns:
+        str | None: The JSON text, or None if the marker is not found.
+    """
+    begin = _value_start(text, marker, start)
+    if begin < 0:
+        return None
+    end, undefined = json_end(text, begin, js)
+    if not undefined:
+        return text[begin:end]
+    parts = []
+    pos = begin
+    for index in undefined:
+        parts.append(text[pos:index])
+        parts.append('null')
+        pos = index + len('undefined')
+    parts.append(text[pos:end])
+    return ''.join(parts)
+
+
+def load_json(text: str, marker: str, start: int = 0, js: bool = False):
+    """
+    Parses the JSON object or array at the first `{` or `[` at or after `marker`.
+
+    Strict JSON is decoded straight from the page with `json.JSONDecoder.raw_decode`, which
+    stops at the end of the value, so the page is never sliced or copied. With `js=True`,
+    values that are not strict JSON are retried with bare `undefined` mapped to `null`.
+
+    Args:
+        text (str): The page source.
+        marker (str): Text that precedes the value. See `find_json`.
+        start (int): Index to start searching from. Defaults to 0.
+        js (bool): If True, accepts JavaScript object literals containing `undefined`. Defaults to False.
+
+    Returns:
+        dict | list | None: The parsed value, or None if the marker is not found.
+
+    Raises:
+        json.JSONDecodeError: If the value is not valid JSON.
+
+    Example:
+        >>> load_json(html_str, '<script id="__NEXT_DATA__"')['props']
+    """
+    begin = _value_start(text, marker, start)
+    if begin < 0:
+        return None
+    try:
+        return _decoder.raw_decode(text, begin)[0]
+    except json.JSONDecodeError:
+        if not js:
+            raise
+    return json.loads(find_json(text, marker, start, js=True))
+
+
+def load_js_string(text: str, marker: str, start: int = 0) -> str | None:
+    """
+    Decodes the double-quoted JavaScript string literal that follows `marker`.
+
+    Args:
+        text (str): The page source.
+        marker (str): Text that precedes the opening quote, e.g. 'self.__rsc_f.push([1,'.
+        start (int): Index to start searching from. Defaults to 0.
+
+    Returns:
+        str | None: The unescaped string, or None if the marker is not found.
+    """
+    pos = text.find(marker, start)
+    if pos < 0:
+        return None
+    quote = text.find('"', pos + len(marker))
+    if quote < 0:
+        return None
+    return scanstring(text, quote + 1)[0]
+
+
+def unescape_js_string(text: str) -> str:
+    """
+    Resolves backslash escapes (\\", \\\\, \\n, \\uXXXX, ...) of a string literal's contents in one pass.
+
+    Args:
+        text (str): The contents of a double-quoted string literal, without the quotes.
+
+    Returns:
+        str: The unescaped string.
+    """
+    return scanstring(text + '"', 0)[0]
+
+
+class PageScanner(abc.ABC):
+    """
+    Base class for scanners that watch a page as it downloads and report when the
+    part a parser needs has arrived. See `streamget.requests.async_http.async_req_until`.
+
+    A scanner keeps the chunks fed to it and remembers how far it has searched, so each
+    chunk is examined once and the page is only joined into one string when `text` is
+    read. Use a new scanner for every request.
+    """
+    def __init__(self):
+        self._parts: list[str] = []
+        # Offset of each part in the page
+        self._starts: list[int] = []
+        self._length = 0
+        self.complete = False
+
+    @property
+    def text(self) -> str:
+        """
+        The text received so far.
+        """
+        if len(self._parts) > 1:
+            self._parts = [''.join(self._parts)]
+            self._starts = [0]
+        return self._parts[0] if self._parts else ''
+
+    def _tail(self, start: int) -> str:
+        # The text from `start` on, joining only the parts that reach past it
+        index = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        return ''.join(self._parts[index:])[start - self._starts[index]:]
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Adds a decoded chunk of the page.
+
+        Returns:
+            bool: True once everything the parser needs has been received.
+        """
+        if not self.complete:
+            self._starts.append(self._length)
+            self._parts.append(chunk)
+            self._length += len(chunk)
+            offset = min(self._resume_from(), self._length)
+            self.complete = self._scan(self._tail(offset), offset)
+        return self.complete
+
+    @abc.abstractmethod
+    def _resume_from(self) -> int:
+        """
+        Returns the earliest page offset the next scan has to look at.
+        """
+
+    @abc.abstractmethod
+    def _scan(self, text: str, offset: int) -> bool:
+        """
+        Continues the search in `text`, the page from `offset` on.
+
+        Returns:
+            bool: True once everything the parser needs has been received.
+        """
+
+
+class MarkerScanner(PageScanner):
+    """
+    Completes once every marker has appeared in the page.
+
+    Each argument is either a marker string or a tuple of markers that must appear in
+    that order, e.g. an attribute name followed by the text that closes its value.
+
+    Args:
+        *markers (str | tuple[str, ...]): The markers to wait for.
+
+    Example:
+        >>> scanner = MarkerScanner(('data-movie-id="', 'data-audience-id'), ('<title>', '</title>'))
+    """
+    def __init__(self, *markers: str | tuple[str, ...]):
+        super().__init__()
+        # [sequence, index of the next marker, position to search from]
+        self._pending = [[(m,) if isinstance(m, str) else tuple(m), 0, 0] for m in markers]
+
+    def _resume_from(self) -> int:
+        return min((state[2] for state in self._pending), default=self._length)
+
+    def _scan(self, text: str, offset: int) -> bool:
+        for state in self._pending:
+            sequence, index, search_from = state
+            while index < len(sequence):
+                marker = sequence[index]
+                pos = text.find(marker, search_from - offset)
+                if pos < 0:
+                    # A marker cut by the chunk boundary is found again on the next scan
+                    search_from = max(search_from, offset + len(text) - len(marker) + 1)
+                    break
+                search_from = offset + pos + len(marker)
+                index += 1
+            state[1], state[2] = index, search_from
+        self._pending = [state for state in self._pending if state[1] < len(state[0])]
+        return not self._pending
+
+
+# A bracket or the quote opening a string literal
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+# The rest of a string literal up to its closing quote. The match stops before a trailing
+# backslash whose escaped character has not arrived yet, so it is safe to resume from its end.
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+
+class JsonScanner(PageScanner):
+    """
+    Completes once the JSON object or array following `marker` has fully arrived.
+
+    The value is located with the same rule as `load_json`, so the page can be parsed
+    with `load_json(scanner.text, marker, ...)` afterwards. Brackets are counted
+    incrementally as chunks arrive, skipping string literals.
+
+    Args:
+        marker (str): Text that precedes the value. See `find_json`.
+        after (str | None): Text that must appear before `marker`; the marker is searched
+            for from there on, like `load_json(..., start=text.index(after))`. Defaults to None.
+    """
+    def __init__(self, marker: str, after: str | None = None):
+        super().__init__()
+        self.marker = marker
+        self.after = after
+        self._search_from = 0
+        self._after_found = after is None
+        self._marker_pos = -1
+        self._scan_pos = -1
+        self._depth = 0
+        self._in_string = False
+
+    def _find(self, text: str, offset: int, marker: str) -> int:
+        pos = text.find(marker, self._search_from - offset)
+        if pos < 0:
+            self._search_from = max(self._search_from, offset + len(text) - len(marker) + 1)
+            return pos
+        return offset + pos
+
+    def _resume_from(self) -> int:
+        if self._scan_pos >= 0:
+            return self._scan_pos
+        if self._marker_pos >= 0:
+            return self._marker_pos
+        return self._search_from
+
+    def _scan(self, text: str, offset: int) -> bool:
+        if not self._after_found:
+            pos = self._find(text, offset, self.after)
+            if pos < 0:
+                return False
+            self._after_found = True
+            self._search_from = pos
+        if self._marker_pos < 0:
+            self._marker_pos = self._find(text, offset, self.marker)
+            if self._marker_pos < 0:
+                return False
+        if self._scan_pos < 0:
+            match = _VALUE_START.search(text, self._marker_pos - offset)
+            if match is None:
+                return False
+            self._scan_pos = offset + match.start()
+        pos = self._scan_pos - offset
+        while True:
+            if self._in_string:
+                # Strings spanning many chunks are resumed where the last scan stopped
+                end = _STRING_REST.match(text, pos).end()
+                if end >= len(text) or text[end] != '"':
+                    self._scan_pos = offset + end
+                    return False
+                self._in_string = False
+                pos = end + 1
+            match = _STRUCTURE.search(text, pos)
+            if match is None:
+                self._scan_pos = offset + len(text)
+                return False
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
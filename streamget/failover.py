@@ -0,0 +1,231 @@
+import asyncio
+import collections
+import time
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+
+from .batch import fetch_stream
+from .cache import url_expiry
+from .data import StreamData
+from .requests.session import Session, get_session
+
+
+class ResilientReader:
+    """
+    Reads a live stream across connection failures, backup CDNs and expiring URLs.
+
+    `streams` yields one byte stream per connection. A connection is abandoned as soon as
+    no data arrives for `stall_timeout` seconds, its throughput stays under `min_bitrate`
+    for `bitrate_window` seconds, or the request fails, and the next candidate URL is
+    opened immediately: the selected URL first, then the platform's backup CDNs
+    (`StreamData.extra['backup_url_list']`, e.g. Douyu and Huya).
+
+    When the URL carries an expiry (Huya `wsTime`, Douyin/TikTok `expire`, ...), the room is
+    re-resolved in the background `refresh_ahead` seconds before it, so a fresh URL is
+    already at hand when the connection drops. If every candidate fails without
+    delivering data, the room is re-resolved right away; reading ends when the room is no
+    longer live or `max_rounds` rounds in a row deliver nothing.
+
+    Platforms that sign URLs locally can refresh them without any request: pass their
+    re-signing function as `refresh`, e.g. `HuyaLiveStream.refresh_url`, and it is used for
+    the background refreshes instead of resolving the room. When it fails, the room is
+    resolved as usual.
+
+    Args:
+        room_url (str): The live room URL, resolved with `streamget.batch.fetch_stream`.
+        video_quality (str | int | None): The desired video quality. Defaults to None.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        options (dict[str, dict] | None): Extra constructor arguments keyed by platform class name. Defaults to None.
+        stream (StreamData | None): Already resolved stream data, to skip the first resolve. Defaults to None.
+        url_type (str): "flv" to read `flv_url`, "record" to read `record_url`. Defaults to "flv".
+        headers (dict | None): Custom headers for the stream requests. Defaults to None.
+        stall_timeout (float): Seconds without data before failing over. Defaults to 5.
+        min_bitrate (float | None): Bits per second under which a connection counts as stalled. Defaults to None.
+        bitrate_window (float): Seconds over which `min_bitrate` is measured. Defaults to 10.
+        refresh_ahead (float): Seconds before URL expiry to re-resolve the room. Defaults to 30.
+        refresh (Callable[[StreamData], StreamData] | None): Re-signs the current stream data
+            without a request, for the background refreshes. Defaults to None.
+        max_rounds (int): Consecutive rounds without data before giving up. Defaults to 3.
+        timeout (int): The request timeout in seconds. Defaults to 20.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
+
+    Example:
+        >>> async def main():
+        ...     reader = ResilientReader("https://www.douyu.com/xxxxxx", "OD")
+        ...     async for stream in reader.streams():
+        ...         async for chunk in stream:
+        ...             sink.write(chunk)
+        >>> asyncio.run(main())
+    """
+    def __init__(
+            self,
+            room_url: str,
+            video_quality: str | int | None = None,
+            proxy_addr: str | None = None,
+            options: dict[str, dict] | None = None,
+            stream: StreamData | None = None,
+            url_type: str = 'flv',
+            headers: dict | None = None,
+            stall_timeout: float = 5,
+            min_bitrate: float | None = None,
+            bitrate_window: float = 10,
+            refresh_ahead: float = 30,
+            refresh: Callable[[StreamData], StreamData] | None = None,
+            max_rounds: int = 3,
+            timeout: int = 20,
+            session: Session | None = None
+    ):
+        if url_type not in ('flv', 'record'):
+            raise ValueError('url_type must be "flv" or "record"')
+        self.room_url = room_url
+        self.video_quality = video_quality
+        self.proxy_addr = proxy_addr
+        self.options = options
+        self.stream = stream
+        self.url_type = url_type
+        self.headers = headers or {}
+        self.stall_timeout = stall_timeout
+        self.min_bitrate = min_bitrate
+        self.bitrate_window = bitrate_window
+        self.refresh_ahead = refresh_ahead
+        self.refresh = refresh
+        self.max_rounds = max_rounds
+        self.timeout = timeout
+        self.session = session
+        self.current_url: str | None = None
+        self.generation = 0
+        self.failovers = 0
+        self.refreshes = 0
+        self._lock = asyncio.Lock()
+
+    def candidates(self) -> list[str]:
+        """
+        Returns the URLs to try in order: the selected stream URL, then the backup CDNs.
+        """
+        stream = self.stream
+        if stream is None or not stream.is_live:
+            return []
+        primary = stream.flv_url if self.url_type == 'flv' else stream.record_url
+        urls = [primary or stream.record_url]
+        urls += (stream.extra or {}).get('backup_url_list') or []
+        return list(dict.fromkeys(url for url in urls if url))
+
+    async def resolve(self) -> StreamData:
+        """
+        Resolves the room again. Concurrent callers share a single resolve.
+        """
+        generation = self.generation
+        async with self._lock:
+            if self.generation == generation:
+                self.stream = await fetch_stream(self.room_url, self.video_quality, self.proxy_addr, self.options)
+                self.generation += 1
+                self.refreshes += 1
+        return self.stream
+
+    async def _refresh_locally(self) -> bool:
+        # Re-signs the URLs with `refresh`; False when the room has to be resolved instead
+        if self.refresh is None:
+            return False
+        generation = self.generation
+        async with self._lock:
+            if self.generation != generation:
+                # A concurrent resolve already brought fresh URLs
+                return True
+            if self.stream is None or not self.stream.is_live:
+                return False
+            try:
+                self.stream = self.refresh(self.stream)
+            except Exception:
+                return False
+            self.generation += 1
+            self.refreshes += 1
+        return True
+
+    async def _refresh_before_expiry(self) -> None:
+        while True:
+            # The connection may still be reading an older URL; the latest one decides
+            expiry = url_expiry((self.candidates() or [None])[0]) or url_expiry(self.current_url)
+            if expiry is None:
+                return
+            await asyncio.sleep(max(expiry - self.refresh_ahead - time.time(), 5))
+            try:
+                if not await self._refresh_locally():
+                    await self.resolve()
+            except Exception:
+                await asyncio.sleep(5)
+
+    async def _connect(self, client: httpx.AsyncClient, url: str, progress: list[int]) -> AsyncIterator[bytes]:
+        window: collections.deque = collections.deque()
+        window_bytes = 0
+        try:
+            async with client.stream('GET', url, headers=self.headers, follow_redirects=True,
+                                     timeout=self.timeout) as response:
+                response.raise_for_status()
+                chunks = response.aiter_bytes()
+                opened = time.monotonic()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), self.stall_timeout)
+                    except (StopAsyncIteration, asyncio.TimeoutError):
+                        return
+                    progress[0] += len(chunk)
+                    if self.min_bitrate:
+                        now = time.monotonic()
+                        window.append((now, len(chunk)))
+                        window_bytes += len(chunk)
+                        while window[0][0] < now - self.bitrate_window:
+                            window_bytes -= window.popleft()[1]
+                        if now - opened >= self.bitrate_window and \
+                                window_bytes * 8 / self.bitrate_window < self.min_bitrate:
+                            return
+                    yield chunk
+        except httpx.HTTPError:
+            return
+
+    async def streams(self) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Yields one byte stream per connection until the room goes offline or keeps failing.
+
+        Each stream must be consumed (or closed) before the next one is requested. A new
+        stream starts at the beginning of the server's response, e.g. with a fresh FLV header.
+        """
+        owned = None
+        session = self.session or get_session()
+        if session is None:
+            session = owned = Session()
+        client = session.get_client(self.proxy_addr)
+        if self.stream is None:
+            await self.resolve()
+        refresher = asyncio.create_task(self._refresh_before_expiry())
+        idle_rounds = 0
+        try:
+            while idle_rounds < self.max_rounds:
+                generation = self.generation
+                urls = self.candidates()
+                if not urls:
+                    return
+                delivered = False
+                for index, url in enumerate(urls):
+                    if self.generation != generation:
+                        # Fresh URLs arrived in the background; start over with them
+                        break
+                    if index:
+                        self.failovers += 1
+                    self.current_url = url
+                    progress = [0]
+                    connection = self._connect(client, url, progress)
+                    try:
+                        yield connection
+                    finally:
+                        await connection.aclose()
+                    delivered = delivered or progress[0] > 0
+                    if refresher.done() and url_expiry(url) is not None:
+                        refresher = asyncio.create_task(self._refresh_before_expiry())
+                idle_rounds = 0 if delivered else idle_rounds + 1
+                if not delivered and self.generation == generation:
+                    await self.resolve()
+        finally:
+            refresher.cancel()
+            if owned is not None:
+                await owned.aclose()
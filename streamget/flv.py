@@ -0,0 +1,305 @@
+import struct
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+
+TAG_AUDIO = 8
+TAG_VIDEO = 9
+TAG_SCRIPT = 18
+
+# Tag header (11 bytes) and the PreviousTagSize that trails every tag
+TAG_HEADER_SIZE = 11
+TAG_TRAILER_SIZE = 4
+
+_VIDEO_CODEC_AVC = 7
+_VIDEO_CODEC_HEVC = 12
+_AUDIO_FORMAT_AAC = 10
+
+
+class FlvError(ValueError):
+    """
+    Raised when the data is not a valid FLV stream.
+    """
+
+
+class FlvTag:
+    """
+    One FLV tag, viewed in place in the reader's buffer.
+
+    `raw` spans the whole tag (header, payload and trailing PreviousTagSize) and `data` the
+    payload. Both are views into the reader's reusable buffer, so they stay valid only
+    until the next tag is read; copy them with `bytes(...)` to keep them longer.
+
+    Attributes:
+        type (int): TAG_AUDIO, TAG_VIDEO or TAG_SCRIPT.
+        timestamp (int): The timestamp in milliseconds.
+        offset (int): The position of the tag in the stream.
+        raw (memoryview): The whole tag.
+        data (memoryview): The tag payload.
+    """
+    __slots__ = ('data', 'offset', 'raw', 'timestamp', 'type')
+
+    def __init__(self, tag_type: int, timestamp: int, offset: int, raw: memoryview):
+        self.type = tag_type
+        self.timestamp = timestamp
+        self.offset = offset
+        self.raw = raw
+        self.data = raw[TAG_HEADER_SIZE:-TAG_TRAILER_SIZE]
+
+    @property
+    def is_audio(self) -> bool:
+        return self.type == TAG_AUDIO
+
+    @property
+    def is_video(self) -> bool:
+        return self.type == TAG_VIDEO
+
+    @property
+    def is_script(self) -> bool:
+        return self.type == TAG_SCRIPT
+
+    @property
+    def is_keyframe(self) -> bool:
+        """
+        True for video key frames. Enhanced RTMP (HEVC/AV1 FourCC) headers are understood too.
+        """
+        if self.type != TAG_VIDEO or not self.data:
+            return False
+        first = self.data[0]
+        if first & 0x80:
+            return (first >> 4) & 0x07 == 1
+        return first >> 4 == 1
+
+    @property
+    def is_sequence_header(self) -> bool:
+        """
+        True for AVC/HEVC decoder configuration records and AAC AudioSpecificConfig tags.
+        """
+        data = self.data
+        if len(data) < 2:
+            return False
+        first = data[0]
+        if self.type == TAG_VIDEO:
+            if first & 0x80:
+                return first & 0x0F == 0
+            return first & 0x0F in (_VIDEO_CODEC_AVC, _VIDEO_CODEC_HEVC) and data[1] == 0
+        if self.type == TAG_AUDIO:
+            return first >> 4 == _AUDIO_FORMAT_AAC and data[1] == 0
+        return False
+
+    def set_timestamp(self, timestamp: int) -> None:
+        """
+        Rewrites the tag's timestamp in place, e.g. to rebase a file to start at zero.
+        """
+        set_tag_timestamp(self.raw, timestamp)
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return f'FlvTag(type={self.type}, timestamp={self.timestamp}, size={len(self.data)})'
+
+
+def set_tag_timestamp(raw: memoryview | bytearray, timestamp: int) -> None:
+    """
+    Writes a timestamp into an FLV tag header (24 low bits plus the extension byte).
+    """
+    timestamp &= 0xFFFFFFFF
+    raw[4:8] = ((timestamp & 0xFFFFFF) << 8 | timestamp >> 24).to_bytes(4, 'big')
+
+
+@dataclass
+class FlvStats:
+    """
+    Byte and tag counters of a stream, for bitrate accounting.
+
+    Attributes:
+        audio_bytes (int): Payload bytes of audio tags.
+        video_bytes (int): Payload bytes of video tags.
+        script_bytes (int): Payload bytes of script tags.
+        tags (int): Tags read.
+        keyframes (int): Video key frames read.
+    """
+    audio_bytes: int = 0
+    video_bytes: int = 0
+    script_bytes: int = 0
+    tags: int = 0
+    keyframes: int = 0
+    # Per tag type: last timestamp seen and milliseconds elapsed
+    _last: dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _elapsed: dict[int, int] = field(default_factory=dict, init=False, repr=False)
+
+    def add_time(self, tag_type: int, timestamp: int, max_step: int = 10000) -> None:
+        """
+        Advances the clock of one track. Steps backwards or larger than `max_step` ms are
+        treated as timestamp jumps and not counted.
+        """
+        last = self._last.get(tag_type)
+        if last is not None and 0 < timestamp - last <= max_step:
+            self._elapsed[tag_type] = self._elapsed.get(tag_type, 0) + timestamp - last
+        self._last[tag_type] = timestamp
+
+    @property
+    def duration(self) -> float:
+        """
+        Seconds of media read so far, measured on the longest track.
+        """
+        return max(self._elapsed.values(), default=0) / 1000
+
+    def _bitrate(self, size: int) -> float:
+        duration = self.duration
+        return size * 8 / duration if duration else 0.0
+
+    @property
+    def bitrate(self) -> float:
+        """
+        Average audio plus video bitrate in bits per second.
+        """
+        return self._bitrate(self.audio_bytes + self.video_bytes)
+
+    @property
+    def video_bitrate(self) -> float:
+        return self._bitrate(self.video_bytes)
+
+    @property
+    def audio_bitrate(self) -> float:
+        return self._bitrate(self.audio_bytes)
+
+
+class FlvReader:
+    """
+    Reads FLV tags from an async byte stream.
+
+    Incoming chunks are copied into one reusable buffer and tags are parsed in place with a
+    `memoryview`, so payloads are never copied again. The buffer is compacted when a tag
+    does not fit at its tail and replaced by a larger one only for tags bigger than itself.
+
+    Args:
+        source (AsyncIterable[bytes]): The stream, e.g. `response.aiter_bytes()`.
+        buffer_size (int): Initial buffer size in bytes. Defaults to 1 MiB.
+        stats (FlvStats | None): Counters to continue, e.g. across reconnections. Defaults to new ones.
+
+    Example:
+        >>> async with client.stream('GET', stream_obj.flv_url) as response:
+        ...     reader = FlvReader(response.aiter_bytes())
+        ...     async for tag in reader:
+        ...         if tag.is_keyframe:
+        ...             print(tag.timestamp, reader.stats.bitrate)
+    """
+    def __init__(self, source: AsyncIterable[bytes], buffer_size: int = 1024 * 1024, stats: FlvStats | None = None):
+        self._source = source.__aiter__()
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._pending: memoryview | None = None
+        self._position = 0
+        self.header: bytes | None = None
+        self.has_audio = False
+        self.has_video = False
+        self.stats = stats if stats is not None else FlvStats()
+
+    def __aiter__(self) -> AsyncIterator[FlvTag]:
+        return self.tags()
+
+    def _reserve(self, size: int) -> None:
+        available = self._end - self._start
+        if size > len(self._buffer):
+            # A fresh buffer instead of a resize, since views of earlier tags may still be alive
+            buffer = bytearray(max(size, len(self._buffer) * 2))
+            buffer[:available] = self._view[self._start:self._end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        elif self._start + size > len(self._buffer):
+            self._view[:available] = self._view[self._start:self._end]
+        else:
+            return
+        self._start = 0
+        self._end = available
+
+    async def _fill(self, size: int) -> bool:
+        """
+        Makes sure `size` unread bytes are buffered. Returns False at the end of the stream.
+        """
+        if self._end - self._start >= size:
+            return True
+        self._reserve(size)
+        while self._end - self._start < size:
+            if self._pending is None:
+                try:
+                    chunk = await self._source.__anext__()
+                except StopAsyncIteration:
+                    return False
+                self._pending = memoryview(chunk)
+            pending = self._pending
+            n = min(len(pending), len(self._buffer) - self._end)
+            self._view[self._end:self._end + n] = pending[:n]
+            self._end += n
+            self._pending = pending[n:] if n < len(pending) else None
+        return True
+
+    async def read_header(self) -> bytes:
+        """
+        Reads and validates the FLV header. Called automatically by `tags`.
+
+        Returns:
+            bytes: The FLV header followed by PreviousTagSize0, ready to start an output file.
+
+        Raises:
+            FlvError: If the stream does not start with an FLV header.
+        """
+        if self.header is not None:
+            return self.header
+        if not await self._fill(9):
+            raise FlvError('Stream ended before the FLV header')
+        view = self._view
+        start = self._start
+        if bytes(view[start:start + 3]) != b'FLV':
+            raise FlvError('Not an FLV stream')
+        flags = view[start + 4]
+        data_offset = struct.unpack_from('>I', view, start + 5)[0]
+        if not await self._fill(data_offset + TAG_TRAILER_SIZE):
+            raise FlvError('Stream ended inside the FLV header')
+        self.has_audio = bool(flags & 0x04)
+        self.has_video = bool(flags & 0x01)
+        self.header = bytes(self._view[self._start:self._start + 9]) + b'\x00\x00\x00\x00'
+        self._start += data_offset + TAG_TRAILER_SIZE
+        self._position = data_offset + TAG_TRAILER_SIZE
+        return self.header
+
+    async def tags(self) -> AsyncIterator[FlvTag]:
+        """
+        Yields the tags of the stream until it ends.
+
+        Raises:
+            FlvError: If the header is invalid or the stream ends in the middle of a tag.
+        """
+        await self.read_header()
+        stats = self.stats
+        while True:
+            if not await self._fill(TAG_HEADER_SIZE):
+                if self._end != self._start:
+                    raise FlvError(f'Stream ended inside a tag header at offset {self._position}')
+                return
+            start = self._start
+            header = self._view[start:start + TAG_HEADER_SIZE]
+            tag_type = header[0] & 0x1F
+            size = header[1] << 16 | header[2] << 8 | header[3]
+            timestamp = header[7] << 24 | header[4] << 16 | header[5] << 8 | header[6]
+            total = TAG_HEADER_SIZE + size + TAG_TRAILER_SIZE
+            if not await self._fill(total):
+                raise FlvError(f'Stream ended inside a tag at offset {self._position}')
+            start = self._start
+            tag = FlvTag(tag_type, timestamp, self._position, self._view[start:start + total])
+            self._start += total
+            self._position += total
+
+            stats.tags += 1
+            if tag_type == TAG_VIDEO:
+                stats.video_bytes += size
+                if tag.is_keyframe:
+                    stats.keyframes += 1
+            elif tag_type == TAG_AUDIO:
+                stats.audio_bytes += size
+            else:
+                stats.script_bytes += size
+            if tag_type != TAG_SCRIPT:
+                stats.add_time(tag_type, timestamp)
+            yield tag
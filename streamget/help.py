@@ -19,7 +19,7 @@ def show_welcome_help():
     print("      streamget install-node --version 20.0.0 --path ./node")
 
     print("\nSupported Platforms:")
-    print(__all__[4:])
+    print([name for name in __all__ if name.endswith("LiveStream")])
     print("\nUsage:")
     print("  import asyncio")
     print("  from streamget import DouyinLiveStream")
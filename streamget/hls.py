@@ -0,0 +1,435 @@
+import asyncio
+import re
+import urllib.parse
+from collections.abc import AsyncIterator
+
+from .requests.async_http import async_req
+from .requests.session import Session, open_client
+
+# One attribute of an RFC 8216 attribute list: NAME=value, where value is a quoted string
+# (which may contain commas) or an unquoted token running to the next comma. After an opening
+# quote the lookbehind selects the quoted branch, so the value is captured without its quotes.
+_ATTRIBUTE = re.compile(r'([A-Z0-9-]+)="?((?<=")[^"]*|[^,]*)')
+
+
+def parse_attributes(text: str) -> dict[str, str]:
+    """
+    Tokenizes an attribute list such as `BANDWIDTH=1280000,CODECS="avc1.4d401f,mp4a.40.2"` in one pass.
+
+    Args:
+        text (str): The attribute list, i.e. the part of a tag after the colon.
+
+    Returns:
+        dict[str, str]: Attribute names mapped to their values, with quotes removed from quoted strings.
+    """
+    return dict(_ATTRIBUTE.findall(text))
+
+
+def _resolve(base_url: str | None, uri: str) -> str:
+    if not base_url or '://' in uri:
+        return uri
+    return urllib.parse.urljoin(base_url, uri)
+
+
+class Media:
+    """
+    A rendition declared by an `#EXT-X-MEDIA` tag (an alternative audio, video or subtitle track).
+    """
+    __slots__ = ('autoselect', 'channels', 'default', 'group_id', 'language', 'name', 'type', 'uri')
+
+    def __init__(self, attributes: dict[str, str], base_url: str | None = None):
+        self.type = attributes.get('TYPE', '')
+        self.group_id = attributes.get('GROUP-ID', '')
+        self.name = attributes.get('NAME', '')
+        self.language = attributes.get('LANGUAGE')
+        self.channels = attributes.get('CHANNELS')
+        self.default = attributes.get('DEFAULT') == 'YES'
+        self.autoselect = attributes.get('AUTOSELECT') == 'YES'
+        uri = attributes.get('URI')
+        self.uri = _resolve(base_url, uri) if uri else uri
+
+    def __repr__(self) -> str:
+        return f'Media(type={self.type!r}, group_id={self.group_id!r}, name={self.name!r}, uri={self.uri!r})'
+
+
+class Variant:
+    """
+    A variant stream declared by an `#EXT-X-STREAM-INF` tag and the URI line that follows it.
+    """
+    __slots__ = ('audio', 'average_bandwidth', 'bandwidth', 'codecs', 'frame_rate', 'resolution', 'subtitles',
+                 'uri', 'video')
+
+    def __init__(self, attributes: dict[str, str], uri: str):
+        self.uri = uri
+        self.bandwidth = int(attributes.get('BANDWIDTH') or 0)
+        average_bandwidth = attributes.get('AVERAGE-BANDWIDTH')
+        self.average_bandwidth = int(average_bandwidth) if average_bandwidth else None
+        self.resolution = attributes.get('RESOLUTION')
+        self.codecs = attributes.get('CODECS')
+        frame_rate = attributes.get('FRAME-RATE')
+        self.frame_rate = float(frame_rate) if frame_rate else None
+        self.audio = attributes.get('AUDIO')
+        self.video = attributes.get('VIDEO')
+        self.subtitles = attributes.get('SUBTITLES')
+
+    @property
+    def width(self) -> int | None:
+        return int(self.resolution.partition('x')[0]) if self.resolution else None
+
+    @property
+    def height(self) -> int | None:
+        return int(self.resolution.partition('x')[2]) if self.resolution else None
+
+    def __repr__(self) -> str:
+        return f'Variant(uri={self.uri!r}, bandwidth={self.bandwidth}, resolution={self.resolution!r})'
+
+
+class MasterPlaylist:
+    """
+    The variants and renditions of an HLS master playlist.
+
+    `#EXT-X-MEDIA` attribute lists are only tokenized when `media` is first read, since
+    most callers only need the variants.
+
+    Attributes:
+        variants (list[Variant]): Variant streams in playlist order.
+    """
+    __slots__ = ('_base_url', '_media', '_media_attributes', 'variants')
+
+    def __init__(self, variants: list[Variant], media_attributes: list[str], base_url: str | None = None):
+        self.variants = variants
+        self._media_attributes = media_attributes
+        self._base_url = base_url
+        self._media: list[Media] | None = None
+
+    @property
+    def media(self) -> list[Media]:
+        """
+        Renditions in playlist order.
+        """
+        if self._media is None:
+            self._media = [Media(parse_attributes(text), self._base_url) for text in self._media_attributes]
+        return self._media
+
+    def sorted_variants(self) -> list[Variant]:
+        """
+        Returns the variants sorted by bandwidth, highest first. Equal bandwidths keep playlist order.
+        """
+        return sorted(self.variants, key=lambda v: v.bandwidth, reverse=True)
+
+    def group(self, group_id: str | None, media_type: str | None = None) -> list[Media]:
+        """
+        Returns the renditions of a group, e.g. `playlist.group(variant.audio, 'AUDIO')`.
+        """
+        return [m for m in self.media if m.group_id == group_id and (media_type is None or m.type == media_type)]
+
+    def __repr__(self) -> str:
+        return f'MasterPlaylist(variants={self.variants!r}, media={self.media!r})'
+
+
+def parse_master_playlist(text: str, base_url: str | None = None) -> MasterPlaylist:
+    """
+    Parses an HLS master playlist.
+
+    Each `#EXT-X-STREAM-INF` tag is paired with the URI line that follows it, so a variant's
+    bandwidth can never be attached to another variant's URI. Relative URIs are resolved
+    against `base_url`.
+
+    Args:
+        text (str): The playlist text.
+        base_url (str | None): The URL the playlist was fetched from. Defaults to None.
+
+    Returns:
+        MasterPlaylist: The parsed playlist. A media playlist yields no variants.
+
+    Example:
+        >>> playlist = parse_master_playlist(resp, "https://example.com/live/master.m3u8")
+        >>> [v.uri for v in playlist.sorted_variants()]
+        ['https://example.com/live/1080p.m3u8', 'https://example.com/live/720p.m3u8']
+    """
+    variants = []
+    media = []
+    stream_inf = None
+    for line in text.splitlines():
+        if line.startswith('#'):
+            if line.startswith('#EXT-X-STREAM-INF:'):
+                stream_inf = parse_attributes(line[18:])
+            elif line.startswith('#EXT-X-MEDIA:'):
+                media.append(line[13:])
+        elif stream_inf is not None:
+            uri = line.strip()
+            if uri:
+                variants.append(Variant(stream_inf, _resolve(base_url, uri)))
+                stream_inf = None
+    return MasterPlaylist(variants, media, base_url)
+
+
+async def fetch_master_playlist(url: str, proxy_addr: str | None = None, headers: dict | None = None) -> MasterPlaylist:
+    """
+    Downloads and parses an HLS master playlist, resolving variant URIs against its URL.
+
+    Args:
+        url (str): The URL of the master playlist.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        headers (dict | None): Custom headers for the request. Defaults to None.
+
+    Returns:
+        MasterPlaylist: The parsed playlist.
+    """
+    resp = await async_req(url, proxy_addr=proxy_addr, headers=headers)
+    return parse_master_playlist(resp, url)
+
+
+class Segment:
+    """
+    A media segment of a media playlist.
+
+    Attributes:
+        uri (str): The segment URI, resolved against the playlist URL.
+        sequence (int): The media sequence number of the segment.
+        duration (float): The `#EXTINF` duration in seconds.
+        title (str): The `#EXTINF` title, usually empty.
+        discontinuity (bool): True if an `#EXT-X-DISCONTINUITY` tag precedes the segment.
+        program_date_time (str | None): The `#EXT-X-PROGRAM-DATE-TIME` of the segment, if any.
+        byterange (str | None): The `#EXT-X-BYTERANGE` of the segment, if any.
+        init_section (str | None): The URI of the `#EXT-X-MAP` initialization section that applies, if any.
+    """
+    __slots__ = ('byterange', 'discontinuity', 'duration', 'init_section', 'program_date_time', 'sequence', 'title',
+                 'uri')
+
+    def __init__(self, uri: str, sequence: int, duration: float, title: str = '', discontinuity: bool = False,
+                 program_date_time: str | None = None, byterange: str | None = None,
+                 init_section: str | None = None):
+        self.uri = uri
+        self.sequence = sequence
+        self.duration = duration
+        self.title = title
+        self.discontinuity = discontinuity
+        self.program_date_time = program_date_time
+        self.byterange = byterange
+        self.init_section = init_section
+
+    def __repr__(self) -> str:
+        return f'Segment(sequence={self.sequence}, duration={self.duration}, uri={self.uri!r})'
+
+
+class MediaPlaylist:
+    """
+    A media playlist: the segments of one rendition plus the tags that drive reloading.
+
+    Attributes:
+        target_duration (float): The `#EXT-X-TARGETDURATION` in seconds.
+        media_sequence (int): The `#EXT-X-MEDIA-SEQUENCE` of the first segment.
+        segments (list[Segment]): The segments that were materialized, in playlist order.
+        next_sequence (int): The sequence number the next segment appended to the playlist will have.
+        end_list (bool): True once the playlist carries `#EXT-X-ENDLIST`.
+        skipped_segments (int): Segments replaced by `#EXT-X-SKIP` in a delta update.
+        part_target (float | None): The `#EXT-X-PART-INF` part target duration of a low-latency playlist.
+        server_control (dict[str, str]): The `#EXT-X-SERVER-CONTROL` attributes.
+    """
+    __slots__ = ('end_list', 'media_sequence', 'next_sequence', 'part_target', 'segments', 'server_control',
+                 'skipped_segments', 'target_duration')
+
+    def __init__(self):
+        self.target_duration = 0.0
+        self.media_sequence = 0
+        self.segments: list[Segment] = []
+        self.next_sequence = 0
+        self.end_list = False
+        self.skipped_segments = 0
+        self.part_target: float | None = None
+        self.server_control: dict[str, str] = {}
+
+    @property
+    def can_block_reload(self) -> bool:
+        return self.server_control.get('CAN-BLOCK-RELOAD') == 'YES'
+
+    @property
+    def can_skip(self) -> bool:
+        return 'CAN-SKIP-UNTIL' in self.server_control
+
+    def __repr__(self) -> str:
+        return (f'MediaPlaylist(media_sequence={self.media_sequence}, target_duration={self.target_duration}, '
+                f'segments={len(self.segments)}, end_list={self.end_list})')
+
+
+def parse_media_playlist(text: str, base_url: str | None = None, after_sequence: int = -1) -> MediaPlaylist:
+    """
+    Parses an HLS media playlist, including low-latency delta updates.
+
+    Segments numbered `after_sequence` or lower are counted but not materialized, so a
+    watcher that reloads a sliding window only pays for the segments it has not seen.
+    Low-latency `#EXT-X-PART` tags are ignored; only full segments are returned.
+
+    Args:
+        text (str): The playlist text.
+        base_url (str | None): The URL the playlist was fetched from. Defaults to None.
+        after_sequence (int): The last sequence number already seen. Defaults to -1.
+
+    Returns:
+        MediaPlaylist: The parsed playlist.
+    """
+    playlist = MediaPlaylist()
+    sequence = None
+    duration = None
+    title = ''
+    discontinuity = False
+    program_date_time = None
+    byterange = None
+    init_section = None
+    segments = playlist.segments
+    for line in text.splitlines():
+        if line.startswith('#'):
+            tag, _, value = line.rstrip().partition(':')
+            if tag == '#EXTINF':
+                duration, _, title = value.partition(',')
+                duration = float(duration)
+            elif tag == '#EXT-X-MEDIA-SEQUENCE':
+                playlist.media_sequence = int(value)
+            elif tag == '#EXT-X-TARGETDURATION':
+                playlist.target_duration = float(value)
+            elif tag == '#EXT-X-DISCONTINUITY':
+                discontinuity = True
+            elif tag == '#EXT-X-PROGRAM-DATE-TIME':
+                program_date_time = value
+            elif tag == '#EXT-X-BYTERANGE':
+                byterange = value
+            elif tag == '#EXT-X-MAP':
+                uri = parse_attributes(value).get('URI')
+                init_section = _resolve(base_url, uri) if uri else None
+            elif tag == '#EXT-X-SKIP':
+                playlist.skipped_segments = int(parse_attributes(value).get('SKIPPED-SEGMENTS') or 0)
+            elif tag == '#EXT-X-SERVER-CONTROL':
+                playlist.server_control = parse_attributes(value)
+            elif tag == '#EXT-X-PART-INF':
+                part_target = parse_attributes(value).get('PART-TARGET')
+                playlist.part_target = float(part_target) if part_target else None
+            elif tag == '#EXT-X-ENDLIST':
+                playlist.end_list = True
+            continue
+        if duration is None:
+            continue
+        uri = line.strip()
+        if not uri:
+            continue
+        if sequence is None:
+            sequence = playlist.media_sequence + playlist.skipped_segments
+        if sequence > after_sequence:
+            segments.append(Segment(_resolve(base_url, uri), sequence, duration, title, discontinuity,
+                                    program_date_time, byterange, init_section))
+        sequence += 1
+        duration = None
+        title = ''
+        discontinuity = False
+        program_date_time = None
+        byterange = None
+    if sequence is None:
+        sequence = playlist.media_sequence + playlist.skipped_segments
+    playlist.next_sequence = sequence
+    return playlist
+
+
+class HlsWatcher:
+    """
+    Follows a live media playlist and yields each segment once, as soon as it is listed.
+
+    Reloads follow RFC 8216: after a load that brought new segments the next one starts a
+    target duration later, otherwise half a target duration later. When the server
+    advertises `CAN-BLOCK-RELOAD=YES` (Low-Latency HLS), each reload instead asks for the
+    next segment with `_HLS_msn` and the server holds the request until it exists, adding
+    `_HLS_skip=YES` for delta updates when `CAN-SKIP-UNTIL` is advertised. A blocking reload
+    answered without a new segment is retried no sooner than a part target (at least 0.5
+    seconds) later. Segments already seen are never materialized again.
+
+    All reloads go through one HTTP client: the pooled client of the active `Session`, or a
+    client owned by the watcher for its lifetime, so connections are kept alive between
+    reloads. If `url` turns out to be a master playlist, the variant with the highest
+    bandwidth is followed.
+
+    Args:
+        url (str): The media playlist URL, e.g. `StreamData.record_url`.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        headers (dict | None): Custom headers for the requests. Defaults to None.
+        low_latency (bool): If True, uses blocking reloads when the server supports them. Defaults to True.
+        timeout (int): The request timeout in seconds. Defaults to 20.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
+
+    Example:
+        >>> async def main():
+        ...     async for segment in HlsWatcher(stream_obj.record_url):
+        ...         print(segment.sequence, segment.uri)
+        >>> asyncio.run(main())
+    """
+    def __init__(self, url: str, proxy_addr: str | None = None, headers: dict | None = None, low_latency: bool = True,
+                 timeout: int = 20, session: Session | None = None):
+        self.url = url
+        self.proxy_addr = proxy_addr
+        self.headers = headers or {}
+        self.low_latency = low_latency
+        self.timeout = timeout
+        self.session = session
+        self.playlist: MediaPlaylist | None = None
+        self.last_sequence = -1
+        self.reloads = 0
+
+    def __aiter__(self) -> AsyncIterator[Segment]:
+        return self.segments()
+
+    def _blocking(self) -> bool:
+        return self.low_latency and self.playlist is not None and self.playlist.can_block_reload
+
+    async def _load(self, client) -> MediaPlaylist:
+        url = self.url
+        timeout = self.timeout
+        if self._blocking():
+            params = {'_HLS_msn': self.playlist.next_sequence}
+            if self.playlist.can_skip:
+                params['_HLS_skip'] = 'YES'
+            url += ('&' if '?' in url else '?') + urllib.parse.urlencode(params)
+            # The server may hold a blocking request for up to three target durations
+            timeout = max(timeout, self.playlist.target_duration * 3 + 1)
+        response = await client.get(url, headers=self.headers, follow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+        self.reloads += 1
+        text = response.text
+        base_url = str(response.url)
+        if '#EXT-X-STREAM-INF:' in text:
+            variants = parse_master_playlist(text, base_url).sorted_variants()
+            if not variants:
+                raise ValueError(f'Master playlist without variants: {self.url}')
+            self.url = variants[0].uri
+            return await self._load(client)
+
+        playlist = parse_media_playlist(text, base_url, self.last_sequence)
+        if playlist.next_sequence <= self.last_sequence and not playlist.skipped_segments:
+            # Sequence numbers went backwards: the stream restarted, so everything listed is new
+            self.last_sequence = -1
+            playlist = parse_media_playlist(text, base_url)
+        return playlist
+
+    async def segments(self) -> AsyncIterator[Segment]:
+        """
+        Yields new segments until the playlist ends with `#EXT-X-ENDLIST`.
+
+        Raises:
+            httpx.HTTPError: If a reload fails.
+        """
+        loop = asyncio.get_running_loop()
+        async with open_client(self.proxy_addr, timeout=self.timeout, session=self.session) as client:
+            while True:
+                started = loop.time()
+                playlist = await self._load(client)
+                self.playlist = playlist
+                for segment in playlist.segments:
+                    self.last_sequence = segment.sequence
+                    yield segment
+                if playlist.end_list:
+                    return
+                if self._blocking():
+                    if playlist.segments:
+                        continue
+                    # The server answered without the requested segment; don't hammer it
+                    interval = playlist.part_target or 0.5
+                else:
+                    interval = playlist.target_duration if playlist.segments else playlist.target_duration / 2
+                await asyncio.sleep(max(0.0, started + max(interval, 0.5) - loop.time()))
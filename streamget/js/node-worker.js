@@ -0,0 +1,74 @@
+/**
+ * Long-lived signing worker managed by streamget.node_worker.
+ *
+ * Reads one JSON request per line from stdin:
+ *     {"id": 1, "script": "taobao-sign.js", "function": "sign", "args": ["..."]}
+ * and writes one JSON response per line to stdout:
+ *     {"id": 1, "result": "..."}  or  {"id": 1, "error": "..."}
+ *
+ * Scripts are compiled once and re-run on every call, so each call sees fresh
+ * top-level state exactly like a one-off execjs.compile(...).call(...).
+ */
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const vm = require('vm');
+const { createRequire } = require('module');
+
+const scriptDir = __dirname;
+const stdout = process.stdout;
+
+// Some scripts print debug output; stdout is reserved for responses.
+console.log = console.info = console.debug = console.error;
+
+const compiled = new Map();
+
+function load(name) {
+    let entry = compiled.get(name);
+    if (entry === undefined) {
+        const filename = path.join(scriptDir, path.basename(name));
+        const code = fs.readFileSync(filename, 'utf8');
+        // Direct eval inside the wrapper resolves top-level functions whether or not they are exported.
+        const source = '(function (exports, require, module, __filename, __dirname, __function, __args) {\n' +
+            code + '\n;return eval(__function).apply(this, __args);\n})';
+        entry = {
+            filename: filename,
+            run: new vm.Script(source, { filename: filename }).runInThisContext(),
+            require: createRequire(filename)
+        };
+        compiled.set(name, entry);
+    }
+    return entry;
+}
+
+function reply(message) {
+    stdout.write(JSON.stringify(message) + '\n');
+}
+
+async function handle(request) {
+    try {
+        const entry = load(request.script);
+        const module = { exports: {} };
+        const result = await entry.run.call(
+            globalThis, module.exports, entry.require, module, entry.filename, scriptDir,
+            request.function, request.args || []
+        );
+        reply({ id: request.id, result: result === undefined ? null : result });
+    } catch (err) {
+        reply({ id: request.id, error: String((err && err.stack) || err) });
+    }
+}
+
+for (const name of process.argv.slice(2)) {
+    try {
+        load(name);
+    } catch (err) {
+        console.error(`failed to preload ${name}: ${err}`);
+    }
+}
+
+readline.createInterface({ input: process.stdin }).on('line', line => {
+    if (line.trim()) {
+        handle(JSON.parse(line));
+    }
+});
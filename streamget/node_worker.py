@@ -0,0 +1,218 @@
+import asyncio
+import atexit
+import concurrent.futures
+import itertools
+import json
+import subprocess
+import threading
+
+from . import JS_SCRIPT_PATH
+
+WORKER_SCRIPT = JS_SCRIPT_PATH / 'node-worker.js'
+
+# Signing scripts compiled by every worker at start-up. Other scripts are compiled on first call.
+PRELOAD_SCRIPTS = ('haixiu.js', 'liveme.js', 'taobao-sign.js', 'x-bogus.js')
+
+
+class NodeWorkerError(RuntimeError):
+    """
+    Raised when a script fails inside the Node.js worker or the worker cannot be reached.
+    """
+
+
+class NodeWorkerExitedError(NodeWorkerError):
+    """
+    Raised for calls that were in flight when their worker process exited.
+    """
+
+
+class NodeWorker:
+    """
+    A single long-lived Node.js process serving script calls over line-delimited JSON.
+
+    Calls are written to the worker's stdin and matched to responses by id on a reader
+    thread, so any number of calls can be in flight and the worker survives across event
+    loops. The process is started on first use and restarted on the next call after it
+    exits.
+
+    Args:
+        node (str): The Node.js executable. Defaults to "node" on PATH.
+    """
+    def __init__(self, node: str = 'node'):
+        self.node = node
+        self._process: subprocess.Popen | None = None
+        self._pending: dict[int, concurrent.futures.Future] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def _start(self) -> subprocess.Popen:
+        try:
+            process = subprocess.Popen(
+                [self.node, str(WORKER_SCRIPT), *PRELOAD_SCRIPTS],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding='utf-8',
+                bufsize=1
+            )
+        except OSError as e:
+            raise NodeWorkerError(f'Failed to start Node.js ({e}). Please check if the Node.js environment') from e
+        self._pending = {}
+        threading.Thread(target=self._read, args=(process, self._pending), daemon=True).start()
+        return process
+
+    def _read(self, process: subprocess.Popen, pending: dict[int, concurrent.futures.Future]) -> None:
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+            future = pending.pop(response.get('id'), None)
+            if future is None or future.done():
+                continue
+            try:
+                if 'error' in response:
+                    future.set_exception(NodeWorkerError(response['error']))
+                else:
+                    future.set_result(response.get('result'))
+            except concurrent.futures.InvalidStateError:
+                pass
+
+        process.wait()
+        with self._lock:
+            if self._process is process:
+                self._process = None
+            futures = list(pending.values())
+            pending.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(NodeWorkerExitedError(f'Node.js worker exited with code {process.returncode}'))
+
+    def submit(self, script: str, function: str, args: tuple | list = ()) -> concurrent.futures.Future:
+        """
+        Sends a call to the worker, starting or restarting the process if needed.
+
+        Args:
+            script (str): File name of the script in `streamget/js`.
+            function (str): Name of the top-level function to call.
+            args (tuple | list): JSON-serializable arguments.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the function's return value.
+        """
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = self._start()
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            message = json.dumps({'id': request_id, 'script': script, 'function': function, 'args': list(args)})
+            try:
+                self._process.stdin.write(message + '\n')
+                self._process.stdin.flush()
+            except OSError as e:
+                self._pending.pop(request_id, None)
+                future.set_exception(NodeWorkerExitedError(f'Failed to write to Node.js worker: {e}'))
+        return future
+
+    def kill(self) -> None:
+        """
+        Stops the process. In-flight calls fail with `NodeWorkerExitedError`.
+        """
+        with self._lock:
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+
+
+class NodeWorkerPool:
+    """
+    A fixed-size pool of `NodeWorker` processes. Each call goes to the least busy worker.
+
+    Args:
+        size (int): Number of Node.js processes. Defaults to 2.
+        node (str): The Node.js executable. Defaults to "node" on PATH.
+        timeout (float): Seconds to wait for a call before the worker is restarted. Defaults to 10.
+    """
+    def __init__(self, size: int = 2, node: str = 'node', timeout: float = 10):
+        if size < 1:
+            raise ValueError('pool size must be at least 1')
+        self.workers = [NodeWorker(node) for _ in range(size)]
+        self.timeout = timeout
+
+    async def call(self, script: str, function: str, *args):
+        """
+        Calls a top-level function of a script in `streamget/js` and returns its result.
+
+        A call that was in flight when its worker crashed is retried once on a fresh process.
+
+        Args:
+            script (str): File name of the script, e.g. "taobao-sign.js".
+            function (str): Name of the function to call, e.g. "sign".
+            *args: JSON-serializable arguments.
+
+        Raises:
+            NodeWorkerError: If the script raises, times out, or Node.js is unavailable.
+        """
+        for attempt in range(2):
+            worker = min(self.workers, key=lambda w: w.in_flight)
+            future = worker.submit(script, function, args)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+            except NodeWorkerExitedError:
+                if attempt:
+                    raise
+            except asyncio.TimeoutError:
+                worker.kill()
+                raise NodeWorkerError(f'{script} {function}() timed out after {self.timeout}s') from None
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.kill()
+
+
+_default_pool: NodeWorkerPool | None = None
+
+
+def get_pool() -> NodeWorkerPool:
+    """
+    Returns the shared worker pool, creating it on first use.
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = NodeWorkerPool()
+    return _default_pool
+
+
+def set_pool_size(size: int, timeout: float = 10) -> None:
+    """
+    Replaces the shared worker pool with one of `size` processes.
+
+    Args:
+        size (int): Number of Node.js processes.
+        timeout (float): Seconds to wait for a call before the worker is restarted. Defaults to 10.
+    """
+    global _default_pool
+    if _default_pool is not None:
+        _default_pool.close()
+    _default_pool = NodeWorkerPool(size, timeout=timeout)
+
+
+async def call_js(script: str, function: str, *args):
+    """
+    Calls a function of a script in `streamget/js` on the shared worker pool.
+
+    Example:
+        >>> sign = await call_js('taobao-sign.js', 'sign', pre_sign_str)
+    """
+    return await get_pool().call(script, function, *args)
+
+
+@atexit.register
+def _close_default_pool() -> None:
+    if _default_pool is not None:
+        _default_pool.close()
@@ -13,6 +13,8 @@ class BaiduLiveStream(BaseLiveStream):
     """
         A class for fetching and processing Baidu live stream information.
     """
+    HOSTS = ("live.baidu.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
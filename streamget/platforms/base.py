@@ -1,13 +1,18 @@
-import re
 import urllib.parse
 
-from ..requests.async_http import async_req
+from ..data import LiveStatus
+from ..hls import fetch_master_playlist
+from ..requests.async_http import race_urls
 
 
 class BaseLiveStream:
     """
     Base class for live stream fetchers.
     """
+    # Host suffixes served by `fetch_web_stream_data` / `fetch_app_stream_data`, used by `streamget.resolve`.
+    HOSTS: tuple[str, ...] = ()
+    APP_HOSTS: tuple[str, ...] = ()
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         """
         Initializes a new instance of BaseLiveStream.
@@ -19,6 +24,29 @@ class BaseLiveStream:
         self.proxy_addr = proxy_addr
         self.cookies = cookies
 
+    async def fetch_live_status(self, url: str) -> LiveStatus:
+        """
+        Fetches whether a room is live.
+
+        Platforms with a cheap status endpoint override this to skip stream URL resolution.
+        The default resolves the room in full with the method `streamget.resolve` would pick.
+
+        Args:
+            url (str): The room URL.
+
+        Returns:
+            LiveStatus: The live state of the room.
+        """
+        host = urllib.parse.urlsplit(url.strip()).hostname or ''
+        is_app = any(host == suffix or host.endswith('.' + suffix) for suffix in self.APP_HOSTS)
+        if is_app or not hasattr(self, 'fetch_web_stream_data'):
+            json_data = await self.fetch_app_stream_data(url)
+        else:
+            json_data = await self.fetch_web_stream_data(url)
+        stream = await self.fetch_stream_url(json_data)
+        return LiveStatus(platform=stream.platform, live_url=stream.live_url or url, is_live=bool(stream.is_live),
+                          anchor_name=stream.anchor_name, title=stream.title)
+
     def _get_mobile_headers(self) -> dict:
         """
         Returns headers for mobile requests.
@@ -68,6 +96,32 @@ class BaseLiveStream:
             quality_str = list(QUALITY_MAPPING.keys())[int(quality_str)]
         return quality_str, QUALITY_MAPPING.get(quality_str, 0)
 
+    async def probe_quality(self, url_list: list[str], quality_index: int, headers: dict | None = None,
+                            timeout: float = 3, http2: bool = True) -> tuple[int, float | None]:
+        """
+        Picks the closest working quality, probing all candidates concurrently with `race_urls`.
+
+        The requested quality is preferred, then the lower ones from best to worst, then the
+        higher ones.
+
+        Args:
+            url_list (list[str]): One URL per quality, best first.
+            quality_index (int): The index of the requested quality.
+            headers (dict | None): Headers for the probe requests. Defaults to None.
+            timeout (float): Overall probing deadline in seconds. Defaults to 3.
+            http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+
+        Returns:
+            tuple[int, float | None]: The index of the chosen quality and its probe latency in
+            seconds, or the requested index and None if nothing answered in time.
+        """
+        order = [quality_index, *range(quality_index + 1, len(url_list)), *range(quality_index - 1, -1, -1)]
+        chosen, latencies = await race_urls([url_list[i] for i in order], proxy_addr=self.proxy_addr,
+                                            headers=headers, timeout=timeout, http2=http2)
+        if chosen is None:
+            return quality_index, None
+        return order[chosen], latencies[chosen]
+
     @staticmethod
     def parse_url(url: str) -> dict:
         """
@@ -159,19 +213,8 @@ class BaseLiveStream:
             headers (dict | None): Custom headers for the request. Defaults to None.
 
         Returns:
-            List[str]: A list of play URLs sorted by bandwidth (highest first).
-        """
-        resp = await async_req(m3u8, proxy_addr=proxy, headers=headers)
-        play_url_list = []
-        for i in resp.split('\n'):
-            if i.startswith('https://'):
-                play_url_list.append(i.strip())
-        if not play_url_list:
-            for i in resp.split('\n'):
-                if i.strip().endswith('m3u8'):
-                    play_url_list.append(i.strip())
-        bandwidth_pattern = re.compile(r'BANDWIDTH=(\d+)')
-        bandwidth_list = bandwidth_pattern.findall(resp)
-        url_to_bandwidth = {url: int(bandwidth) for bandwidth, url in zip(bandwidth_list, play_url_list)}
-        play_url_list = sorted(play_url_list, key=lambda url: url_to_bandwidth[url], reverse=True)
-        return play_url_list
+            List[str]: A list of play URLs sorted by bandwidth (highest first). Relative URIs are
+            resolved against the M3U8 URL.
+        """
+        playlist = await fetch_master_playlist(m3u8, proxy_addr=proxy, headers=headers)
+        return [variant.uri for variant in playlist.sorted_variants()]
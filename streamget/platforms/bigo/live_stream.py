@@ -10,6 +10,8 @@ class BigoLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Bigo live stream information.
     """
+    HOSTS = ("bigo.tv", "bigovideo.tv")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
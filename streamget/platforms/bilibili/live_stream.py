@@ -1,8 +1,9 @@
+import asyncio
 import json
 import urllib.parse
 from operator import itemgetter
 
-from ...data import StreamData, wrap_stream
+from ...data import LiveStatus, StreamData, wrap_stream
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -11,6 +12,12 @@ class BilibiliLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Bilibili live stream information.
     """
+    HOSTS = ("live.bilibili.com",)
+    # Quality requested when prefetching Room/playUrl in fetch_web_stream_data
+    PLAY_URL_QN = '10000'
+    # Room ids per getRoomBaseInfo request in fetch_many_status
+    STATUS_BATCH_SIZE = 50
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
@@ -43,9 +50,47 @@ class BilibiliLiveStream(BaseLiveStream):
         title = room_info['data']['room_info']['title'] if room_info.get('data') else ''
         return title
 
-    async def get_bilibili_stream_data(self, url: str, qn: str = '10000', platform: str = 'web') -> str | None:
+    async def _get_room_play_info(self, room_id: str, qn: str = '10000') -> dict:
+        params = {
+            "room_id": room_id,
+            "protocol": "0,1",
+            "format": "0,1,2",
+            "codec": "0,1,2",
+            "qn": qn,
+            "platform": "web",
+            "ptype": "8",
+            "dolby": "5",
+            "panorama": "1",
+            "hdr_type": "0,1"
+        }
+
+        # 此接口因网页上有限制, 需要配置登录后的cookie才能获取最高画质
+        encode_params = urllib.parse.urlencode(params)
+        api = f'https://api.live.bilibili.com/xlive/web-room/v2/index/getRoomPlayInfo?{encode_params}'
+        json_str = await async_req(api, proxy_addr=self.proxy_addr, headers=self.pc_headers)
+        return json.loads(json_str)
 
-        room_id = url.split('?')[0].rsplit('/', maxsplit=1)[1]
+    @staticmethod
+    def _parse_room_play_info(json_data: dict, qn: str = '10000') -> str | None:
+        if json_data['data']['live_status'] == 0:
+            print("The anchor did not start broadcasting.")
+            return
+        playurl_info = json_data['data']['playurl_info']
+        format_list = playurl_info['playurl']['stream'][0]['format']
+        stream_data_list = format_list[0]['codec']
+        sorted_stream_list = sorted(stream_data_list, key=itemgetter("current_qn"), reverse=True)
+        # qn: 30000=杜比 20000=4K 10000=原画 400=蓝光 250=超清 150=高清 80=流畅
+        video_quality_options = {'10000': 0, '400': 1, '250': 2, '150': 3, '80': 4}
+        qn_count = len(sorted_stream_list)
+        select_stream_index = min(video_quality_options[qn], qn_count - 1)
+        stream_data: dict = sorted_stream_list[select_stream_index]
+        base_url = stream_data['base_url']
+        host = stream_data['url_info'][0]['host']
+        extra = stream_data['url_info'][0]['extra']
+        m3u8_url = host + base_url + extra
+        return m3u8_url
+
+    async def _get_play_url(self, room_id: str, qn: str = '10000', platform: str = 'web') -> dict:
         params = {
             'cid': room_id,
             'qn': qn,
@@ -53,48 +98,39 @@ class BilibiliLiveStream(BaseLiveStream):
         }
         play_api = f'https://api.live.bilibili.com/room/v1/Room/playUrl?{urllib.parse.urlencode(params)}'
         json_str = await async_req(play_api, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-        json_data = json.loads(json_str)
+        return json.loads(json_str)
+
+    async def get_bilibili_stream_data(
+            self, url: str, qn: str = '10000', platform: str = 'web', play_url_data: dict | None = None,
+            backup_url_list: list | None = None) -> str | None:
+        """
+        Returns the play URL of a room.
+
+        The FLV URL is taken from `Room/playUrl`, preferring the `d1--cn-gotcha` CDN. If that API
+        fails, the URL is taken from `getRoomPlayInfo` instead.
+
+        Args:
+            url (str): The room URL.
+            qn (str): The Bilibili quality number. Defaults to '10000'.
+            platform (str): The play platform. Defaults to 'web'.
+            play_url_data (dict | None): An already fetched `Room/playUrl` payload requested with the
+                same `qn` and `platform`, to skip that request.
+            backup_url_list (list | None): If given, the other CDN URLs `Room/playUrl` returned are appended.
+
+        Returns:
+            str | None: The play URL, or None if the room is not live.
+        """
+        room_id = url.split('?')[0].rsplit('/', maxsplit=1)[1]
+        json_data = play_url_data or await self._get_play_url(room_id, qn, platform)
         if json_data and json_data['code'] == 0:
-            for i in json_data['data']['durl']:
-                if 'd1--cn-gotcha' in i['url']:
-                    return i['url']
-            return json_data['data']['durl'][-1]['url']
+            durl_list = [i['url'] for i in json_data['data']['durl']]
+            play_url = next((i for i in durl_list if 'd1--cn-gotcha' in i), durl_list[-1])
+            if backup_url_list is not None:
+                backup_url_list += [i for i in durl_list if i != play_url]
+            return play_url
         else:
-            params = {
-                "room_id": room_id,
-                "protocol": "0,1",
-                "format": "0,1,2",
-                "codec": "0,1,2",
-                "qn": qn,
-                "platform": "web",
-                "ptype": "8",
-                "dolby": "5",
-                "panorama": "1",
-                "hdr_type": "0,1"
-            }
-
-            # 此接口因网页上有限制, 需要配置登录后的cookie才能获取最高画质
-            encode_params = urllib.parse.urlencode(params)
-            api = f'https://api.live.bilibili.com/xlive/web-room/v2/index/getRoomPlayInfo?{encode_params}'
-            json_str = await async_req(api, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-            json_data = json.loads(json_str)
-            if json_data['data']['live_status'] == 0:
-                print("The anchor did not start broadcasting.")
-                return
-            playurl_info = json_data['data']['playurl_info']
-            format_list = playurl_info['playurl']['stream'][0]['format']
-            stream_data_list = format_list[0]['codec']
-            sorted_stream_list = sorted(stream_data_list, key=itemgetter("current_qn"), reverse=True)
-            # qn: 30000=杜比 20000=4K 10000=原画 400=蓝光 250=超清 150=高清 80=流畅
-            video_quality_options = {'10000': 0, '400': 1, '250': 2, '150': 3, '80': 4}
-            qn_count = len(sorted_stream_list)
-            select_stream_index = min(video_quality_options[qn], qn_count - 1)
-            stream_data: dict = sorted_stream_list[select_stream_index]
-            base_url = stream_data['base_url']
-            host = stream_data['url_info'][0]['host']
-            extra = stream_data['url_info'][0]['extra']
-            m3u8_url = host + base_url + extra
-            return m3u8_url
+            json_data = await self._get_room_play_info(room_id, qn)
+            return self._parse_room_play_info(json_data, qn)
 
     async def fetch_web_stream_data(self, url: str, process_data: bool = True) -> dict:
         """
@@ -106,27 +142,137 @@ class BilibiliLiveStream(BaseLiveStream):
 
         Returns:
             dict: A dictionary containing anchor name, live status, room URL, and title.
+
+        Note:
+            The title is fetched concurrently with the room_init -> Master/info chain. For live
+            rooms the original quality `Room/playUrl` payload is fetched alongside the anchor
+            info and returned under `play_url_data`, so `fetch_stream_url` needs no further request.
         """
         try:
             room_id = url.split('?')[0].rsplit('/', maxsplit=1)[1]
-            json_str = await async_req(f'https://api.live.bilibili.com/room/v1/Room/room_init?id={room_id}',
-                                       proxy_addr=self.proxy_addr, headers=self.pc_headers)
-            room_info = json.loads(json_str)
-            uid = room_info['data']['uid']
-            live_status = True if room_info['data']['live_status'] == 1 else False
-
-            api = f'https://api.live.bilibili.com/live_user/v1/Master/info?uid={uid}'
-            json_str2 = await async_req(api, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-            anchor_info = json.loads(json_str2)
-            anchor_name = anchor_info['data']['info']['uname']
-
-            title = await self._get_bilibili_room_info_h5(url)
+
+            async def get_room_detail():
+                json_str = await async_req(f'https://api.live.bilibili.com/room/v1/Room/room_init?id={room_id}',
+                                           proxy_addr=self.proxy_addr, headers=self.pc_headers)
+                room_info = json.loads(json_str)
+                uid = room_info['data']['uid']
+                _live_status = True if room_info['data']['live_status'] == 1 else False
+
+                async def get_anchor_name():
+                    api = f'https://api.live.bilibili.com/live_user/v1/Master/info?uid={uid}'
+                    json_str2 = await async_req(api, proxy_addr=self.proxy_addr, headers=self.pc_headers)
+                    anchor_info = json.loads(json_str2)
+                    return anchor_info['data']['info']['uname']
+
+                async def get_play_url():
+                    if not _live_status:
+                        return None
+                    try:
+                        return await self._get_play_url(room_id, self.PLAY_URL_QN)
+                    except Exception:
+                        # fetch_stream_url falls back to requesting the play URL itself
+                        return None
+
+                _anchor_name, _play_url_data = await asyncio.gather(get_anchor_name(), get_play_url())
+                return _anchor_name, _live_status, _play_url_data
+
+            (anchor_name, live_status, play_url_data), title = await asyncio.gather(
+                get_room_detail(), self._get_bilibili_room_info_h5(url)
+            )
             live_url = 'https://live.bilibili.com/' + str(room_id)
-            return {"anchor_name": anchor_name, "live_status": live_status, "room_url": live_url, "title": title}
+            result = {"anchor_name": anchor_name, "live_status": live_status, "room_url": live_url, "title": title}
+            if play_url_data:
+                result["play_url_data"] = play_url_data
+            return result
         except Exception as e:
             print(e)
             return {"anchor_name": '', "live_status": False, "room_url": url}
 
+    async def fetch_live_status(self, url: str) -> LiveStatus:
+        """
+        Fetches whether a room is live with a single `room_init` request.
+
+        Args:
+            url (str): The room URL.
+
+        Returns:
+            LiveStatus: The live state of the room. `room_init` carries no anchor name or title.
+            Rooms `room_init` rejects, e.g. unknown or locked ones, are reported offline.
+        """
+        room_id = url.split('?')[0].rsplit('/', maxsplit=1)[1]
+        json_str = await async_req(f'https://api.live.bilibili.com/room/v1/Room/room_init?id={room_id}',
+                                   proxy_addr=self.proxy_addr, headers=self.pc_headers)
+        json_data = json.loads(json_str)
+        room_info = json_data.get('data')
+        if json_data.get('code') != 0 or not room_info:
+            return LiveStatus(platform="哔哩哔哩", live_url=url, is_live=False)
+        return LiveStatus(platform="哔哩哔哩", live_url=f"https://live.bilibili.com/{room_info['room_id']}",
+                          is_live=room_info['live_status'] == 1)
+
+    @classmethod
+    async def fetch_many_status(
+            cls,
+            room_urls: list[str],
+            proxy_addr: str | None = None,
+            cookies: str | None = None,
+            concurrency: int = 4
+    ) -> list[LiveStatus]:
+        """
+        Fetches anchor name, title and live state of many rooms with bulk `getRoomBaseInfo` requests.
+
+        Room ids are sent `STATUS_BATCH_SIZE` per request, at most `concurrency` requests at a
+        time, so a sweep of thousands of rooms takes tens of requests. Short room ids are
+        matched as well as real ones.
+
+        Args:
+            room_urls (list[str]): The room URLs.
+            proxy_addr (str | None): The proxy address to use. Defaults to None.
+            cookies (str | None): The cookies to include in requests. Defaults to None.
+            concurrency (int): Maximum number of requests in flight. Defaults to 4.
+
+        Returns:
+            list[LiveStatus]: The state of each room, in the order of `room_urls`. Rooms the API
+            does not know, or whose batch failed, have `is_live=None`.
+
+        Example:
+            >>> statuses = asyncio.run(BilibiliLiveStream.fetch_many_status(room_urls))
+            >>> live_urls = [status.live_url for status in statuses if status.is_live]
+        """
+        live = cls(proxy_addr, cookies)
+        room_ids = [url.split('?')[0].rstrip('/').rsplit('/', maxsplit=1)[-1] for url in room_urls]
+        unique_ids = list(dict.fromkeys(room_ids))
+        limit = asyncio.Semaphore(concurrency)
+
+        async def fetch_batch(batch: list[str]) -> dict:
+            params = [('req_biz', 'web_room_componet')] + [('room_ids', room_id) for room_id in batch]
+            api = ('https://api.live.bilibili.com/xlive/web-room/v1/index/getRoomBaseInfo?'
+                   + urllib.parse.urlencode(params))
+            async with limit:
+                json_str = await async_req(api, proxy_addr=live.proxy_addr, headers=live.pc_headers)
+            try:
+                return json.loads(json_str)['data']['by_room_ids'] or {}
+            except (ValueError, KeyError, TypeError):
+                return {}
+
+        batches = [unique_ids[i:i + cls.STATUS_BATCH_SIZE] for i in range(0, len(unique_ids), cls.STATUS_BATCH_SIZE)]
+        rooms = {}
+        for result in await asyncio.gather(*map(fetch_batch, batches)):
+            for room in result.values():
+                rooms[str(room['room_id'])] = room
+                if room.get('short_id'):
+                    rooms[str(room['short_id'])] = room
+
+        statuses = []
+        for url, room_id in zip(room_urls, room_ids):
+            room = rooms.get(room_id)
+            if room is None:
+                statuses.append(LiveStatus(platform="哔哩哔哩", live_url=url))
+                continue
+            statuses.append(LiveStatus(platform="哔哩哔哩", live_url=f"https://live.bilibili.com/{room['room_id']}",
+                                       is_live=room['live_status'] == 1, anchor_name=room.get('uname'),
+                                       title=room.get('title')))
+        return statuses
+
     async def fetch_stream_url(self, json_data: dict, video_quality: str | int | None = None) -> StreamData:
         """
         Fetches the stream URL for a live room and wraps it into a StreamData object.
@@ -162,8 +308,11 @@ class BilibiliLiveStream(BaseLiveStream):
                 video_quality = video_quality.upper()
 
         select_quality = video_quality_options.get(video_quality, '10000')
+        play_url_data = json_data.get('play_url_data') if select_quality == self.PLAY_URL_QN else None
+        backup_url_list = []
         play_url = await self.get_bilibili_stream_data(
-            room_url, qn=select_quality, platform='web')
+            room_url, qn=select_quality, platform='web', play_url_data=play_url_data,
+            backup_url_list=backup_url_list)
         data = {
             'platform': platform,
             'anchor_name': json_data['anchor_name'],
@@ -171,6 +320,7 @@ class BilibiliLiveStream(BaseLiveStream):
             'title': json_data['title'],
             'quality': video_quality,
             'record_url': play_url,
-            'live_url': room_url
+            'live_url': room_url,
+            'extra': {'backup_url_list': backup_url_list}
         }
         return wrap_stream(data)
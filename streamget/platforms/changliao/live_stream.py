@@ -11,6 +11,8 @@ class ChangliaoLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Changliao live stream information.
     """
+    HOSTS = ("tlclw.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -6,6 +6,8 @@ from ..base import BaseLiveStream
 
 
 class ChzzkLiveStream(BaseLiveStream):
+    HOSTS = ("chzzk.naver.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -46,8 +48,6 @@ class ChzzkLiveStream(BaseLiveStream):
             play_data = json.loads(live_data['livePlaybackJson'])
             m3u8_url = play_data['media'][0]['path']
             m3u8_url_list = await self.get_play_url_list(m3u8_url, proxy=self.proxy_addr, headers=self.pc_headers)
-            prefix = m3u8_url.split('?')[0].rsplit('/', maxsplit=1)[0]
-            m3u8_url_list = [prefix + '/' + i for i in m3u8_url_list]
             result |= {"is_live": True, "m3u8_url": m3u8_url, "play_url_list": m3u8_url_list}
         return result
 
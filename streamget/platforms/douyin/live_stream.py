@@ -5,7 +5,8 @@ import urllib.parse
 from deprecated import deprecated
 
 from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req, get_response_status
+from ...extractor import load_js_string, load_json
+from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 from .ab_sign import ab_sign
 from .utils import DouyinUtils, UnsupportedUrlError
@@ -15,6 +16,9 @@ class DouyinLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Douyin live stream information.
     """
+    HOSTS = ("live.douyin.com",)
+    APP_HOSTS = ("v.douyin.com", "www.douyin.com")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None, stream_orientation: int | None = 1):
         super().__init__(proxy_addr, cookies)
         self.stream_orientation = stream_orientation
@@ -149,24 +153,40 @@ class DouyinLiveStream(BaseLiveStream):
                 room_data['stream_url']['flv_pull_url'] = {**origin_flv, **flv_pull_url}
                 return room_data
 
+    @staticmethod
+    def _find_dict_with_key(data, key: str) -> dict | None:
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                if key in item:
+                    return item
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, list):
+                stack.extend(reversed(item))
+        return None
+
     async def _get_app_web_stream_data(self, url: str, process_data: bool = True):
         html_str = await async_req(url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-        match_json_str = re.search(
-            '</script><script >self.__rsc_f.push\\(\\[1,"(\\{.*?)"]\\)</script><script >self.__rsc_f.push', html_str)
 
-        if not match_json_str:
+        # Each self.__rsc_f.push([1,"..."]) carries a JSON-escaped chunk: the first object chunk
+        # holds the origin stream, the last chunk starting with "5:" holds the room data
+        marker = 'self.__rsc_f.push([1,'
+        json_data = room_chunk = None
+        pos = html_str.find(marker)
+        while pos >= 0:
+            chunk = load_js_string(html_str, marker, pos)
+            if json_data is None and chunk.startswith('{') and '"origin"' in chunk:
+                json_data = self._find_dict_with_key(json.loads(chunk), 'origin')
+            elif chunk.startswith('5'):
+                room_chunk = chunk
+            pos = html_str.find(marker, pos + len(marker))
+
+        if json_data is None or room_chunk is None:
             raise Exception("Fetch stream data error")
 
-        json_str = match_json_str.group(1)
-        cleaned_string = json_str.replace('\\', '').replace(r'u0026', r'&').replace(
-            '"sdk_params":"', '"sdk_params":').replace('","enableEncryption', ',"enableEncryption')
-        cleaned_string = '{"data":' + cleaned_string.split(',"data":')[1]
-        json_data = json.loads(cleaned_string)
-
-        json_str2 = re.findall('</script><script >self.__rsc_f.push\\(\\[1,"5(.*?)</script>$', html_str)[-1]
-        json_str2 = json_str2.replace('\\\\\\"', '"').replace('\\"', '"').replace('"{', '{').replace('}"', '}')
-        json_str2 = json_str2.split(':["$","$L7",null,', maxsplit=1)[-1].split(']\\n"])', maxsplit=1)[0]
-        json_data2 = json.loads(json_str2)
+        json_data = {'data': json_data}
+        json_data2 = load_json(room_chunk, '"$L7",null,')
 
         if not process_data:
             return json_data2
@@ -204,6 +224,8 @@ class DouyinLiveStream(BaseLiveStream):
             else:
                 origin_data = json_data['data']['origin']['main']
             sdk_params = origin_data['sdk_params']
+            if isinstance(sdk_params, str):
+                sdk_params = json.loads(sdk_params)
             origin_hls_codec = sdk_params.get('VCodec') or ''
             origin_m3u8 = {'ORIGIN': origin_data["hls"] + '&codec=' + origin_hls_codec}
             origin_flv = {'ORIGIN': origin_data["flv"] + '&codec=' + origin_hls_codec}
@@ -402,13 +424,10 @@ class DouyinLiveStream(BaseLiveStream):
                 flv_url_list.append(flv_url_list[-1])
                 m3u8_url_list.append(m3u8_url_list[-1])
             video_quality, quality_index = self.get_quality_index(video_quality)
-            m3u8_url = m3u8_url_list[quality_index]
-            flv_url = flv_url_list[quality_index]
-            ok = await get_response_status(url=m3u8_url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-            if not ok:
-                index = quality_index+1 if quality_index < 4 else quality_index - 1
-                m3u8_url = m3u8_url_list[index]
-                flv_url = flv_url_list[index]
+            index, latency = await self.probe_quality(m3u8_url_list, quality_index, headers=self.pc_headers)
+            m3u8_url = m3u8_url_list[index]
+            flv_url = flv_url_list[index]
+            result['extra']['probe_latency'] = latency
 
             result |= {
                 'is_live': True,
@@ -4,7 +4,8 @@ import urllib.parse
 import execjs
 import httpx
 
-from ... import JS_SCRIPT_PATH, utils
+from ...node_worker import NodeWorkerError, call_js
+from ...requests.session import open_client
 
 
 class UnsupportedUrlError(Exception):
@@ -33,12 +34,9 @@ class DouyinUtils:
             headers = DouyinUtils.HEADERS
         query = urllib.parse.urlparse(url).query
         try:
-            with open(f'{JS_SCRIPT_PATH}/x-bogus.js') as f:
-                js_code = f.read()
-            xbogus = execjs.compile(js_code).call('sign', query, headers.get("User-Agent") or headers.get("user-agent"))
-            return xbogus
-        except execjs.ProgramError:
-            raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment')
+            return await call_js('x-bogus.js', 'sign', query, headers.get("User-Agent") or headers.get("user-agent"))
+        except NodeWorkerError as e:
+            raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment') from e
 
     @staticmethod
     async def get_sec_user_id(url: str, proxy_addr: str | None = None, headers: dict | None = None) -> tuple | None:
@@ -46,9 +44,8 @@ class DouyinUtils:
             headers = DouyinUtils.HEADERS
 
         try:
-            proxy_addr = utils.handle_proxy_addr(proxy_addr)
-            async with httpx.AsyncClient(proxy=proxy_addr, timeout=15) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
+            async with open_client(proxy_addr, timeout=15, verify=True, http2=False) as client:
+                response = await client.get(url, headers=headers, follow_redirects=True, timeout=15)
                 redirect_url = response.url
                 if 'reflow/' in str(redirect_url):
                     match = re.search(r'sec_user_id=([\w_\-]+)&', str(redirect_url))
@@ -73,9 +70,8 @@ class DouyinUtils:
             headers = DouyinUtils.HEADERS
 
         try:
-            proxy_addr = utils.handle_proxy_addr(proxy_addr)
-            async with httpx.AsyncClient(proxy=proxy_addr, timeout=15) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
+            async with open_client(proxy_addr, timeout=15, verify=True, http2=False) as client:
+                response = await client.get(url, headers=headers, follow_redirects=True, timeout=15)
                 redirect_url = str(response.url)
                 if 'reflow/' in str(redirect_url):
                     raise UnsupportedUrlError("Unsupported URL")
@@ -87,7 +83,7 @@ class DouyinUtils:
                                      '83e59f3009cc48fbab0; __ac_signature=_02B4Z6wo00f01mG6waQAAIDB9JUCzFb6.TZhmsU'
                                      'AAPBf34; __ac_referer=__ac_blank')
                 profile_response = await client.get(f'https://www.iesdouyin.com/share/user/{sec_user_id}',
-                                                    headers=headers, follow_redirects=True)
+                                                    headers=headers, follow_redirects=True, timeout=15)
                 matches = re.findall(r'unique_id":"(.*?)","verification_type', profile_response.text)
 
                 if matches:
@@ -126,9 +122,8 @@ class DouyinUtils:
         api = api + "&X-Bogus=" + xbogus
 
         try:
-            proxy_addr = utils.handle_proxy_addr(proxy_addr)
-            async with httpx.AsyncClient(proxy=proxy_addr, timeout=15) as client:
-                response = await client.get(api, headers=headers)
+            async with open_client(proxy_addr, timeout=15, verify=True, http2=False) as client:
+                response = await client.get(api, headers=headers, timeout=15)
                 response.raise_for_status()
                 json_data = response.json()
                 return json_data['data']['room']['owner']['web_rid']
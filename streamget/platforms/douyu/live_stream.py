@@ -1,9 +1,11 @@
+import asyncio
 import hashlib
 import json
 import re
 import time
+import weakref
 
-from ...data import StreamData, wrap_stream
+from ...data import LiveStatus, StreamData, wrap_stream
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -12,11 +14,25 @@ class DouyuLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Douyu live stream information.
     """
+    HOSTS = ("douyu.com",)
     DEFAULT_DID = "10000000000000000000000000001501"
     WEB_DOMAIN = "www.douyu.com"
     PLAY_DOMAIN = "playweb.douyucdn.cn"
     MOBILE_DOMAIN = "m.douyu.com"
 
+    # The white key is shared by all instances for WHITE_KEY_TTL seconds and refreshed in the
+    # background once it is within WHITE_KEY_REFRESH_AHEAD seconds of expiring.
+    WHITE_KEY_TTL = 300
+    WHITE_KEY_REFRESH_AHEAD = 60
+    _white_key: dict | None = None
+    _white_key_fetched_at = 0.0
+    _white_key_tasks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    # getH5PlayV1 messages that mean the signature was rejected, as opposed to an offline room,
+    # an unknown CDN or rate limiting; only these invalidate the shared white key
+    WHITE_KEY_ERROR_MARKERS = ('鉴权', '签名', '密钥', 'auth', 'sign')
+    # Maximum number of backup CDN URLs resolved at once per room
+    CDN_CONCURRENCY = 4
+
     USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -132,6 +148,20 @@ class DouyuLiveStream(BaseLiveStream):
         }
         return result
 
+    async def fetch_live_status(self, url: str) -> LiveStatus:
+        """
+        Fetches whether a room is live from `betard`, without requesting play URLs.
+
+        Args:
+            url (str): The room URL.
+
+        Returns:
+            LiveStatus: The live state of the room.
+        """
+        json_data = await self.fetch_web_stream_data(url)
+        return LiveStatus(platform='斗鱼直播', live_url=url, is_live=json_data['is_live'],
+                          anchor_name=json_data['anchor_name'], title=json_data['title'])
+
     async def _update_white_key(self) -> dict:
         url = f'https://{self.WEB_DOMAIN}/wgapi/livenc/liveweb/websec/getEncryption?did={self.DEFAULT_DID}'
         json_str = await async_req(
@@ -144,8 +174,56 @@ class DouyuLiveStream(BaseLiveStream):
             raise RuntimeError('获取白名单密钥失败')
         return data['data']
 
-    async def _fetch_web_stream_url(self, rid: str, rate: str = '-1', cdn: str | None = None) -> dict:
+    @classmethod
+    def invalidate_white_key(cls) -> None:
+        """
+        Drops the cached white key so the next request fetches a new one.
+        """
+        cls._white_key = None
+
+    @classmethod
+    def _is_white_key_error(cls, json_data: dict) -> bool:
+        if json_data.get('error') == 0:
+            return False
+        msg = str(json_data.get('msg') or '').lower()
+        return any(marker in msg for marker in cls.WHITE_KEY_ERROR_MARKERS)
+
+    def _refresh_white_key(self) -> asyncio.Task:
+        # One refresh at a time per event loop; concurrent callers await the same task
+        loop = asyncio.get_running_loop()
+        task = self._white_key_tasks.get(loop)
+        if task is None or task.done():
+            task = loop.create_task(self._fetch_white_key())
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._white_key_tasks[loop] = task
+        return task
+
+    async def _fetch_white_key(self) -> dict:
         white = await self._update_white_key()
+        cls = type(self)
+        cls._white_key = white
+        cls._white_key_fetched_at = time.time()
+        return white
+
+    async def _get_white_key(self) -> dict:
+        white = self._white_key
+        age = time.time() - self._white_key_fetched_at
+        if white is None or age >= self.WHITE_KEY_TTL:
+            return await self._refresh_white_key()
+        if age >= self.WHITE_KEY_TTL - self.WHITE_KEY_REFRESH_AHEAD:
+            self._refresh_white_key()
+        return white
+
+    async def _fetch_web_stream_url(self, rid: str, rate: str = '-1', cdn: str | None = None) -> dict:
+        started = time.time()
+        json_data = await self._fetch_web_stream_url_with_key(await self._get_white_key(), rid, rate, cdn)
+        if self._is_white_key_error(json_data) and self._white_key_fetched_at < started:
+            # A cached key may have been revoked early: retry once with a fresh one
+            self.invalidate_white_key()
+            json_data = await self._fetch_web_stream_url_with_key(await self._get_white_key(), rid, rate, cdn)
+        return json_data
+
+    async def _fetch_web_stream_url_with_key(self, white: dict, rid: str, rate: str, cdn: str | None) -> dict:
         ts = int(time.time())
         secret = white['rand_str']
         salt = f"{rid}{ts}" if not white['is_special'] else ""
@@ -179,9 +257,25 @@ class DouyuLiveStream(BaseLiveStream):
         return json.loads(json_str)
 
     async def fetch_stream_url(
-            self, json_data: dict, video_quality: str | int | None = None, cdn: str | None = None) -> StreamData:
+            self,
+            json_data: dict,
+            video_quality: str | int | None = None,
+            cdn: str | None = None,
+            backup: bool = True
+    ) -> StreamData:
         """
         Fetches the stream URL for a live room and wraps it into a StreamData object.
+
+        Args:
+            json_data (dict): The room data returned by `fetch_web_stream_data`.
+            video_quality (str | int | None): The desired video quality. Defaults to None.
+            cdn (str | None): The CDN to request first. Defaults to the one Douyu picks.
+            backup (bool): If True, also resolves the other CDNs concurrently into
+                `extra['backup_url_list']`, in the order Douyu lists them. Set to False to
+                resolve the primary URL only. Defaults to True.
+
+        Returns:
+            StreamData: The stream data of the room.
         """
         platform = '斗鱼直播'
         if json_data.get('source') == "app":
@@ -211,19 +305,14 @@ class DouyuLiveStream(BaseLiveStream):
 
         rate = video_quality_options.get(video_quality, '0')
 
-        flv_url_list = []
-
         async def get_url(_rid: str, _rate: str, _cdn: str | None = None):
             _flv_data = await self._fetch_web_stream_url(rid=_rid, rate=_rate, cdn=_cdn)
             if _flv_data.get('error') != 0:
-                return
+                return None, None
             info = _flv_data.get('data')
             if not info:
-                return
-            _flv_url = f"{info['rtmp_url']}/{info['rtmp_live']}"
-            if _flv_url not in flv_url_list:
-                flv_url_list.append(_flv_url)
-            return _flv_data
+                return None, None
+            return f"{info['rtmp_url']}/{info['rtmp_live']}", _flv_data
 
         if not json_data['is_live']:
             json_data |= {
@@ -235,25 +324,29 @@ class DouyuLiveStream(BaseLiveStream):
             }
             return wrap_stream(json_data)
 
-        flv_data = await get_url(_rid=rid, _rate=rate, _cdn=cdn)
+        flv_url, flv_data = await get_url(_rid=rid, _rate=rate, _cdn=cdn)
 
-        if flv_data and flv_data.get('data'):
+        backup_url_list = []
+        if flv_url and backup:
             rtmp_cdn = flv_data['data'].get('rtmp_cdn')
-            cdn_list = flv_data['data'].get('cdnsWithName', [])
+            cdn_list = [item['cdn'] for item in flv_data['data'].get('cdnsWithName', []) if item['cdn'] != rtmp_cdn]
+            limit = asyncio.Semaphore(self.CDN_CONCURRENCY)
+
+            async def get_backup_url(_cdn: str) -> str | None:
+                async with limit:
+                    return (await get_url(_rid=rid, _rate=rate, _cdn=_cdn))[0]
 
-            for item in cdn_list:
-                if item['cdn'] != rtmp_cdn:
-                    await get_url(_rid=rid, _rate=rate, _cdn=item['cdn'])
+            for backup_url in await asyncio.gather(*(get_backup_url(item) for item in cdn_list)):
+                if backup_url and backup_url != flv_url and backup_url not in backup_url_list:
+                    backup_url_list.append(backup_url)
 
-        if flv_url_list:
-            flv_url = flv_url_list[0]
-            flv_url_list.remove(flv_url)
+        if flv_url:
             json_data |= {
                 "platform": platform,
                 'quality': video_quality,
                 'flv_url': flv_url,
                 'record_url': flv_url,
-                'extra': {'backup_url_list': flv_url_list}
+                'extra': {'backup_url_list': backup_url_list}
             }
 
         return wrap_stream(json_data)
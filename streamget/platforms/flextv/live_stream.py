@@ -2,6 +2,7 @@ import json
 import re
 
 from ...data import StreamData, wrap_stream
+from ...extractor import load_json
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -10,6 +11,8 @@ class FlexTVLiveStream(BaseLiveStream):
     """
     A class for fetching and processing FlexTV live stream information.
     """
+    HOSTS = ("flextv.co.kr", "ttinglive.com")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None, username: str | None = None,
                  password: str | None = None):
         super().__init__(proxy_addr, cookies)
@@ -85,8 +88,7 @@ class FlexTVLiveStream(BaseLiveStream):
         try:
             url2 = f'https://www.ttinglive.com/channels/{user_id}/live'
             html_str = await async_req(url2, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-            json_str = re.search('<script id="__NEXT_DATA__" type=".*">(.*?)</script>', html_str).group(1)
-            json_data = json.loads(json_str)
+            json_data = load_json(html_str, '<script id="__NEXT_DATA__"')
             channel_data = json_data['props']['pageProps']['channel']
             login_need = 'message' in channel_data and '로그인후 이용이 가능합니다.' in channel_data.get('message')
             if login_need:
@@ -99,8 +101,7 @@ class FlexTVLiveStream(BaseLiveStream):
                 cookies = new_cookies or self.cookies
                 self.pc_headers['Cookie'] = cookies
                 html_str = await async_req(url2, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-                json_str = re.search('<script id="__NEXT_DATA__" type=".*">(.*?)</script>', html_str).group(1)
-                json_data = json.loads(json_str)
+                json_data = load_json(html_str, '<script id="__NEXT_DATA__"')
                 channel_data = json_data['props']['pageProps']['channel']
 
             live_status = 'message' not in channel_data
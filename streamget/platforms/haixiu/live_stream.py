@@ -6,6 +6,7 @@ import execjs
 
 from ... import JS_SCRIPT_PATH
 from ...data import StreamData, wrap_stream
+from ...node_worker import NodeWorkerError, call_js
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -14,6 +15,8 @@ class HaixiuLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Haixiu live stream information.
     """
+    HOSTS = ("haixiutv.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
@@ -50,11 +53,9 @@ class HaixiuLiveStream(BaseLiveStream):
             "_st1": int(time.time() * 1000)
         }
         try:
-            with open(f'{JS_SCRIPT_PATH}/haixiu.js') as f:
-                js_code = f.read()
-            ajax_data = execjs.compile(js_code).call('sign', params, f'{JS_SCRIPT_PATH}/crypto-js.min.js')
-        except execjs.ProgramError:
-            raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment')
+            ajax_data = await call_js('haixiu.js', 'sign', params, f'{JS_SCRIPT_PATH}/crypto-js.min.js')
+        except NodeWorkerError as e:
+            raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment') from e
 
         params["accessToken"] = urllib.parse.unquote(urllib.parse.unquote(access_token))
         params['_ajaxData1'] = ajax_data
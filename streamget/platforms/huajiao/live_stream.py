@@ -12,6 +12,8 @@ class HuajiaoLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Huajiao live stream information.
     """
+    HOSTS = ("huajiao.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -7,6 +7,8 @@ class HuamaoLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Huamao live stream information.
     """
+    HOSTS = ("catshow168.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.stream = PiaopaioLiveStream(proxy_addr=self.proxy_addr, cookies=self.cookies)
@@ -1,4 +1,5 @@
 import base64
+import dataclasses
 import hashlib
 import json
 import random
@@ -6,8 +7,9 @@ import re
 import time
 import urllib.parse
 
-from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req
+from ...data import LiveStatus, StreamData, wrap_stream
+from ...extractor import MarkerScanner
+from ...requests.async_http import async_req, async_req_until
 from ..base import BaseLiveStream
 
 
@@ -15,6 +17,8 @@ class HuyaLiveStream(BaseLiveStream):
     """
       A class for fetching and processing Huya live stream information.
     """
+    HOSTS = ("huya.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -40,7 +44,8 @@ class HuyaLiveStream(BaseLiveStream):
         Returns:
             dict: A dictionary containing anchor name, live status, room URL, and title.
         """
-        html_str = await async_req(url=url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
+        scanner = MarkerScanner(('stream: {"data"', ',"iWebDefaultBitRate"'))
+        html_str = await async_req_until(url, scanner, proxy_addr=self.proxy_addr, headers=self.pc_headers)
         json_str = re.findall('stream: (\\{"data".*?),"iWebDefaultBitRate"', html_str)[0]
         json_data = json.loads(json_str + '}')
         json_data['live_url'] = url
@@ -60,7 +65,8 @@ class HuyaLiveStream(BaseLiveStream):
         room_id = url.split('?')[0].rsplit('/', maxsplit=1)[-1]
 
         if any(char.isalpha() for char in room_id):
-            html_str = await async_req(url, proxy_addr=self.proxy_addr, headers=self.mobile_headers)
+            scanner = MarkerScanner(('ProfileRoom":', ',"sPrivateHost'))
+            html_str = await async_req_until(url, scanner, proxy_addr=self.proxy_addr, headers=self.mobile_headers)
             room_id = re.search('ProfileRoom":(.*?),"sPrivateHost', html_str)
             if room_id:
                 room_id = room_id.group(1)
@@ -119,11 +125,13 @@ class HuyaLiveStream(BaseLiveStream):
                     select_item = item
 
             select_item = select_item or play_url_list[0]
+            for item in play_url_list:
+                if item["cdn_type"] in ["TX", "HW"]:
+                    for key in ("flv_url", "m3u8_url"):
+                        item[key] = item[key].replace("&ctype=tars_mp", "&ctype=huya_webh5").replace(
+                            "&fs=bhct", "&fs=bgct")
             m3u8_url = select_item.get("m3u8_url")
             flv_url = select_item.get("flv_url")
-            if select_item["cdn_type"] in ["TX", "HW"]:
-                flv_url = flv_url.replace("&ctype=tars_mp", "&ctype=huya_webh5").replace("&fs=bhct", "&fs=bgct")
-                m3u8_url = m3u8_url.replace("&ctype=tars_mp", "&ctype=huya_webh5").replace("&fs=bhct", "&fs=bgct")
 
             return {
                 'anchor_name': anchor_name,
@@ -132,9 +140,66 @@ class HuyaLiveStream(BaseLiveStream):
                 'flv_url': flv_url,
                 'record_url': flv_url or m3u8_url,
                 'title': live_title,
-                'live_url': live_url
+                'live_url': live_url,
+                'extra': {'backup_url_list': [item['flv_url'] for item in play_url_list if item is not select_item]}
             }
 
+    async def fetch_live_status(self, url: str) -> LiveStatus:
+        """
+        Fetches whether a room is live from `mp.huya.com`, without signing stream URLs.
+
+        Args:
+            url (str): The room URL.
+
+        Returns:
+            LiveStatus: The live state of the room.
+        """
+        json_data = (await self.fetch_app_stream_data(url, process_data=False))['data']
+        live_data = json_data.get('liveData') or {}
+        return LiveStatus(platform="虎牙直播", live_url=url, is_live=json_data['realLiveStatus'] == 'ON',
+                          anchor_name=json_data['profileInfo']['nick'], title=live_data.get('introduction'))
+
+    @staticmethod
+    def get_anti_code(old_anti_code: str, stream_name: str) -> str:
+        """
+        Signs a fresh anti-code for a stream from the `fm`, `ctype` and `fs` fields of a CDN's
+        `sFlvAntiCode`. No request is made.
+        """
+        # js地址：https://hd.huya.com/cdn_libs/mobile/hysdk-m-202402211431.js
+
+        params_t = 100
+        sdk_version = 2403051612
+
+        # sdk_id是13位数毫秒级时间戳
+        t13 = int(time.time()) * 1000
+        sdk_sid = t13
+
+        # 计算uuid和uid参数值
+        init_uuid = (int(t13 % 10 ** 10 * 1000) + int(1000 * random.random())) % 4294967295
+        uid = random.randint(1400000000000, 1400009999999)  # 经过测试uid也可以使用init_uuid代替
+        seq_id = uid + sdk_sid  # 移动端请求的直播流地址中包含seqId参数
+
+        # 计算ws_time参数值(16进制) 可以是当前毫秒时间戳，当然也可以直接使用url_query['wsTime'][0]
+        # 原始最大误差不得慢240000毫秒
+        target_unix_time = (t13 + 110624) // 1000
+        ws_time = f"{target_unix_time:x}".lower()
+
+        # fm参数值是经过url编码然后base64编码得到的，解码结果类似 DWq8BcJ3h6DJt6TY_$0_$1_$2_$3
+        # 具体细节在上面js中查看，大概在32657行代码开始，有base64混淆代码请自行替换
+        url_query = urllib.parse.parse_qs(old_anti_code)
+        ws_secret_pf = base64.b64decode(urllib.parse.unquote(url_query['fm'][0]).encode()).decode().split("_")[
+            0]
+        ws_secret_hash = hashlib.md5(f'{seq_id}|{url_query["ctype"][0]}|{params_t}'.encode()).hexdigest()
+        ws_secret = f'{ws_secret_pf}_{uid}_{stream_name}_{ws_secret_hash}_{ws_time}'
+        ws_secret_md5 = hashlib.md5(ws_secret.encode()).hexdigest()
+
+        anti_code = (
+            f'wsSecret={ws_secret_md5}&wsTime={ws_time}&seqid={seq_id}&ctype={url_query["ctype"][0]}&ver=1'
+            f'&fs={url_query["fs"][0]}&uuid={init_uuid}&u={uid}&t={params_t}&sv={sdk_version}'
+            f'&sdk_sid={sdk_sid}&codec=264'
+        )
+        return anti_code
+
     @staticmethod
     async def fetch_stream_url(json_data: dict, video_quality: str | int | None = None) -> StreamData:
         """
@@ -158,56 +223,9 @@ class HuyaLiveStream(BaseLiveStream):
         }
 
         if stream_info_list:
-            select_cdn = stream_info_list[0]
-            flv_url = select_cdn.get('sFlvUrl')
-            stream_name = select_cdn.get('sStreamName')
-            flv_url_suffix = select_cdn.get('sFlvUrlSuffix')
-            hls_url = select_cdn.get('sHlsUrl')
-            hls_url_suffix = select_cdn.get('sHlsUrlSuffix')
-            flv_anti_code = select_cdn.get('sFlvAntiCode')
-
-            def get_anti_code(old_anti_code: str) -> str:
-
-                # js地址：https://hd.huya.com/cdn_libs/mobile/hysdk-m-202402211431.js
-
-                params_t = 100
-                sdk_version = 2403051612
-
-                # sdk_id是13位数毫秒级时间戳
-                t13 = int(time.time()) * 1000
-                sdk_sid = t13
-
-                # 计算uuid和uid参数值
-                init_uuid = (int(t13 % 10 ** 10 * 1000) + int(1000 * random.random())) % 4294967295
-                uid = random.randint(1400000000000, 1400009999999)  # 经过测试uid也可以使用init_uuid代替
-                seq_id = uid + sdk_sid  # 移动端请求的直播流地址中包含seqId参数
-
-                # 计算ws_time参数值(16进制) 可以是当前毫秒时间戳，当然也可以直接使用url_query['wsTime'][0]
-                # 原始最大误差不得慢240000毫秒
-                target_unix_time = (t13 + 110624) // 1000
-                ws_time = f"{target_unix_time:x}".lower()
-
-                # fm参数值是经过url编码然后base64编码得到的，解码结果类似 DWq8BcJ3h6DJt6TY_$0_$1_$2_$3
-                # 具体细节在上面js中查看，大概在32657行代码开始，有base64混淆代码请自行替换
-                url_query = urllib.parse.parse_qs(old_anti_code)
-                ws_secret_pf = base64.b64decode(urllib.parse.unquote(url_query['fm'][0]).encode()).decode().split("_")[
-                    0]
-                ws_secret_hash = hashlib.md5(f'{seq_id}|{url_query["ctype"][0]}|{params_t}'.encode()).hexdigest()
-                ws_secret = f'{ws_secret_pf}_{uid}_{stream_name}_{ws_secret_hash}_{ws_time}'
-                ws_secret_md5 = hashlib.md5(ws_secret.encode()).hexdigest()
-
-                anti_code = (
-                    f'wsSecret={ws_secret_md5}&wsTime={ws_time}&seqid={seq_id}&ctype={url_query["ctype"][0]}&ver=1'
-                    f'&fs={url_query["fs"][0]}&uuid={init_uuid}&u={uid}&t={params_t}&sv={sdk_version}'
-                    f'&sdk_sid={sdk_sid}&codec=264'
-                )
-                return anti_code
-
-            new_anti_code = get_anti_code(flv_anti_code)
-            flv_url = f'{flv_url}/{stream_name}.{flv_url_suffix}?{new_anti_code}&ratio='
-            m3u8_url = f'{hls_url}/{stream_name}.{hls_url_suffix}?{new_anti_code}&ratio='
-
+            flv_anti_code = stream_info_list[0].get('sFlvAntiCode')
             quality_list = flv_anti_code.split('&exsphd=')
+            ratio = ''
 
             if not video_quality:
                 video_quality = "OD"
@@ -235,8 +253,22 @@ class HuyaLiveStream(BaseLiveStream):
                     raise ValueError(
                         f"Invalid video quality. Available options are: {', '.join(video_quality_options.keys())}")
 
-                flv_url = flv_url + str(video_quality_options[video_quality])
-                m3u8_url = m3u8_url + str(video_quality_options[video_quality])
+                ratio = str(video_quality_options[video_quality])
+
+            # The other CDNs serve the same stream and are signed the same way. What signing
+            # needs is kept in `extra` so `refresh_url` can re-sign without a request.
+            sign_params = {'ratio': ratio, 'cdns': [
+                {
+                    'flv_url': f"{cdn['sFlvUrl']}/{cdn['sStreamName']}.{cdn['sFlvUrlSuffix']}",
+                    'hls_url': f"{cdn['sHlsUrl']}/{cdn['sStreamName']}.{cdn['sHlsUrlSuffix']}",
+                    'stream_name': cdn['sStreamName'],
+                    'anti_code': cdn['sFlvAntiCode'],
+                }
+                for index, cdn in enumerate(stream_info_list)
+                if index == 0 or all(cdn.get(key) for key in (
+                    'sFlvUrl', 'sFlvUrlSuffix', 'sHlsUrl', 'sHlsUrlSuffix', 'sStreamName', 'sFlvAntiCode'))
+            ]}
+            flv_url, m3u8_url, backup_url_list = HuyaLiveStream._sign_urls(sign_params)
 
             result |= {
                 'is_live': True,
@@ -244,6 +276,54 @@ class HuyaLiveStream(BaseLiveStream):
                 'quality': video_quality,
                 'm3u8_url': m3u8_url,
                 'flv_url': flv_url,
-                'record_url': flv_url or m3u8_url
+                'record_url': flv_url or m3u8_url,
+                'extra': {'backup_url_list': backup_url_list, 'sign_params': sign_params}
             }
         return wrap_stream(result)
+
+    @staticmethod
+    def _sign_urls(sign_params: dict) -> tuple[str, str, list[str]]:
+        ratio = sign_params['ratio']
+        first, *backups = sign_params['cdns']
+        anti_code = HuyaLiveStream.get_anti_code(first['anti_code'], first['stream_name'])
+        flv_url = f"{first['flv_url']}?{anti_code}&ratio={ratio}"
+        m3u8_url = f"{first['hls_url']}?{anti_code}&ratio={ratio}"
+        backup_url_list = []
+        for cdn in backups:
+            try:
+                anti_code = HuyaLiveStream.get_anti_code(cdn['anti_code'], cdn['stream_name'])
+            except (KeyError, IndexError, ValueError):
+                # A backup CDN with an anti-code this signer does not understand is left out
+                continue
+            backup_url_list.append(f"{cdn['flv_url']}?{anti_code}&ratio={ratio}")
+        return flv_url, m3u8_url, backup_url_list
+
+    @classmethod
+    def refresh_url(cls, stream_data: StreamData) -> StreamData:
+        """
+        Re-signs the URLs of a Huya stream without any request.
+
+        Huya URLs are signed locally and stay valid for about two minutes. The signing inputs
+        `fetch_stream_url` keeps in `extra['sign_params']` are enough to sign them again, so
+        a recorder can keep extending them while the room is live instead of fetching the room
+        page again.
+
+        Args:
+            stream_data (StreamData): A live stream returned by `fetch_stream_url` for web data.
+
+        Returns:
+            StreamData: A copy with freshly signed `flv_url`, `m3u8_url`, `record_url` and backup URLs.
+
+        Raises:
+            ValueError: If `stream_data` carries no signing parameters, e.g. it came from app data.
+
+        Example:
+            >>> stream_obj = HuyaLiveStream.refresh_url(stream_obj)
+        """
+        sign_params = (stream_data.extra or {}).get('sign_params')
+        if not sign_params:
+            raise ValueError('The stream data carries no Huya signing parameters')
+        flv_url, m3u8_url, backup_url_list = cls._sign_urls(sign_params)
+        extra = {**stream_data.extra, 'backup_url_list': backup_url_list}
+        return dataclasses.replace(stream_data, flv_url=flv_url, m3u8_url=m3u8_url,
+                                   record_url=flv_url or m3u8_url, extra=extra)
@@ -11,6 +11,8 @@ class JDLiveStream(BaseLiveStream):
     """
     A class for fetching and processing JD live stream information.
     """
+    HOSTS = ("jd.com", "3.cn")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
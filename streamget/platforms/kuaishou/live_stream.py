@@ -1,8 +1,8 @@
 import json
-import re
 
 from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req
+from ...extractor import JsonScanner, load_json
+from ...requests.async_http import async_req_until
 from ..base import BaseLiveStream
 
 
@@ -10,6 +10,8 @@ class KwaiLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Kuaishou live stream information.
     """
+    HOSTS = ("live.kuaishou.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -26,15 +28,17 @@ class KwaiLiveStream(BaseLiveStream):
             dict: A dictionary containing anchor name, live status, room URL, and title.
         """
         try:
-            html_str = await async_req(url=url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
+            scanner = JsonScanner('{"liveStream"', after='window.__INITIAL_STATE__=')
+            html_str = await async_req_until(url, scanner, proxy_addr=self.proxy_addr, headers=self.pc_headers)
         except Exception as e:
             raise Exception(f"Failed to fetch data from {url}.{e}")
 
         try:
-            json_str = re.search('<script>window.__INITIAL_STATE__=(.*?);\\(function\\(\\)\\{var s;', html_str).group(1)
-            play_list = re.findall('(\\{"liveStream".*?),"gameInfo', json_str)[0] + "}"
-            play_list = json.loads(play_list)
-        except (AttributeError, IndexError, json.JSONDecodeError) as e:
+            state_start = html_str.index('window.__INITIAL_STATE__=')
+            play_list = load_json(html_str, '{"liveStream"', start=state_start, js=True)
+            if play_list is None:
+                raise ValueError('liveStream not found')
+        except (ValueError, json.JSONDecodeError) as e:
             raise Exception(f"Failed to parse JSON data from {url}. Error: {e}")
 
         result = {"type": 2, "is_live": False, 'live_url': url}
@@ -12,6 +12,8 @@ class KugouLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Kugou live stream information.
     """
+    HOSTS = ("kugou.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
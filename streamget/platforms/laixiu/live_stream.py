@@ -11,6 +11,8 @@ class LaixiuLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Laixiu live stream information.
     """
+    HOSTS = ("imkktv.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -7,6 +7,8 @@ class LehaiLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Lehai live stream information.
     """
+    HOSTS = ("lehaitv.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.stream = HaixiuLiveStream(proxy_addr=self.proxy_addr, cookies=self.cookies)
@@ -9,6 +9,8 @@ class LianJieLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Yinbo live stream information.
     """
+    HOSTS = ("lailianjie.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
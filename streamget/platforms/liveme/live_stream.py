@@ -6,6 +6,7 @@ import execjs
 
 from ... import JS_SCRIPT_PATH
 from ...data import StreamData, wrap_stream
+from ...node_worker import NodeWorkerError, call_js
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -14,6 +15,8 @@ class LiveMeLiveStream(BaseLiveStream):
     """
     A class for fetching and processing LiveMe live stream information.
     """
+    HOSTS = ("liveme.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
@@ -46,11 +49,9 @@ class LiveMeLiveStream(BaseLiveStream):
 
         room_id = url.split("/index.html")[0].rsplit('/', maxsplit=1)[-1]
         try:
-            with open(f'{JS_SCRIPT_PATH}/liveme.js') as f:
-                js_code = f.read()
-            sign_data = execjs.compile(js_code).call('sign', room_id, f'{JS_SCRIPT_PATH}/crypto-js.min.js')
-        except execjs.ProgramError:
-            raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment')
+            sign_data = await call_js('liveme.js', 'sign', room_id, f'{JS_SCRIPT_PATH}/crypto-js.min.js')
+        except NodeWorkerError as e:
+            raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment') from e
         lm_s_sign = sign_data.pop("lm_s_sign")
         tongdun_black_box = sign_data.pop("tongdun_black_box")
         platform = sign_data.pop("os")
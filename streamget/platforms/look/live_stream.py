@@ -1,15 +1,56 @@
+import base64
+import functools
 import json
 import re
+import secrets
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
 
 from ...data import StreamData, wrap_stream
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
+_WEAPI_MODULUS = int(
+    '00e0b509f6259df8642dbc35662901477df22677ec152b5ff68ace615bb7b725152b3ab17a876aea8a5aa76d2e417629ec'
+    '4ee341f56135fccf695280104e0312ecbda92557c93870114af6c9d05c4f7f0c3685b7a46bee255932575cce10b424d813'
+    'cfe4875d3e82047b97ddef52741d546b8e289dc6935b3ece0462db0a22b8e7', 16)
+_WEAPI_PUBLIC_EXPONENT = 0x010001
+_WEAPI_NONCE = b'0CoJUm6Qyw8W8jud'
+_WEAPI_IV = b'0102030405060708'
+_WEAPI_KEY_CHARSET = '1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$%^&*()_+-=[]{}|;:,.<>?'
+# encSecKey depends only on the secret key, so a few key pairs are encrypted once and reused
+WEAPI_KEY_POOL_SIZE = 8
+
+
+def _aes_encrypt(data: bytes, key: bytes) -> bytes:
+    cipher = AES.new(key, AES.MODE_CBC, _WEAPI_IV)
+    return base64.b64encode(cipher.encrypt(pad(data, AES.block_size)))
+
+
+def _rsa_encrypt(key: bytes) -> str:
+    # Textbook RSA over the reversed key, as the web page does
+    return format(pow(int.from_bytes(key[::-1], 'big'), _WEAPI_PUBLIC_EXPONENT, _WEAPI_MODULUS), 'x').zfill(256)
+
+
+@functools.cache
+def _weapi_key_pool() -> tuple[tuple[bytes, str], ...]:
+    """
+    Returns `WEAPI_KEY_POOL_SIZE` random secret keys with their encSecKey, generated on first use.
+    """
+    pool = []
+    for _ in range(WEAPI_KEY_POOL_SIZE):
+        sec_key = ''.join(secrets.choice(_WEAPI_KEY_CHARSET) for _ in range(16)).encode('utf-8')
+        pool.append((sec_key, _rsa_encrypt(sec_key)))
+    return tuple(pool)
+
 
 class LookLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Look live stream information.
     """
+    HOSTS = ("look.163.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -29,47 +70,8 @@ class LookLiveStream(BaseLiveStream):
         ncSecKey: 由一次自写的加密函数完成，值可固定
         """
         # 本算法参考项目：https://github.com/785415581/MusicBox/blob/b8f716d43d/doc/analysis/analyze_captured_data.md
-
-        modulus = '00e0b509f6259df8642dbc35662901477df22677ec152b5ff68ace615bb7b725152b3ab17a876aea8a5aa76d2e417629ec' \
-                  '4ee341f56135fccf695280104e0312ecbda92557c93870114af6c9d05c4f7f0c3685b7a46bee255932575cce10b424d813' \
-                  'cfe4875d3e82047b97ddef52741d546b8e289dc6935b3ece0462db0a22b8e7'
-        nonce = b'0CoJUm6Qyw8W8jud'
-        public_key = '010001'
-        import base64
-        import binascii
-        import secrets
-
-        from Crypto.Cipher import AES
-        from Crypto.Util.Padding import pad
-
-        def create_secret_key(size: int) -> bytes:
-            charset = '1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$%^&*()_+-=[]{}|;:,.<>?'
-            return ''.join(secrets.choice(charset) for _ in range(size)).encode('utf-8')
-
-        def aes_encrypt(_text: str | bytes, _sec_key: str | bytes) -> bytes:
-            if isinstance(_text, str):
-                _text = _text.encode('utf-8')
-            if isinstance(_sec_key, str):
-                _sec_key = _sec_key.encode('utf-8')
-            _sec_key = _sec_key[:16]  # 16 (AES-128), 24 (AES-192), or 32 (AES-256) bytes
-            iv = bytes('0102030405060708', 'utf-8')
-            encryptor = AES.new(_sec_key, AES.MODE_CBC, iv)
-            padded_text = pad(_text, AES.block_size)
-            ciphertext = encryptor.encrypt(padded_text)
-            encoded_ciphertext = base64.b64encode(ciphertext)
-            return encoded_ciphertext
-
-        def rsa_encrypt(_text: str | bytes, pub_key: str, mod: str) -> str:
-            if isinstance(_text, str):
-                _text = _text.encode('utf-8')
-            text_reversed = _text[::-1]
-            text_int = int(binascii.hexlify(text_reversed), 16)
-            encrypted_int = pow(text_int, int(pub_key, 16), int(mod, 16))
-            return format(encrypted_int, 'x').zfill(256)
-
-        sec_key = create_secret_key(16)
-        enc_text = aes_encrypt(aes_encrypt(json.dumps(text), nonce), sec_key)
-        enc_sec_key = rsa_encrypt(sec_key, public_key, modulus)
+        sec_key, enc_sec_key = secrets.choice(_weapi_key_pool())
+        enc_text = _aes_encrypt(_aes_encrypt(json.dumps(text).encode('utf-8'), _WEAPI_NONCE), sec_key)
         return enc_text.decode(), enc_sec_key
 
     async def fetch_web_stream_data(self, url: str, process_data: bool = True) -> dict:
@@ -9,6 +9,8 @@ class MaoerLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Maoer live stream information.
     """
+    HOSTS = ("missevan.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
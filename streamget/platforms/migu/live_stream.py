@@ -1,8 +1,9 @@
+import asyncio
 import json
-import subprocess
 import time
 import urllib.parse
 import uuid
+import weakref
 
 import execjs
 
@@ -16,6 +17,12 @@ class MiguLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Migu live stream information.
     """
+    HOSTS = ("miguvideo.com",)
+    # Maximum number of migu.js processes running at once per event loop
+    NODE_CONCURRENCY = 4
+    NODE_TIMEOUT = 15
+    _node_limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -42,18 +49,35 @@ class MiguLiveStream(BaseLiveStream):
         title = anchor_name + '-' + json_data['body'].get('detailPageTitle', '')
         return room_id, anchor_name, title
 
-    @staticmethod
-    async def _get_dd_calcu(url):
-        try:
-            result = subprocess.run(
-                ["node", f"{JS_SCRIPT_PATH}/migu.js", url],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except execjs.ProgramError:
+    @classmethod
+    def _get_node_limit(cls) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        limit = cls._node_limits.get(loop)
+        if limit is None:
+            limit = cls._node_limits[loop] = asyncio.Semaphore(cls.NODE_CONCURRENCY)
+        return limit
+
+    @classmethod
+    async def _get_dd_calcu(cls, url):
+        async with cls._get_node_limit():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "node", f"{JS_SCRIPT_PATH}/migu.js", url,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), cls.NODE_TIMEOUT)
+                finally:
+                    # Also on cancellation by the caller, so no node process is left behind
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+            except (OSError, asyncio.TimeoutError) as e:
+                raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment') from e
+        if process.returncode != 0:
             raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment')
+        return stdout.decode().strip()
 
     async def fetch_web_stream_data(self, url: str, process_data: bool = True) -> dict:
         """
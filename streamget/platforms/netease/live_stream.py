@@ -1,7 +1,5 @@
-import json
-import re
-
 from ...data import StreamData, wrap_stream
+from ...extractor import load_json
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -10,6 +8,8 @@ class NeteaseLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Netease CC live stream information.
     """
+    HOSTS = ("cc.163.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -27,9 +27,7 @@ class NeteaseLiveStream(BaseLiveStream):
         """
         url = url + '/' if url[-1] != '/' else url
         html_str = await async_req(url.strip(), proxy_addr=self.proxy_addr, headers=self.pc_headers)
-        json_str = re.search('<script id="__NEXT_DATA__" .* crossorigin="anonymous">(.*?)</script></body>',
-                             html_str, re.DOTALL).group(1)
-        json_data = json.loads(json_str)
+        json_data = load_json(html_str, '<script id="__NEXT_DATA__"')
         if not process_data:
             return json_data
         room_data = json_data['props']['pageProps']['roomInfoInitData']
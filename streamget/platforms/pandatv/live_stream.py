@@ -9,6 +9,8 @@ class PandaLiveStream(BaseLiveStream):
     """
     A class for fetching and processing PandaLive live stream information.
     """
+    HOSTS = ("pandalive.co.kr",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -3,9 +3,10 @@ import re
 
 import httpx
 
-from ... import utils
 from ...data import StreamData, wrap_stream
+from ...extractor import load_json
 from ...requests.async_http import async_req
+from ...requests.session import open_client
 from ..base import BaseLiveStream
 
 
@@ -13,6 +14,8 @@ class PopkonTVLiveStream(BaseLiveStream):
     """
     A class for fetching and processing PopkonTV live stream information.
     """
+    HOSTS = ("popkontv.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None, username: str | None = None,
                  password: str | None = None, access_token: str | None = None, partner_code: str | None = 'P-00001'):
         super().__init__(proxy_addr, cookies)
@@ -83,8 +86,7 @@ class PopkonTVLiveStream(BaseLiveStream):
 
         live_url = f"https://www.popkontv.com/live/view?castId={anchor_id}&partnerCode={partner_code}"
         html_str2 = await async_req(live_url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-        json_str2 = re.search('<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', html_str2).group(1)
-        json_data2 = json.loads(json_str2)
+        json_data2 = load_json(html_str2, '<script id="__NEXT_DATA__"')
         if 'mcData' in json_data2['props']['pageProps']:
             room_data = json_data2['props']['pageProps']['mcData']['data']
             is_private = room_data['mc_isPrivate']
@@ -114,9 +116,8 @@ class PopkonTVLiveStream(BaseLiveStream):
         url = 'https://www.popkontv.com/api/proxy/member/v1/login'
 
         try:
-            proxy_addr = utils.handle_proxy_addr(self.proxy_addr)
-            async with httpx.AsyncClient(proxy=proxy_addr, timeout=20, verify=False) as client:
-                response = await client.post(url, json=data, headers=headers)
+            async with open_client(self.proxy_addr, timeout=20, verify=False, http2=False) as client:
+                response = await client.post(url, json=data, headers=headers, timeout=20)
                 response.raise_for_status()
 
                 json_data = response.json()
@@ -9,6 +9,8 @@ class QiandureboLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Qiandurebo live stream information.
     """
+    HOSTS = ("qiandurebo.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
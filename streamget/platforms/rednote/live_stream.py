@@ -1,7 +1,7 @@
-import json
 import re
 
 from ...data import StreamData, wrap_stream
+from ...extractor import load_json
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -10,6 +10,8 @@ class RedNoteLiveStream(BaseLiveStream):
     """
     A class for fetching and processing RedNote live stream information.
     """
+    APP_HOSTS = ("xiaohongshu.com", "xhslink.com")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
@@ -40,11 +42,9 @@ class RedNoteLiveStream(BaseLiveStream):
         user_id = user_id.group(1) if user_id else host_id
         result = {"anchor_name": '', "is_live": False, "live_url": url}
         html_str = await async_req(url, proxy_addr=self.proxy_addr, headers=self.mobile_headers)
-        match_data = re.search("<script>window.__INITIAL_STATE__=(.*?)</script>", html_str)
+        json_data = load_json(html_str, "<script>window.__INITIAL_STATE__=", js=True)
 
-        if match_data:
-            json_str = match_data.group(1).replace("undefined", "null")
-            json_data = json.loads(json_str)
+        if json_data is not None:
             if not process_data:
                 return json_data
 
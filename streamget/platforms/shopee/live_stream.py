@@ -9,6 +9,11 @@ class ShopeeLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Shopee live stream information.
     """
+    HOSTS = (
+        "shopee.sg", "shopee.co.id", "shopee.com.my", "shopee.co.th", "shopee.ph", "shopee.vn", "shopee.tw",
+        "shopee.com.br"
+    )
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
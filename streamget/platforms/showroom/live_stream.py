@@ -2,7 +2,8 @@ import json
 import re
 
 from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req
+from ...extractor import MarkerScanner
+from ...requests.async_http import async_req, async_req_until
 from ..base import BaseLiveStream
 
 
@@ -10,6 +11,8 @@ class ShowRoomLiveStream(BaseLiveStream):
     """
     A class for fetching and processing ShowRoom live stream information.
     """
+    HOSTS = ("showroom-live.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -29,7 +32,8 @@ class ShowRoomLiveStream(BaseLiveStream):
         if '/room/profile' in url:
             room_id = url.split('room_id=')[-1]
         else:
-            html_str = await async_req(url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
+            scanner = MarkerScanner(('href="/room/profile?room_id=', '"'))
+            html_str = await async_req_until(url, scanner, proxy_addr=self.proxy_addr, headers=self.pc_headers)
             room_id = re.search('href="/room/profile\\?room_id=(.*?)"', html_str).group(1)
         info_api = f'https://www.showroom-live.com/api/live/live_info?room_id={room_id}'
         json_str = await async_req(info_api, proxy_addr=self.proxy_addr, headers=self.pc_headers)
@@ -53,8 +57,7 @@ class ShowRoomLiveStream(BaseLiveStream):
                             m3u8_url_list = await self.get_play_url_list(
                                 m3u8_url, proxy=self.proxy_addr, headers=self.pc_headers)
                             if m3u8_url_list:
-                                result['play_url_list'] = [f"{m3u8_url.rsplit('/', maxsplit=1)[0]}/{i}" for i in
-                                                           m3u8_url_list]
+                                result['play_url_list'] = m3u8_url_list
                             else:
                                 result['play_url_list'] = [m3u8_url]
                             result['play_url_list'] = [i.replace('https://', 'http://') for i in
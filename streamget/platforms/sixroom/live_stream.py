@@ -10,6 +10,8 @@ class SixRoomLiveStream(BaseLiveStream):
     """
     A class for fetching and processing SixRoom live stream information.
     """
+    HOSTS = ("6.cn",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
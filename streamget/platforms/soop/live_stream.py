@@ -1,5 +1,4 @@
 import json
-import re
 import urllib.parse
 import uuid
 
@@ -12,6 +11,8 @@ class SoopLiveStream(BaseLiveStream):
     """
     A class for fetching and processing SOOP live stream information.
     """
+    HOSTS = ("sooplive.co.kr", "sooplive.com")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None,
                  username: str | None = None, password: str | None = None):
         super().__init__(proxy_addr, cookies)
@@ -138,29 +139,16 @@ class SoopLiveStream(BaseLiveStream):
         if not status:
             return result
         else:
-            async def _get_url_list(m3u8: str) -> list[str]:
-                headers = {
-                    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
-                                  'Chrome/141.0.0.0 Safari/537.36 Edg/141.0.0.0',
-                }
-                resp = await async_req(url=m3u8, proxy_addr=self.proxy_addr, headers=headers)
-                play_url_list = []
-                url_prefix = '/'.join(m3u8.split('/')[0:3])
-                for i in resp.split('\n'):
-                    if not i.startswith('#') and i.strip():
-                        play_url_list.append(url_prefix + i.strip())
-                bandwidth_pattern = re.compile(r'BANDWIDTH=(\d+)')
-                bandwidth_list = bandwidth_pattern.findall(resp)
-                url_to_bandwidth = {purl: int(bandwidth) for bandwidth, purl in zip(bandwidth_list, play_url_list)}
-                play_url_list = sorted(play_url_list, key=lambda purl: url_to_bandwidth[purl], reverse=True)
-                return play_url_list
-
+            headers = {
+                'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                              'Chrome/141.0.0.0 Safari/537.36 Edg/141.0.0.0',
+            }
             m3u8_url = 'https://global-media.sooplive.com/live/' + str(bj_id) + '/master.m3u8'
             result |= {
                 'is_live': True,
                 'title': title,
                 'm3u8_url': m3u8_url,
-                'play_url_list': await _get_url_list(m3u8_url)
+                'play_url_list': await self.get_play_url_list(m3u8_url, proxy=self.proxy_addr, headers=headers)
             }
         return result
 
@@ -205,19 +193,6 @@ class SoopLiveStream(BaseLiveStream):
 
         result = {"anchor_name": anchor_name or '', "is_live": False, "live_url": url}
 
-        async def get_url_list(m3u8: str) -> list[str]:
-            resp = await async_req(url=m3u8, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-            play_url_list = []
-            url_prefix = m3u8.rsplit('/', maxsplit=1)[0] + '/'
-            for i in resp.split('\n'):
-                if i.startswith('auth_playlist'):
-                    play_url_list.append(url_prefix + i.strip())
-            bandwidth_pattern = re.compile(r'BANDWIDTH=(\d+)')
-            bandwidth_list = bandwidth_pattern.findall(resp)
-            url_to_bandwidth = {purl: int(bandwidth) for bandwidth, purl in zip(bandwidth_list, play_url_list)}
-            play_url_list = sorted(play_url_list, key=lambda purl: url_to_bandwidth[purl], reverse=True)
-            return play_url_list
-
         if not anchor_name:
             async def handle_login() -> str | None:
                 cookie = await self.login_sooplive()
@@ -235,7 +210,8 @@ class SoopLiveStream(BaseLiveStream):
                     "anchor_name": _anchor_name,
                     "is_live": True,
                     "m3u8_url": _m3u8_url,
-                    'play_url_list': await get_url_list(_m3u8_url),
+                    'play_url_list': await self.get_play_url_list(
+                        _m3u8_url, proxy=self.proxy_addr, headers=self.pc_headers),
                     'new_cookies': cookie
                 }
                 return _result
@@ -271,7 +247,8 @@ class SoopLiveStream(BaseLiveStream):
                 'is_live': True,
                 'title': broad_title,
                 'm3u8_url': m3u8_url,
-                'play_url_list': await get_url_list(m3u8_url)
+                'play_url_list': await self.get_play_url_list(
+                    m3u8_url, proxy=self.proxy_addr, headers=self.pc_headers)
             }
         result['new_cookies'] = None
         return result
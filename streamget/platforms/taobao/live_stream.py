@@ -4,8 +4,9 @@ import urllib.parse
 
 import execjs
 
-from ... import JS_SCRIPT_PATH, utils
+from ... import utils
 from ...data import StreamData, wrap_stream
+from ...node_worker import NodeWorkerError, call_js
 from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
@@ -14,6 +15,8 @@ class TaobaoLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Taobao live stream information.
     """
+    HOSTS = ("taobao.com", "tb.cn")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -67,11 +70,9 @@ class TaobaoLiveStream(BaseLiveStream):
             t13 = int(time.time() * 1000)
             pre_sign_str = f'{_m_h5_tk.split("_")[0]}&{t13}&{app_key}&' + params['data']
             try:
-                with open(f'{JS_SCRIPT_PATH}/taobao-sign.js') as f:
-                    js_code = f.read()
-                sign = execjs.compile(js_code).call('sign', pre_sign_str)
-            except execjs.ProgramError:
-                raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment')
+                sign = await call_js('taobao-sign.js', 'sign', pre_sign_str)
+            except NodeWorkerError as e:
+                raise execjs.ProgramError('Failed to execute JS code. Please check if the Node.js environment') from e
             params |= {'sign': sign, 't': t13}
             api = 'https://h5api.m.taobao.com/h5/mtop.mediaplatform.live.livedetail/4.0/?' + \
                   urllib.parse.urlencode(params)
@@ -4,7 +4,8 @@ import urllib.parse
 from operator import itemgetter
 
 from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req, get_response_status
+from ...extractor import load_json
+from ...requests.async_http import async_req
 from ..base import BaseLiveStream
 
 
@@ -12,6 +13,8 @@ class TikTokLiveStream(BaseLiveStream):
     """
     A class for fetching and processing TikTok live stream information.
     """
+    HOSTS = ("tiktok.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None, is_hevc: bool | None = False):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -74,11 +77,9 @@ class TikTokLiveStream(BaseLiveStream):
                 f"another region to access. {msg.group(1) if msg else ''}"
             )
         if 'UNEXPECTED_EOF_WHILE_READING' not in html_str:
-            json_str = re.findall(
-                '<script id="SIGI_STATE" type="application/json">(.*?)</script>', html_str, re.DOTALL)
-            if not json_str:
+            json_data = load_json(html_str, '<script id="SIGI_STATE"')
+            if json_data is None:
                 raise ConnectionError("Please check if your network can access the TikTok website normally")
-            json_data = json.loads(json_str[0])
             json_data['live_url'] = url
             return json_data
         return {'live_url': url}
@@ -149,17 +150,10 @@ class TikTokLiveStream(BaseLiveStream):
             while len(m3u8_url_list) < 5:
                 m3u8_url_list.append(m3u8_url_list[-1])
             video_quality, quality_index = self.get_quality_index(video_quality)
-            flv_dict: dict = flv_url_list[quality_index]
-            m3u8_dict: dict = m3u8_url_list[quality_index]
-
-            check_url = m3u8_dict.get('url') or flv_dict.get('url')
-            ok = await get_response_status(
-                url=check_url, proxy_addr=self.proxy_addr, headers=self.pc_headers, http2=False)
-
-            if not ok:
-                index = quality_index + 1 if quality_index < 4 else quality_index - 1
-                flv_dict: dict = flv_url_list[index]
-                m3u8_dict: dict = m3u8_url_list[index]
+            check_urls = [m3u8.get('url') or flv.get('url') for m3u8, flv in zip(m3u8_url_list, flv_url_list)]
+            index, latency = await self.probe_quality(check_urls, quality_index, headers=self.pc_headers, http2=False)
+            flv_dict: dict = flv_url_list[index]
+            m3u8_dict: dict = m3u8_url_list[index]
 
             flv_url = flv_dict['url'].replace("https://", "http://")
             m3u8_url = m3u8_dict['url'].replace("https://", "http://")
@@ -169,6 +163,7 @@ class TikTokLiveStream(BaseLiveStream):
                 'quality': video_quality,
                 'm3u8_url': m3u8_url,
                 'flv_url': flv_url,
-                'record_url': m3u8_url or flv_url
+                'record_url': m3u8_url or flv_url,
+                'extra': {'probe_latency': latency}
             }
         return wrap_stream(result)
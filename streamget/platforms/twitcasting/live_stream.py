@@ -3,7 +3,8 @@ import re
 
 from ... import utils
 from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req
+from ...extractor import MarkerScanner
+from ...requests.async_http import async_req, async_req_until
 from ..base import BaseLiveStream
 
 
@@ -11,6 +12,8 @@ class TwitCastingLiveStream(BaseLiveStream):
     """
     A class for fetching and processing TwitCasting live stream information.
     """
+    HOSTS = ("twitcasting.tv",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None, username: str | None = None,
                  password: str | None = None, account_type: str | None = None):
         super().__init__(proxy_addr, cookies)
@@ -73,7 +76,13 @@ class TwitCastingLiveStream(BaseLiveStream):
         anchor_id = url.split('/')[3]
 
         async def get_data() -> tuple:
-            html_str = await async_req(url, proxy_addr=self.proxy_addr, headers=self.mobile_headers)
+            scanner = MarkerScanner(
+                ('<title>', ' - Twit'),
+                ('<meta name="twitter:title" content="', '<meta'),
+                ('data-is-onlive="', 'data-view-mode'),
+                ('data-movie-id="', 'data-audience-id')
+            )
+            html_str = await async_req_until(url, scanner, proxy_addr=self.proxy_addr, headers=self.mobile_headers)
             anchor = re.search("<title>(.*?) \\(@(.*?)\\)  的直播 - Twit", html_str)
             title = re.search('<meta name="twitter:title" content="(.*?)">\n\\s+<meta', html_str)
             status = re.search('data-is-onlive="(.*?)"\n\\s+data-view-mode', html_str)
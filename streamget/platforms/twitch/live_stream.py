@@ -1,9 +1,10 @@
+import asyncio
 import json
 import random
-import re
 import urllib.parse
 
-from ...data import StreamData, wrap_stream
+from ...data import LiveStatus, StreamData, wrap_stream
+from ...hls import fetch_master_playlist
 from ...requests.async_http import async_req
 from ...utils import generate_random_string
 from ..base import BaseLiveStream
@@ -13,6 +14,10 @@ class TwitchLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Twitch live stream information.
     """
+    HOSTS = ("twitch.tv",)
+    # Operations per batched request to gql.twitch.tv, which rejects larger batches
+    GQL_BATCH_SIZE = 35
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None, access_token: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.access_token = access_token
@@ -30,39 +35,89 @@ class TwitchLiveStream(BaseLiveStream):
             'cookie': self.cookies or '',
         }
 
-    async def get_twitchtv_room_info(self, url: str) -> tuple:
+    @staticmethod
+    def _channel(url: str) -> str:
+        return url.split('?')[0].rsplit('/', maxsplit=1)[-1]
 
-        uid = url.split('?')[0].rsplit('/', maxsplit=1)[-1]
-
-        data = [
-            {
-                "operationName": "ComscoreStreamingQuery",
-                "variables": {
-                    "channel": uid.lower(),
-                    "clipSlug": "",
-                    "isClip": False,
-                    "isLive": True,
-                    "isVodOrCollection": False,
-                    "vodID": "",
-                },
-                "extensions": {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "e1edae8122517d013405f237ffcc124515dc6ded82480a88daef69c83b53ac01"
-                    }
-                }
+    @staticmethod
+    def _room_info_operation(uid: str) -> dict:
+        return {
+            "operationName": "ComscoreStreamingQuery",
+            "variables": {
+                "channel": uid.lower(),
+                "clipSlug": "",
+                "isClip": False,
+                "isLive": True,
+                "isVodOrCollection": False,
+                "vodID": "",
             },
-        ]
+            "extensions": {
+                "persistedQuery": {
+                    "version": 1,
+                    "sha256Hash": "e1edae8122517d013405f237ffcc124515dc6ded82480a88daef69c83b53ac01"
+                }
+            }
+        }
+
+    @staticmethod
+    def _access_token_operation(uid: str) -> dict:
+        return {
+            "operationName": "PlaybackAccessToken_Template",
+            "query": "query PlaybackAccessToken_Template($login: String!, $isLive: Boolean!, $vodID: ID!, "
+                     "$isVod: Boolean!, $playerType: String!) {  streamPlaybackAccessToken(channelName: $login, "
+                     "params: {platform: \"web\", playerBackend: \"mediaplayer\", playerType: $playerType}) "
+                     "@include(if: $isLive) {    value    signature   authorization { isForbidden forbiddenReasonCode }"
+                     "   __typename  }  videoPlaybackAccessToken(id: $vodID, params: {platform: \"web\", "
+                     "playerBackend: \"mediaplayer\", playerType: $playerType}) @include(if: $isVod) {    value   "
+                     " signature   __typename  }}",
+            "variables": {
+                "isLive": True,
+                "login": uid,
+                "isVod": False,
+                "vodID": "",
+                "playerType": "site"
+            }
+        }
 
-        json_str = await async_req('https://gql.twitch.tv/gql', proxy_addr=self.proxy_addr, headers=self.pc_headers,
-                                   json_data=data,http2=False)
-        json_data = json.loads(json_str)
-        user_data = json_data[0]['data']['user']
+    async def _post_gql(self, operations: list[dict]) -> list[dict]:
+        """
+        Sends GQL operations as one batched POST, in chunks of at most `GQL_BATCH_SIZE`.
+
+        Returns:
+            list[dict]: One response per operation, in order.
+
+        Raises:
+            ValueError: If a batch is answered with anything but one response per operation,
+                e.g. an error object.
+        """
+        async def post(chunk: list[dict]) -> list[dict]:
+            json_str = await async_req('https://gql.twitch.tv/gql', proxy_addr=self.proxy_addr,
+                                       headers=self.pc_headers, json_data=chunk, http2=False)
+            response = json.loads(json_str)
+            if not isinstance(response, list) or len(response) != len(chunk):
+                raise ValueError(f"Unexpected Twitch GQL response: {json_str[:200]}")
+            return response
+
+        chunks = [operations[i:i + self.GQL_BATCH_SIZE] for i in range(0, len(operations), self.GQL_BATCH_SIZE)]
+        responses = await asyncio.gather(*map(post, chunks))
+        return [item for response in responses for item in response]
+
+    @staticmethod
+    def _parse_room_info(uid: str, item: dict) -> tuple:
+        user_data = (item.get('data') or {}).get('user')
+        if not user_data:
+            # Unknown channel
+            return '', False, ''
         nickname = f"{user_data['displayName']}-{uid}"
         status = True if user_data['stream'] else False
         title = user_data['broadcastSettings']['title']
         return nickname, status, title
 
+    async def get_twitchtv_room_info(self, url: str) -> tuple:
+        uid = self._channel(url)
+        json_data = await self._post_gql([self._room_info_operation(uid)])
+        return self._parse_room_info(uid, json_data[0])
+
     async def get_play_url_list(self, m3u8: str, proxy: str | None = None, headers: dict | None = None) -> list[dict]:
         """
         Fetches and parses the M3U8 playlist, returning structured stream information including audio-only streams.
@@ -77,96 +132,28 @@ class TwitchLiveStream(BaseLiveStream):
             'is_audio_only': bool
         }
         """
-        resp = await async_req(m3u8, proxy_addr=proxy, headers=headers)
+        playlist = await fetch_master_playlist(m3u8, proxy_addr=proxy, headers=headers)
         play_url_list = []
-
-        lines = resp.split('\n')
-        current_stream_info = {}
-        current_group_id = None
-        current_name = None
-
-        for line in lines:
-            line = line.strip()
-
-            # Parse #EXT-X-MEDIA line to get GROUP-ID and NAME
-            if line.startswith('#EXT-X-MEDIA:'):
-                group_id_match = re.search(r'GROUP-ID="([^"]+)"', line)
-                name_match = re.search(r'NAME="([^"]+)"', line)
-                if group_id_match:
-                    current_group_id = group_id_match.group(1)
-                if name_match:
-                    current_name = name_match.group(1)
-
-            # Parse #EXT-X-STREAM-INF line
-            elif line.startswith('#EXT-X-STREAM-INF:'):
-                bandwidth_match = re.search(r'BANDWIDTH=(\d+)', line)
-                resolution_match = re.search(r'RESOLUTION=(\d+x\d+)', line)
-
-                current_stream_info['bandwidth'] = int(bandwidth_match.group(1)) if bandwidth_match else 0
-                current_stream_info['resolution'] = resolution_match.group(1) if resolution_match else None
-
-            # URL line - add stream to list
-            elif line.startswith('https://') and current_stream_info:
-                stream = {
-                    'url': line,
-                    'bandwidth': current_stream_info.get('bandwidth', 0),
-                    'resolution': current_stream_info.get('resolution'),
-                    'group_id': current_group_id or 'unknown',
-                    'name': current_name or 'unknown',
-                    'is_audio_only': current_group_id == 'audio_only'
-                }
-                play_url_list.append(stream)
-
-                # Reset for next stream
-                current_stream_info = {}
-                current_group_id = None
-                current_name = None
-
-        # Sort by bandwidth descending (highest quality first)
-        play_url_list.sort(key=lambda x: x['bandwidth'], reverse=True)
+        for variant in playlist.sorted_variants():
+            # Twitch names each variant through the VIDEO rendition group it belongs to
+            group_id = variant.video
+            renditions = playlist.group(group_id, 'VIDEO')
+            play_url_list.append({
+                'url': variant.uri,
+                'bandwidth': variant.bandwidth,
+                'resolution': variant.resolution,
+                'group_id': group_id or 'unknown',
+                'name': renditions[0].name if renditions else 'unknown',
+                'is_audio_only': group_id == 'audio_only'
+            })
         return play_url_list
 
-    async def fetch_web_stream_data(self, url: str, process_data: bool = True) -> dict:
-        """
-        Fetches web stream data for a live room.
-
-        Args:
-            url (str): The room URL.
-            process_data (bool): Whether to process the data. Defaults to True.
-
-        Returns:
-            dict: A dictionary containing anchor name, live status, room URL, and title.
-        """
-
-        uid = url.split('?')[0].rsplit('/', maxsplit=1)[-1]
-
-        data = {
-            "operationName": "PlaybackAccessToken_Template",
-            "query": "query PlaybackAccessToken_Template($login: String!, $isLive: Boolean!, $vodID: ID!, "
-                     "$isVod: Boolean!, $playerType: String!) {  streamPlaybackAccessToken(channelName: $login, "
-                     "params: {platform: \"web\", playerBackend: \"mediaplayer\", playerType: $playerType}) "
-                     "@include(if: $isLive) {    value    signature   authorization { isForbidden forbiddenReasonCode }"
-                     "   __typename  }  videoPlaybackAccessToken(id: $vodID, params: {platform: \"web\", "
-                     "playerBackend: \"mediaplayer\", playerType: $playerType}) @include(if: $isVod) {    value   "
-                     " signature   __typename  }}",
-            "variables": {
-                "isLive": True,
-                "login": uid,
-                "isVod": False,
-                "vodID": "",
-                "playerType": "site"
-            }
-        }
-
-        json_str = await async_req('https://gql.twitch.tv/gql', proxy_addr=self.proxy_addr, headers=self.pc_headers,
-                                   json_data=data,http2=False)
-        json_data = json.loads(json_str)
-        token = json_data['data']['streamPlaybackAccessToken']['value']
-        sign = json_data['data']['streamPlaybackAccessToken']['signature']
-
-        anchor_name, live_status, live_title = await self.get_twitchtv_room_info(url.strip())
+    async def _build_stream_data(self, url: str, room_info: tuple, token_item: dict | None) -> dict:
+        uid = self._channel(url)
+        anchor_name, live_status, live_title = room_info
         result = {"anchor_name": anchor_name, "is_live": live_status, "live_url": url, "title": live_title}
         if live_status:
+            access_token = token_item['data']['streamPlaybackAccessToken']
             play_session_id = random.choice(["bdd22331a986c7f1073628f2fc5b19da", "064bc3ff1722b6f53b0b5b8c01e46ca5"])
             params = {
                 "acmb": "e30=",
@@ -185,8 +172,8 @@ class TwitchLiveStream(BaseLiveStream):
                 "player_version": "1.28.0-rc.1",
                 "playlist_include_framerate": "true",
                 "reassignments_supported": "true",
-                "sig": sign,
-                "token": token,
+                "sig": access_token['signature'],
+                "token": access_token['value'],
                 "transcode_mode": "cbr_v1"
             }
             access_key = urllib.parse.urlencode(params)
@@ -196,6 +183,97 @@ class TwitchLiveStream(BaseLiveStream):
             result |= {'m3u8_url': m3u8_url, 'play_url_list': play_url_list}
         return result
 
+    async def fetch_web_stream_data(self, url: str, process_data: bool = True) -> dict:
+        """
+        Fetches web stream data for a live room.
+
+        The playback access token and the room info are requested in one batched GQL POST.
+
+        Args:
+            url (str): The room URL.
+            process_data (bool): Whether to process the data. Defaults to True.
+
+        Returns:
+            dict: A dictionary containing anchor name, live status, room URL, and title.
+        """
+        url = url.strip()
+        uid = self._channel(url)
+        token_item, room_item = await self._post_gql([self._access_token_operation(uid),
+                                                      self._room_info_operation(uid)])
+        return await self._build_stream_data(url, self._parse_room_info(uid, room_item), token_item)
+
+    async def fetch_many_status(self, urls: list[str]) -> list[LiveStatus]:
+        """
+        Fetches whether many channels are live, with one GQL POST per `GQL_BATCH_SIZE` channels.
+
+        Args:
+            urls (list[str]): The channel URLs.
+
+        Returns:
+            list[LiveStatus]: The live state of each channel, in the order of `urls`. Unknown
+            channels are reported offline with an empty anchor name.
+
+        Raises:
+            ValueError: If Twitch answers a batch with an error instead of one response per channel.
+        """
+        urls = [url.strip() for url in urls]
+        uids = [self._channel(url) for url in urls]
+        json_data = await self._post_gql([self._room_info_operation(uid) for uid in uids])
+        statuses = []
+        for url, uid, item in zip(urls, uids, json_data):
+            anchor_name, live_status, live_title = self._parse_room_info(uid, item)
+            statuses.append(LiveStatus(platform='Twitch', live_url=url, is_live=live_status,
+                                       anchor_name=anchor_name, title=live_title))
+        return statuses
+
+    async def fetch_many_web_stream_data(self, urls: list[str]) -> list[dict]:
+        """
+        Fetches web stream data for many channels with batched GQL requests.
+
+        Status and title of every channel are fetched in one POST per `GQL_BATCH_SIZE` channels,
+        then playback access tokens in one more POST for the live channels only. Each live
+        channel's master playlist is still fetched on its own, concurrently.
+
+        Args:
+            urls (list[str]): The channel URLs.
+
+        Returns:
+            list[dict]: The data of each channel, in the order of `urls`, ready for `fetch_stream_url`.
+
+        Raises:
+            ValueError: If Twitch answers a batch with an error instead of one response per operation.
+
+        Example:
+            >>> live = TwitchLiveStream()
+            >>> json_list = asyncio.run(live.fetch_many_web_stream_data(urls))
+            >>> streams = [asyncio.run(live.fetch_stream_url(json_data, "OD")) for json_data in json_list]
+        """
+        urls = [url.strip() for url in urls]
+        uids = [self._channel(url) for url in urls]
+        room_items = await self._post_gql([self._room_info_operation(uid) for uid in uids])
+        room_infos = [self._parse_room_info(uid, item) for uid, item in zip(uids, room_items)]
+        live_indexes = [i for i, room_info in enumerate(room_infos) if room_info[1]]
+        token_items = await self._post_gql([self._access_token_operation(uids[i]) for i in live_indexes])
+        tokens = dict(zip(live_indexes, token_items))
+        return list(await asyncio.gather(*(
+            self._build_stream_data(url, room_info, tokens.get(i))
+            for i, (url, room_info) in enumerate(zip(urls, room_infos))
+        )))
+
+    async def fetch_live_status(self, url: str) -> LiveStatus:
+        """
+        Fetches whether a channel is live with one GQL query, without requesting a playback token.
+
+        Args:
+            url (str): The channel URL.
+
+        Returns:
+            LiveStatus: The live state of the channel.
+        """
+        anchor_name, live_status, live_title = await self.get_twitchtv_room_info(url.strip())
+        return LiveStatus(platform='Twitch', live_url=url, is_live=live_status, anchor_name=anchor_name,
+                          title=live_title)
+
     async def fetch_stream_url(self, json_data: dict, video_quality: str | int | None = None) -> StreamData:
         """
         Fetches the stream URL for a live room and wraps it into a StreamData object.
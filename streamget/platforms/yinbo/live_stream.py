@@ -11,6 +11,8 @@ class YinboLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Yinbo live stream information.
     """
+    HOSTS = ("ybw1666.com",)
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.mobile_headers = self._get_mobile_headers()
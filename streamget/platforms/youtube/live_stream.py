@@ -1,8 +1,6 @@
-import json
-import re
-
 from ...data import StreamData, wrap_stream
-from ...requests.async_http import async_req
+from ...extractor import JsonScanner, load_json
+from ...requests.async_http import async_req_until
 from ..base import BaseLiveStream
 
 
@@ -10,6 +8,8 @@ class YoutubeLiveStream(BaseLiveStream):
     """
     A class for fetching and processing Youtube live stream information.
     """
+    HOSTS = ("youtube.com", "youtu.be")
+
     def __init__(self, proxy_addr: str | None = None, cookies: str | None = None):
         super().__init__(proxy_addr, cookies)
         self.pc_headers = self._get_pc_headers()
@@ -25,10 +25,11 @@ class YoutubeLiveStream(BaseLiveStream):
         Returns:
             dict: A dictionary containing anchor name, live status, room URL, and title.
         """
-        html_str = await async_req(url, proxy_addr=self.proxy_addr, headers=self.pc_headers)
-        json_str = re.search('var ytInitialPlayerResponse = (.*?);var meta = document\\.createElement', html_str).group(
-            1)
-        json_data = json.loads(json_str)
+        marker = 'var ytInitialPlayerResponse = '
+        html_str = await async_req_until(url, JsonScanner(marker), proxy_addr=self.proxy_addr, headers=self.pc_headers)
+        json_data = load_json(html_str, marker)
+        if json_data is None:
+            raise Exception("Failed to find ytInitialPlayerResponse in the page")
         if not process_data:
             return json_data
         result = {"anchor_name": "", "is_live": False, "live_url": url}
@@ -0,0 +1,583 @@
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+from .failover import ResilientReader
+from .flv import FlvError, FlvReader, FlvStats, FlvTag, set_tag_timestamp
+from .hls import HlsWatcher, Segment
+from .requests.session import Session, get_session
+
+
+@dataclass
+class RecordStats:
+    """
+    Counters collected while recording.
+
+    Attributes:
+        files (list[str]): The output files, in the order they were opened.
+        segments (int): Segments written.
+        bytes (int): Bytes written, initialization sections included.
+        duration (float): Media seconds written, summed from segment durations.
+        gaps (int): Segments that were never listed because the playlist moved past them.
+        failed (int): Listed segments that could not be downloaded (skipped or truncated).
+        discontinuities (int): Discontinuities seen: `#EXT-X-DISCONTINUITY` tags, gaps and failed segments.
+    """
+    files: list[str] = field(default_factory=list)
+    segments: int = 0
+    bytes: int = 0
+    duration: float = 0.0
+    gaps: int = 0
+    failed: int = 0
+    discontinuities: int = 0
+
+
+class BufferPool:
+    """
+    A fixed set of reusable byte buffers.
+
+    Downloads copy incoming data into pooled buffers and the writer hands each buffer back
+    once it is on disk, so memory stays bounded no matter how large segments are and no
+    per-segment `bytes` objects are accumulated. When every buffer is in use, downloads
+    wait for the writer to catch up.
+
+    Args:
+        count (int): Number of buffers.
+        size (int): Size of each buffer in bytes.
+    """
+    def __init__(self, count: int, size: int):
+        self.size = size
+        self._free: asyncio.Queue[bytearray] = asyncio.Queue()
+        for _ in range(count):
+            self._free.put_nowait(bytearray(size))
+
+    async def acquire(self) -> bytearray:
+        return await self._free.get()
+
+    def release(self, buffer: bytearray) -> None:
+        self._free.put_nowait(buffer)
+
+
+class _Download:
+    __slots__ = ('chunks', 'segment', 'task')
+
+    def __init__(self, segment: Segment, max_chunks: int):
+        self.segment = segment
+        # Filled buffers as (buffer, length), then None when complete or an exception on failure
+        self.chunks: asyncio.Queue = asyncio.Queue(max_chunks)
+        self.task: asyncio.Task | None = None
+
+
+class HlsRecorder:
+    """
+    Records a live HLS stream to disk.
+
+    Segments listed by an `HlsWatcher` are downloaded up to `prefetch` at a time and
+    written strictly in order. Downloads stream into a fixed `BufferPool`; each segment may
+    hold at most `buffers_per_segment` filled buffers ahead of the writer, so a slow disk
+    or one huge segment throttles the downloads instead of growing memory.
+
+    All requests, playlist reloads included, go through the active `Session` (or one owned
+    by the recorder), so keep-alive connections are reused per CDN host.
+
+    Output files rotate at segment boundaries once `max_size` bytes or `max_duration`
+    seconds have been written, and on discontinuities when `split_on_discontinuity` is set.
+    The `#EXT-X-MAP` initialization section of fMP4 streams is written at the start of
+    every file and whenever it changes.
+
+    Args:
+        url (str): The media or master playlist URL, e.g. `StreamData.record_url`.
+        output (str | Path): Output path. `{index}` is replaced with the file number and
+            `{time}` with the local time the file was opened, e.g. "room_{time}_{index:03d}.ts".
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        headers (dict | None): Custom headers for all requests. Defaults to None.
+        prefetch (int): Maximum number of segments downloaded ahead of the writer. Defaults to 4.
+        buffer_size (int): Size of each pooled buffer in bytes. Defaults to 256 KiB.
+        buffers_per_segment (int): Filled buffers a segment may hold before waiting for the writer. Defaults to 8.
+        max_size (int | None): Rotate after this many bytes. Defaults to None.
+        max_duration (float | None): Rotate after this many media seconds. Defaults to None.
+        split_on_discontinuity (bool): Start a new file at each discontinuity. Defaults to False.
+        retries (int): Extra attempts for a segment whose download fails before any data arrived. Defaults to 1.
+        timeout (int): The request timeout in seconds. Defaults to 20.
+        session (Session | None): The session whose pooled clients are used. Defaults to the active session.
+
+    Example:
+        >>> async def main(stream_obj):
+        ...     recorder = HlsRecorder(stream_obj.record_url, "room_{index:03d}.ts", max_duration=3600)
+        ...     stats = await recorder.run()
+        ...     print(stats.files, stats.gaps)
+        >>> asyncio.run(main(stream_obj))
+    """
+    def __init__(
+            self,
+            url: str,
+            output: str | Path,
+            proxy_addr: str | None = None,
+            headers: dict | None = None,
+            prefetch: int = 4,
+            buffer_size: int = 256 * 1024,
+            buffers_per_segment: int = 8,
+            max_size: int | None = None,
+            max_duration: float | None = None,
+            split_on_discontinuity: bool = False,
+            retries: int = 1,
+            timeout: int = 20,
+            session: Session | None = None
+    ):
+        if prefetch < 1:
+            raise ValueError('prefetch must be at least 1')
+        self.url = url
+        self.output = str(output)
+        self.proxy_addr = proxy_addr
+        self.headers = headers or {}
+        self.prefetch = prefetch
+        self.buffer_size = buffer_size
+        self.buffers_per_segment = buffers_per_segment
+        self.max_size = max_size
+        self.max_duration = max_duration
+        self.split_on_discontinuity = split_on_discontinuity
+        self.retries = retries
+        self.timeout = timeout
+        self.session = session
+        self.stats = RecordStats()
+        self._producer: asyncio.Task | None = None
+        self._pool: BufferPool | None = None
+        self._fd: int | None = None
+        self._file_bytes = 0
+        self._file_duration = 0.0
+        self._init_section: str | None = None
+        self._init_cache: dict[str, bytes] = {}
+        self._after_failure = False
+
+    def stop(self) -> None:
+        """
+        Stops following the playlist. Segments already scheduled are still written before `run` returns.
+        """
+        if self._producer is not None:
+            self._producer.cancel()
+
+    async def run(self) -> RecordStats:
+        """
+        Records until the playlist ends, `stop` is called or a playlist reload fails.
+
+        Returns:
+            RecordStats: What was written.
+
+        Raises:
+            httpx.HTTPError: If a playlist reload fails. Files written so far are kept and closed.
+        """
+        owned = None
+        session = self.session or get_session()
+        if session is None:
+            session = owned = Session()
+        client = session.get_client(self.proxy_addr)
+        # Up to prefetch + 1 segments are in flight (queued plus the one being written), each holding
+        # its queued buffers plus the one being filled, so the segment being written never starves
+        self._pool = BufferPool((self.prefetch + 1) * (self.buffers_per_segment + 1), self.buffer_size)
+        pending: asyncio.Queue = asyncio.Queue(self.prefetch)
+        self._producer = asyncio.create_task(self._produce(client, session, pending))
+        downloads: list[_Download] = []
+        try:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                downloads.append(item)
+                await self._write(client, item)
+                downloads.remove(item)
+        finally:
+            self._producer.cancel()
+            for download in downloads:
+                download.task.cancel()
+            while not pending.empty():
+                item = pending.get_nowait()
+                if isinstance(item, _Download):
+                    item.task.cancel()
+            self._close_file()
+            if owned is not None:
+                await owned.aclose()
+        return self.stats
+
+    async def _produce(self, client: httpx.AsyncClient, session: Session, pending: asyncio.Queue) -> None:
+        watcher = HlsWatcher(self.url, proxy_addr=self.proxy_addr, headers=self.headers, timeout=self.timeout,
+                             session=session)
+        byterange_ends: dict[str, int] = {}
+        expected = None
+        try:
+            async with contextlib.aclosing(watcher.segments()) as segments:
+                async for segment in segments:
+                    if expected is not None and segment.sequence != expected:
+                        # Either the playlist slid past unseen segments or the stream restarted
+                        self.stats.gaps += max(segment.sequence - expected, 0)
+                        segment.discontinuity = True
+                    expected = segment.sequence + 1
+                    headers = self.headers
+                    if segment.byterange:
+                        length, _, offset = segment.byterange.partition('@')
+                        start = int(offset) if offset else byterange_ends.get(segment.uri, 0)
+                        byterange_ends[segment.uri] = start + int(length)
+                        headers = {**headers, 'Range': f'bytes={start}-{start + int(length) - 1}'}
+                    download = _Download(segment, self.buffers_per_segment)
+                    await pending.put(download)
+                    # Started only once queued, so downloads never outnumber the pool's budget
+                    download.task = asyncio.create_task(self._download(client, download, headers))
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            await pending.put(e)
+            return
+        await pending.put(None)
+
+    async def _download(self, client: httpx.AsyncClient, download: _Download, headers: dict) -> None:
+        pool = self._pool
+        buffer = None
+        try:
+            for attempt in range(self.retries + 1):
+                started = False
+                try:
+                    async with client.stream('GET', download.segment.uri, headers=headers, follow_redirects=True,
+                                             timeout=self.timeout) as response:
+                        response.raise_for_status()
+                        buffer = await pool.acquire()
+                        filled = 0
+                        async for data in response.aiter_bytes():
+                            view = memoryview(data)
+                            while view:
+                                n = min(len(view), pool.size - filled)
+                                buffer[filled:filled + n] = view[:n]
+                                filled += n
+                                view = view[n:]
+                                if filled == pool.size:
+                                    await download.chunks.put((buffer, filled))
+                                    started = True
+                                    buffer = None
+                                    buffer = await pool.acquire()
+                                    filled = 0
+                        if filled:
+                            await download.chunks.put((buffer, filled))
+                        else:
+                            pool.release(buffer)
+                        buffer = None
+                    await download.chunks.put(None)
+                    return
+                except Exception as e:
+                    # Anything but cancellation must reach the writer, which otherwise waits forever
+                    if buffer is not None:
+                        pool.release(buffer)
+                        buffer = None
+                    if started or attempt == self.retries:
+                        await download.chunks.put(e)
+                        return
+        finally:
+            # Cancelled while filling a buffer, e.g. when the init section failed
+            if buffer is not None:
+                pool.release(buffer)
+
+    def _open_file(self) -> None:
+        self._close_file()
+        index = len(self.stats.files)
+        path = self.output.format(index=index, time=time.strftime('%Y%m%d_%H%M%S'))
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        self._file_bytes = 0
+        self._file_duration = 0.0
+        self._init_section = None
+        self.stats.files.append(path)
+
+    def _close_file(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _should_rotate(self, segment: Segment) -> bool:
+        if self._fd is None:
+            return True
+        if self.max_size is not None and self._file_bytes >= self.max_size:
+            return True
+        if self.max_duration is not None and self._file_duration >= self.max_duration:
+            return True
+        return self.split_on_discontinuity and segment.discontinuity and self._file_bytes > 0
+
+    def _write_bytes(self, data: bytes | memoryview) -> None:
+        # Pooled buffers go straight to the file descriptor without another copy
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+        self._file_bytes += len(data)
+        self.stats.bytes += len(data)
+
+    async def _write(self, client: httpx.AsyncClient, download: _Download) -> None:
+        segment = download.segment
+        if self._after_failure:
+            segment.discontinuity = True
+            self._after_failure = False
+        if segment.discontinuity:
+            self.stats.discontinuities += 1
+        if self._should_rotate(segment):
+            self._open_file()
+        if segment.init_section and segment.init_section != self._init_section:
+            init = self._init_cache.get(segment.init_section)
+            if init is None:
+                try:
+                    response = await client.get(segment.init_section, headers=self.headers, follow_redirects=True,
+                                                timeout=self.timeout)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    download.task.cancel()
+                    await self._discard(download)
+                    return
+                init = self._init_cache[segment.init_section] = response.content
+            self._write_bytes(init)
+            self._init_section = segment.init_section
+
+        pool = self._pool
+        while True:
+            item = await download.chunks.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                self.stats.failed += 1
+                self._after_failure = True
+                return
+            buffer, length = item
+            try:
+                self._write_bytes(memoryview(buffer)[:length])
+            finally:
+                pool.release(buffer)
+        self.stats.segments += 1
+        self.stats.duration += segment.duration
+        self._file_duration += segment.duration
+
+    async def _discard(self, download: _Download) -> None:
+        with contextlib.suppress(asyncio.CancelledError):
+            await download.task
+        while not download.chunks.empty():
+            item = download.chunks.get_nowait()
+            if isinstance(item, tuple):
+                self._pool.release(item[0])
+        self.stats.failed += 1
+        self._after_failure = True
+
+
+class FlvRecorder:
+    """
+    Records an HTTP-FLV stream to disk, splitting files on key frames.
+
+    Tags are read with `FlvReader` and written straight from its buffer. The first file
+    opens at the first video key frame (the first audio frame for audio-only streams), and
+    files rotate at the first video key frame after `max_size` bytes or `max_duration`
+    seconds (at any tag for audio-only streams). Every file starts with the FLV header, the latest
+    `onMetaData` script tag and the audio/video sequence headers, and its timestamps are
+    rebased to start at zero, so each file plays on its own. Timestamp jumps of more than
+    `max_timestamp_jump` milliseconds are smoothed over and counted as discontinuities.
+
+    Given a `ResilientReader` instead of a URL, the recorder follows it across reconnections,
+    backup CDNs and refreshed URLs: each new connection continues the current file right
+    after the last written timestamp and counts as a discontinuity.
+
+    Args:
+        url (str | ResilientReader): The FLV stream URL, e.g. `StreamData.flv_url`, or a reader.
+        output (str | Path): Output path. `{index}` and `{time}` are replaced as for `HlsRecorder`.
+        proxy_addr (str | None): The proxy address to use. Defaults to None.
+        headers (dict | None): Custom headers for the request. Defaults to None.
+        max_size (int | None): Rotate after this many bytes. Defaults to None.
+        max_duration (float | None): Rotate after this many seconds. Defaults to None.
+        max_timestamp_jump (int): Largest timestamp step, in ms, treated as continuous. Defaults to 10000.
+        buffer_size (int): Initial size of the reader's buffer in bytes. Defaults to 1 MiB.
+        timeout (int): The request timeout in seconds. Defaults to 20.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
+
+    Attributes:
+        flv_stats (FlvStats): Byte counters of the stream for bitrate accounting, once recording started.
+
+    Example:
+        >>> async def main(stream_obj):
+        ...     recorder = FlvRecorder(stream_obj.flv_url, "room_{index:03d}.flv", max_duration=1800)
+        ...     stats = await recorder.run()
+        ...     print(stats.files, recorder.flv_stats.bitrate)
+        >>> asyncio.run(main(stream_obj))
+    """
+    def __init__(
+            self,
+            url: str | ResilientReader,
+            output: str | Path,
+            proxy_addr: str | None = None,
+            headers: dict | None = None,
+            max_size: int | None = None,
+            max_duration: float | None = None,
+            max_timestamp_jump: int = 10000,
+            buffer_size: int = 1024 * 1024,
+            timeout: int = 20,
+            session: Session | None = None
+    ):
+        self.url = url
+        self.output = str(output)
+        self.proxy_addr = proxy_addr
+        self.headers = headers or {}
+        self.max_size = max_size
+        self.max_duration = max_duration
+        self.max_timestamp_jump = max_timestamp_jump
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.session = session
+        self.stats = RecordStats()
+        self.flv_stats: FlvStats | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self._fd: int | None = None
+        self._file_bytes = 0
+        self._header = b''
+        self._metadata: bytearray | None = None
+        self._sequence_headers: dict[int, bytearray] = {}
+        self._offset = 0
+        self._last_input: int | None = None
+        self._last_output = 0
+        self._reconnected = False
+        self._file_start = 0
+        self._first_output = 0
+
+    def stop(self) -> None:
+        """
+        Stops recording. `run` closes the current file and returns.
+        """
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+
+    async def run(self) -> RecordStats:
+        """
+        Records until the stream ends or `stop` is called.
+
+        Returns:
+            RecordStats: What was written. `duration` is measured from tag timestamps.
+
+        Raises:
+            httpx.HTTPError: If the request fails. A `ResilientReader` fails over instead.
+            FlvError: If the response is not an FLV stream. A `ResilientReader` fails over instead.
+        """
+        self._task = asyncio.current_task()
+        owned = None
+        session = self.session or get_session()
+        if session is None:
+            session = owned = Session()
+        client = session.get_client(self.proxy_addr)
+        resilient = isinstance(self.url, ResilientReader)
+        try:
+            async with contextlib.aclosing(self._connections(client)) as connections:
+                async for source in connections:
+                    reader = FlvReader(source, self.buffer_size, self.flv_stats)
+                    self.flv_stats = reader.stats
+                    try:
+                        header = await reader.read_header()
+                        if self._header:
+                            self._reconnected = True
+                        else:
+                            self._header = header
+                        async for tag in reader:
+                            self._write_tag(tag, reader.has_video)
+                    except FlvError:
+                        # A dropped connection may end inside a tag; the reader moves on
+                        if not resilient:
+                            raise
+        except asyncio.CancelledError:
+            if not self._stopping:
+                raise
+        finally:
+            self._task = None
+            self._close_file()
+            if owned is not None:
+                await owned.aclose()
+        return self.stats
+
+    async def _connections(self, client: httpx.AsyncClient) -> AsyncIterator[AsyncIterator[bytes]]:
+        if isinstance(self.url, ResilientReader):
+            async with contextlib.aclosing(self.url.streams()) as streams:
+                async for stream in streams:
+                    yield stream
+            return
+        async with client.stream('GET', self.url, headers=self.headers, follow_redirects=True,
+                                 timeout=self.timeout) as response:
+            response.raise_for_status()
+            yield response.aiter_bytes()
+
+    def _output_timestamp(self, timestamp: int) -> int:
+        last = self._last_input
+        if last is not None and (self._reconnected or abs(timestamp - last) > self.max_timestamp_jump):
+            # Continue right after the previous output timestamp across a jump in the source
+            self._offset += timestamp - last - 1
+            self.stats.discontinuities += 1
+        self._reconnected = False
+        self._last_input = timestamp
+        return max(timestamp - self._offset, 0)
+
+    def _write_tag(self, tag: FlvTag, has_video: bool) -> None:
+        if tag.is_script:
+            self._metadata = bytearray(tag.raw)
+            if self._fd is not None and self._file_bytes > len(self._header):
+                self._rebase_and_write(tag, self._last_output - self._file_start)
+            return
+        if tag.is_sequence_header:
+            # Sequence headers carry no media time (streams usually send them at zero), so they
+            # neither open a file nor move the timeline; files start with the cached ones
+            changed = self._sequence_headers.get(tag.type) != tag.raw
+            self._sequence_headers[tag.type] = bytearray(tag.raw)
+            if self._fd is not None and changed:
+                self._rebase_and_write(tag, max(self._last_output - self._file_start, 0))
+            return
+
+        split_point = tag.is_keyframe if has_video else True
+        if self._fd is None and not split_point:
+            # Frames before the first key frame cannot be decoded
+            return
+        timestamp = self._output_timestamp(tag.timestamp)
+        if self._fd is None or (split_point and self._should_rotate(timestamp)):
+            self._open_file(timestamp)
+        self._last_output = timestamp
+        # Audio may trail the key frame a file starts with by a few milliseconds
+        self._rebase_and_write(tag, max(timestamp - self._file_start, 0))
+        self.stats.duration = max(self.stats.duration, (timestamp - self._first_output) / 1000)
+
+    def _should_rotate(self, timestamp: int) -> bool:
+        if self.max_size is not None and self._file_bytes >= self.max_size:
+            return True
+        return self.max_duration is not None and (timestamp - self._file_start) / 1000 >= self.max_duration
+
+    def _rebase_and_write(self, tag: FlvTag, timestamp: int) -> None:
+        tag.set_timestamp(timestamp)
+        self._write_bytes(tag.raw)
+
+    def _open_file(self, timestamp: int) -> None:
+        self._close_file()
+        index = len(self.stats.files)
+        path = self.output.format(index=index, time=time.strftime('%Y%m%d_%H%M%S'))
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        self._file_bytes = 0
+        self._file_start = timestamp
+        if not self.stats.files:
+            self._first_output = timestamp
+        self.stats.files.append(path)
+        self._write_bytes(self._header)
+        for raw in (self._metadata, *self._sequence_headers.values()):
+            if raw is not None:
+                set_tag_timestamp(raw, 0)
+                self._write_bytes(raw)
+
+    def _close_file(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _write_bytes(self, data: bytes | memoryview) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+        self._file_bytes += len(data)
+        self.stats.bytes += len(data)
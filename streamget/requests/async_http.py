@@ -1,8 +1,9 @@
+import asyncio
+import time
 from typing import Any
 
-import httpx
-
-from .. import utils
+from ..extractor import PageScanner
+from .session import Session, open_client
 
 OptionalStr = str | None
 OptionalDict = dict[str, Any] | None
@@ -19,7 +20,8 @@ async def async_req(
         return_cookies: bool = False,
         include_cookies: bool = False,
         verify: bool = False,
-        http2: bool = True
+        http2: bool = True,
+        session: Session | None = None
 ) -> OptionalDict | OptionalStr | tuple:
     """
     Sends an asynchronous HTTP request to the specified URL.
@@ -40,6 +42,7 @@ async def async_req(
         include_cookies (bool): If True, includes cookies in the response tuple. Defaults to False.
         verify (bool): If, True verifies the SSL certificate. Defaults to False.
         http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
 
     Returns:
         OptionalDict | OptionalStr | tuple: The response text, JSON data,
@@ -60,17 +63,16 @@ async def async_req(
         - If `data` or `json_data` is provided, a POST request is sent; otherwise, a GET request is sent.
         - The `redirect_url` parameter only returns the final URL after following redirects.
         - If `return_cookies` is True, the function returns a tuple containing the response text and cookies.
+        - Inside `async with streamget.Session()`, requests reuse pooled keep-alive connections.
     """
     if headers is None:
         headers = {}
     try:
-        proxy_addr = utils.handle_proxy_addr(proxy_addr)
-        if data or json_data:
-            async with httpx.AsyncClient(proxy=proxy_addr, timeout=timeout, verify=verify, http2=http2) as client:
-                response = await client.post(url, data=data, json=json_data, headers=headers)
-        else:
-            async with httpx.AsyncClient(proxy=proxy_addr, timeout=timeout, verify=verify, http2=http2) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
+        async with open_client(proxy_addr, timeout=timeout, verify=verify, http2=http2, session=session) as client:
+            if data or json_data:
+                response = await client.post(url, data=data, json=json_data, headers=headers, timeout=timeout)
+            else:
+                response = await client.get(url, headers=headers, follow_redirects=True, timeout=timeout)
 
         if redirect_url:
             return str(response.url)
@@ -85,13 +87,63 @@ async def async_req(
     return resp_str
 
 
+async def async_req_until(
+        url: str,
+        until: PageScanner,
+        proxy_addr: OptionalStr = None,
+        headers: OptionalDict = None,
+        timeout: int = 20,
+        verify: bool = False,
+        http2: bool = True,
+        session: Session | None = None
+) -> str:
+    """
+    Streams a page and stops reading as soon as `until` has seen the part the caller needs.
+
+    The body is decoded chunk by chunk and fed to the scanner, which searches only the
+    newly arrived text. Once it completes, the response is closed without reading the
+    rest, so marker-based parsers download and hold only the head of large pages.
+
+    Args:
+        url (str): The URL to send the GET request to.
+        until (PageScanner): A fresh scanner, e.g. `JsonScanner('var ytInitialPlayerResponse = ')`.
+        proxy_addr (OptionalStr): The proxy address to use. Defaults to None.
+        headers (OptionalDict): Custom headers to include in the request. Defaults to None.
+        timeout (int): The request timeout in seconds. Defaults to 20.
+        verify (bool): If True, verifies the SSL certificate. Defaults to False.
+        http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
+
+    Returns:
+        str: The text received up to the point the scanner completed, or the whole page if
+        it never did. Like `async_req`, the error message is returned if the request fails.
+
+    Example:
+        >>> scanner = JsonScanner('<script id="__NEXT_DATA__"')
+        >>> html_str = await async_req_until("https://example.com", scanner)
+        >>> json_data = load_json(html_str, '<script id="__NEXT_DATA__"')
+    """
+    if headers is None:
+        headers = {}
+    try:
+        async with open_client(proxy_addr, timeout=timeout, verify=verify, http2=http2, session=session) as client:
+            async with client.stream('GET', url, headers=headers, follow_redirects=True, timeout=timeout) as response:
+                async for chunk in response.aiter_text():
+                    if until.feed(chunk):
+                        break
+    except Exception as e:
+        return str(e)
+    return until.text
+
+
 async def get_response_status(
         url: str,
         proxy_addr: OptionalStr = None,
         headers: OptionalDict = None,
         timeout: int = 10,
         verify: bool = False,
-        http2: bool = True
+        http2: bool = True,
+        session: Session | None = None
 ) -> int:
     """
     Checks if a URL returns a successful HTTP status code (200 OK).
@@ -106,6 +158,7 @@ async def get_response_status(
         timeout (int): The request timeout in seconds. Defaults to 10.
         verify (bool): If True, verifies the SSL certificate. Defaults to False.
         http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
 
     Returns:
         int: such as 200, 304, 403.
@@ -126,10 +179,78 @@ async def get_response_status(
         - returns a status code other than 200 OK.
     """
     try:
-        proxy_addr = utils.handle_proxy_addr(proxy_addr)
-        async with httpx.AsyncClient(proxy=proxy_addr, timeout=timeout, verify=verify, http2=http2) as client:
-            response = await client.head(url, headers=headers, follow_redirects=True)
+        async with open_client(proxy_addr, timeout=timeout, verify=verify, http2=http2, session=session) as client:
+            response = await client.head(url, headers=headers, follow_redirects=True, timeout=timeout)
             return response.status_code
     except Exception as e:
         print(e)
     return False
+
+
+async def race_urls(
+        urls: list[str],
+        proxy_addr: OptionalStr = None,
+        headers: OptionalDict = None,
+        timeout: float = 3,
+        verify: bool = False,
+        http2: bool = True,
+        session: Session | None = None
+) -> tuple[int | None, list[float | None]]:
+    """
+    Probes candidate URLs concurrently and picks the first one, in list order, that answers.
+
+    Every distinct URL gets a HEAD request (a GET closed right after the response headers when
+    HEAD is not allowed). A URL answers when its status is below 400. The call returns as soon
+    as the first URL in list order has answered and all URLs before it have failed, or when
+    `timeout` seconds have passed; requests still running are then cancelled.
+
+    Args:
+        urls (list[str]): The candidate URLs, best first. Duplicates are probed once.
+        proxy_addr (OptionalStr): The proxy address to use. Defaults to None.
+        headers (OptionalDict): Custom headers to include in the requests. Defaults to None.
+        timeout (float): Overall deadline in seconds. Defaults to 3.
+        verify (bool): If True, verifies the SSL certificate. Defaults to False.
+        http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+        session (Session | None): The session whose pooled client is used. Defaults to the active session.
+
+    Returns:
+        tuple[int | None, list[float | None]]: The index of the chosen URL, or None if none
+        answered in time, and the latency in seconds of every URL (None if it failed or was cancelled).
+
+    Example:
+        >>> index, latencies = await race_urls([origin_url, hd_url, sd_url], timeout=2)
+    """
+    async def probe(client, url: str) -> float | None:
+        start = time.monotonic()
+        try:
+            response = await client.head(url, headers=headers, follow_redirects=True, timeout=timeout)
+            if response.status_code in (405, 501):
+                async with client.stream('GET', url, headers=headers, follow_redirects=True,
+                                         timeout=timeout) as response:
+                    pass
+        except Exception:
+            return None
+        return time.monotonic() - start if response.status_code < 400 else None
+
+    def answered(url: str) -> bool:
+        task = tasks[url]
+        return task.done() and not task.cancelled() and task.result() is not None
+
+    async with open_client(proxy_addr, timeout=timeout, verify=verify, http2=http2, session=session) as client:
+        tasks = {url: asyncio.create_task(probe(client, url)) for url in dict.fromkeys(urls)}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                # Stop once every URL ranked above the first answer has failed
+                undecided = next((url for url in urls if not (tasks[url].done() and not answered(url))), None)
+                if undecided is None or tasks[undecided].done() or loop.time() >= deadline:
+                    break
+                pending = [task for task in tasks.values() if not task.done()]
+                await asyncio.wait(pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+    chosen = next((i for i, url in enumerate(urls) if answered(url)), None)
+    return chosen, [tasks[url].result() if answered(url) else None for url in urls]
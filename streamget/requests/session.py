@@ -0,0 +1,165 @@
+import contextlib
+import contextvars
+from collections.abc import AsyncIterator, Iterator
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+from .. import utils
+
+OptionalStr = str | None
+
+_current_session: contextvars.ContextVar['Session | None'] = contextvars.ContextVar('streamget_session', default=None)
+
+
+class _RejectCookiePolicy(DefaultCookiePolicy):
+    """
+    Cookie policy that never stores cookies in the shared client jar.
+
+    Pooled clients are shared between platforms and rooms, so cookies set by one
+    response must not leak into unrelated requests. `response.cookies` is unaffected.
+    """
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+class Session:
+    """
+    A registry of pooled HTTP clients shared by all requests made inside it.
+
+    Clients are created lazily and keyed by `(proxy, verify, http2)`, so every platform
+    that talks through the same proxy reuses warm keep-alive connections instead of
+    paying a TCP/TLS handshake on every request.
+
+    Entering the session with `async with` makes it the active session for the current
+    task and every task spawned from it: `async_req` and `get_response_status` pick it up
+    automatically, so the platform classes need no changes to benefit from pooling.
+
+    Args:
+        max_connections (int): Maximum number of concurrent connections per client. Defaults to 100.
+        max_keepalive_connections (int): Maximum number of idle keep-alive connections per client.
+            Defaults to 20.
+        keepalive_expiry (float): Seconds an idle connection is kept open. Defaults to 30.0.
+        timeout (int): Default request timeout in seconds. Defaults to 20.
+
+    Example:
+        >>> import asyncio
+        >>> import streamget
+        >>> async def main():
+        ...     async with streamget.Session(max_connections=200) as session:
+        ...         live = streamget.DouyinLiveStream()
+        ...         data = await live.fetch_web_stream_data("https://live.douyin.com/xxxxxx")
+        ...         return await live.fetch_stream_url(data)
+        >>> asyncio.run(main())
+        StreamData(platform='xxxx', anchor_name='xxxx', is_live=True, m3u8_url="xxx"...)
+
+    Note:
+        Clients are bound to the event loop they were created in, so a session must
+        be entered and closed within a single `asyncio.run()` call.
+    """
+    def __init__(
+            self,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: float = 30.0,
+            timeout: int = 20
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self._clients: dict[tuple, httpx.AsyncClient] = {}
+        self._tokens: list[contextvars.Token] = []
+
+    def get_client(self, proxy_addr: OptionalStr = None, verify: bool = False, http2: bool = True) -> httpx.AsyncClient:
+        """
+        Returns the pooled client for the given connection options, creating it on first use.
+
+        Args:
+            proxy_addr (OptionalStr): The proxy address to use. Defaults to None.
+            verify (bool): If True, verifies the SSL certificate. Defaults to False.
+            http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+
+        Returns:
+            httpx.AsyncClient: A client shared by every request with the same options.
+        """
+        proxy_addr = utils.handle_proxy_addr(proxy_addr)
+        key = (proxy_addr, verify, http2)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                proxy=proxy_addr,
+                verify=verify,
+                http2=http2,
+                timeout=self.timeout,
+                limits=self.limits,
+                cookies=CookieJar(policy=_RejectCookiePolicy())
+            )
+            self._clients[key] = client
+        return client
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator['Session']:
+        """
+        Makes this the active session for the enclosed block without closing it on exit.
+
+        Useful inside worker tasks that share a session owned by someone else.
+        """
+        token = _current_session.set(self)
+        try:
+            yield self
+        finally:
+            _current_session.reset(token)
+
+    async def aclose(self) -> None:
+        """
+        Closes every pooled client. The session may be reused afterwards.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> 'Session':
+        self._tokens.append(_current_session.set(self))
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        _current_session.reset(self._tokens.pop())
+        await self.aclose()
+
+
+def get_session() -> Session | None:
+    """
+    Returns the session entered by the current task, or None when requests are not pooled.
+    """
+    return _current_session.get()
+
+
+@contextlib.asynccontextmanager
+async def open_client(
+        proxy_addr: OptionalStr = None,
+        timeout: int = 20,
+        verify: bool = False,
+        http2: bool = True,
+        session: Session | None = None
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yields a pooled client from the active session, or a one-shot client closed on exit.
+
+    Args:
+        proxy_addr (OptionalStr): The proxy address to use. Defaults to None.
+        timeout (int): The client timeout in seconds for one-shot clients. Defaults to 20.
+        verify (bool): If True, verifies the SSL certificate. Defaults to False.
+        http2 (bool): If True, enables HTTP/2 support. Defaults to True.
+        session (Session | None): The session to draw the client from. Defaults to the active session.
+    """
+    session = session or get_session()
+    if session is not None:
+        yield session.get_client(proxy_addr, verify=verify, http2=http2)
+        return
+    proxy_addr = utils.handle_proxy_addr(proxy_addr)
+    async with httpx.AsyncClient(proxy=proxy_addr, timeout=timeout, verify=verify, http2=http2) as client:
+        yield client
@@ -0,0 +1,229 @@
+import streamget
+
+from .platforms.base import BaseLiveStream
+
+WEB_METHOD = 'fetch_web_stream_data'
+APP_METHOD = 'fetch_app_stream_data'
+
+# Key under which a trie node stores the (class name, method) registered for the suffix ending there.
+_END = ''
+
+# The HOSTS and APP_HOSTS of every platform class, keyed by class name, so routing a URL
+# imports only the matching platform module. `python -m streamget.router` checks it against
+# the classes and prints the table to paste here when they differ.
+HOST_TABLE = {
+    'AcfunLiveStream': (('acfun.cn',), ()),
+    'BaiduLiveStream': (('live.baidu.com',), ()),
+    'BigoLiveStream': (('bigo.tv', 'bigovideo.tv'), ()),
+    'BilibiliLiveStream': (('live.bilibili.com',), ()),
+    'BluedLiveStream': (('blued.cn',), ()),
+    'ChangliaoLiveStream': (('tlclw.com',), ()),
+    'ChzzkLiveStream': (('chzzk.naver.com',), ()),
+    'DouyinLiveStream': (('live.douyin.com',), ('v.douyin.com', 'www.douyin.com')),
+    'DouyuLiveStream': (('douyu.com',), ()),
+    'FaceitLiveStream': (('faceit.com',), ()),
+    'FlexTVLiveStream': (('flextv.co.kr', 'ttinglive.com'), ()),
+    'HaixiuLiveStream': (('haixiutv.com',), ()),
+    'HuajiaoLiveStream': (('huajiao.com',), ()),
+    'HuamaoLiveStream': (('catshow168.com',), ()),
+    'HuyaLiveStream': (('huya.com',), ()),
+    'InkeLiveStream': (('inke.cn',), ()),
+    'JDLiveStream': (('jd.com', '3.cn'), ()),
+    'KugouLiveStream': (('kugou.com',), ()),
+    'KwaiLiveStream': (('live.kuaishou.com',), ()),
+    'LaixiuLiveStream': (('imkktv.com',), ()),
+    'LangLiveStream': (('lang.live',), ()),
+    'LehaiLiveStream': (('lehaitv.com',), ()),
+    'LianJieLiveStream': (('lailianjie.com',), ()),
+    'LiveMeLiveStream': (('liveme.com',), ()),
+    'LookLiveStream': (('look.163.com',), ()),
+    'MaoerLiveStream': (('missevan.com',), ()),
+    'MiguLiveStream': (('miguvideo.com',), ()),
+    'NeteaseLiveStream': (('cc.163.com',), ()),
+    'PandaLiveStream': (('pandalive.co.kr',), ()),
+    'PiaopaioLiveStream': (('weimipopo.com',), ()),
+    'PicartoLiveStream': (('picarto.tv',), ()),
+    'PopkonTVLiveStream': (('popkontv.com',), ()),
+    'QiandureboLiveStream': (('qiandurebo.com',), ()),
+    'RedNoteLiveStream': ((), ('xiaohongshu.com', 'xhslink.com')),
+    'ShopeeLiveStream': (('shopee.sg', 'shopee.co.id', 'shopee.com.my', 'shopee.co.th', 'shopee.ph', 'shopee.vn',
+                          'shopee.tw', 'shopee.com.br'), ()),
+    'ShowRoomLiveStream': (('showroom-live.com',), ()),
+    'SixRoomLiveStream': (('6.cn',), ()),
+    'SoopLiveStream': (('sooplive.co.kr', 'sooplive.com'), ()),
+    'TaobaoLiveStream': (('taobao.com', 'tb.cn'), ()),
+    'TikTokLiveStream': (('tiktok.com',), ()),
+    'TwitCastingLiveStream': (('twitcasting.tv',), ()),
+    'TwitchLiveStream': (('twitch.tv',), ()),
+    'VVXQLiveStream': (('vvxqiu.com',), ()),
+    'WeiboLiveStream': (('weibo.com',), ()),
+    'WinkTVLiveStream': (('winktv.co.kr',), ()),
+    'YYLiveStream': (('yy.com',), ()),
+    'YinboLiveStream': (('ybw1666.com',), ()),
+    'YiqiLiveStream': (('17.live',), ()),
+    'YoutubeLiveStream': (('youtube.com', 'youtu.be'), ()),
+    'ZhihuLiveStream': (('zhihu.com',), ()),
+}
+
+_index: dict | None = None
+
+
+def url_host(url: str) -> str:
+    """
+    Extracts the lower-cased host from a URL without a full parse.
+
+    Args:
+        url (str): The URL, with or without a scheme.
+
+    Returns:
+        str: The host name, or an empty string if the URL has none.
+    """
+    url = url.strip()
+    start = url.find('//')
+    start = 0 if start < 0 else start + 2
+    end = len(url)
+    for sep in '/?#':
+        pos = url.find(sep, start, end)
+        if pos >= 0:
+            end = pos
+    host = url[start:end]
+    host = host[host.rfind('@') + 1:]
+    if host.startswith('['):
+        return host[:host.find(']') + 1].lower()
+    colon = host.find(':')
+    if colon >= 0:
+        host = host[:colon]
+    return host.rstrip('.').lower()
+
+
+def host_table(classes: list[type[BaseLiveStream]]) -> dict[str, tuple[tuple[str, ...], tuple[str, ...]]]:
+    """
+    Reads the host declarations of platform classes into the form of `HOST_TABLE`.
+
+    Args:
+        classes (list[type[BaseLiveStream]]): The platform classes.
+
+    Returns:
+        dict: `(HOSTS, APP_HOSTS)` keyed by class name.
+    """
+    return {live_class.__name__: (tuple(live_class.HOSTS), tuple(live_class.APP_HOSTS)) for live_class in classes}
+
+
+def build_index(table: dict[str, tuple[tuple[str, ...], tuple[str, ...]]]) -> dict:
+    """
+    Compiles host suffixes into a trie of reversed host labels.
+
+    Args:
+        table (dict): `(HOSTS, APP_HOSTS)` keyed by class name, like `HOST_TABLE`.
+
+    Returns:
+        dict: The root node of the trie.
+
+    Raises:
+        ValueError: If two classes declare the same host suffix.
+    """
+    root: dict = {}
+    for name, (hosts, app_hosts) in table.items():
+        entries = [(host, WEB_METHOD) for host in hosts]
+        entries += [(host, APP_METHOD) for host in app_hosts]
+        for host, method in entries:
+            node = root
+            for label in reversed(host.lower().split('.')):
+                node = node.setdefault(label, {})
+            if _END in node:
+                raise ValueError(f"Host {host} is declared by both {node[_END][0]} and {name}")
+            node[_END] = (name, method)
+    return root
+
+
+def _get_index() -> dict:
+    global _index
+    if _index is None:
+        _index = build_index(HOST_TABLE)
+    return _index
+
+
+def check_host_table() -> dict[str, tuple[tuple[str, ...], tuple[str, ...]]]:
+    """
+    Imports every platform class and compares its host declarations with `HOST_TABLE`.
+
+    Returns:
+        dict: The table read from the classes.
+
+    Raises:
+        ValueError: If `HOST_TABLE` differs from the classes.
+    """
+    classes = [getattr(streamget, name) for name in streamget.__all__ if name.endswith('LiveStream')]
+    table = host_table(classes)
+    if table != HOST_TABLE:
+        differing = sorted(name for name in table.keys() | HOST_TABLE.keys() if table.get(name) != HOST_TABLE.get(name))
+        raise ValueError(f"HOST_TABLE is out of date for: {', '.join(differing)}")
+    return table
+
+
+def match(url: str) -> tuple[type[BaseLiveStream], str]:
+    """
+    Finds the platform class and data method that handle a room URL.
+
+    The lookup walks the host labels from right to left and keeps the longest declared
+    suffix, so `v.douyin.com` wins over a shorter `douyin.com` entry and any subdomain of
+    a declared host (e.g. `m.douyu.com`) is matched too. Hosts come from `HOST_TABLE`, so
+    only the module of the matched platform is imported.
+
+    Args:
+        url (str): The room URL.
+
+    Returns:
+        tuple: The platform class and the name of the method that fetches its room data.
+
+    Raises:
+        ValueError: If no supported platform matches the URL host.
+    """
+    node = _get_index()
+    found = None
+    for label in reversed(url_host(url).split('.')):
+        node = node.get(label)
+        if node is None:
+            break
+        found = node.get(_END, found)
+    if found is None:
+        raise ValueError(f"Unsupported live room URL: {url}")
+    name, method = found
+    return getattr(streamget, name), method
+
+
+def resolve(url: str, **kwargs) -> BaseLiveStream:
+    """
+    Returns an instance of the platform class that handles a room URL.
+
+    Args:
+        url (str): The room URL.
+        **kwargs: Arguments passed to the platform class, e.g. `proxy_addr` or `cookies`.
+
+    Returns:
+        BaseLiveStream: The platform instance. Use `streamget.router.match` to also get the
+        name of the method that fetches the room data.
+
+    Raises:
+        ValueError: If no supported platform matches the URL host.
+
+    Example:
+        >>> import streamget
+        >>> live = streamget.resolve("https://www.huya.com/xxxxxx")
+        >>> type(live).__name__
+        'HuyaLiveStream'
+    """
+    live_class, _ = match(url)
+    return live_class(**kwargs)
+
+
+if __name__ == '__main__':
+    try:
+        check_host_table()
+        print('HOST_TABLE is up to date')
+    except ValueError as e:
+        print(e)
+        for name, hosts in host_table([getattr(streamget, name) for name in streamget.__all__
+                                       if name.endswith('LiveStream')]).items():
+            print(f"    {name!r}: {hosts!r},")
+        raise SystemExit(1)
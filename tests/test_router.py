@@ -0,0 +1,27 @@
+import unittest
+
+import streamget
+from streamget import router
+
+
+class HostTableTest(unittest.TestCase):
+    def test_host_table_matches_platform_classes(self):
+        classes = [getattr(streamget, name) for name in streamget.__all__ if name.endswith('LiveStream')]
+        assert router.host_table(classes) == router.HOST_TABLE, \
+            "HOST_TABLE is out of date; run `python -m streamget.router` and paste its output"
+
+    def test_match_uses_longest_suffix(self):
+        assert router.match('https://v.douyin.com/abc/') == (streamget.DouyinLiveStream, router.APP_METHOD)
+        assert router.match('https://live.douyin.com/123') == (streamget.DouyinLiveStream, router.WEB_METHOD)
+        assert router.match('https://m.douyu.com/123')[0] is streamget.DouyuLiveStream
+
+    def test_unknown_host(self):
+        try:
+            router.match('https://example.com/live/1')
+        except ValueError:
+            return
+        self.fail('example.com must not match any platform')
+
+
+if __name__ == '__main__':
+    unittest.main()